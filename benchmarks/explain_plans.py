@@ -0,0 +1,155 @@
+"""Query plans for the hot repository lookups, to compare before and after an index change.
+
+Usage (from the repository root, DATABASE_URL pointing at a seeded database):
+
+    python -m benchmarks.explain_plans --output before.json
+    alembic upgrade head
+    python -m benchmarks.explain_plans --output after.json --compare before.json
+
+Every query mirrors the statement its repository method issues and runs under
+EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) with sample parameters taken from the
+database, so reruns against the same data are comparable.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import uuid
+from typing import Dict, List
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+QUERIES = {
+    "ProjectRepository.count_project_for_member": (
+        "SELECT id, projects_count FROM users WHERE id = ANY(:user_ids) ORDER BY id FOR UPDATE"
+    ),
+    "TeamRepository.is_user_owner_any_team": (
+        "SELECT EXISTS (SELECT 1 FROM team_members WHERE user_id = :user_id AND role_id = :role_id)"
+    ),
+    "TeamRepository.count_teams_for_members": (
+        "SELECT id, teams_count FROM users WHERE id = ANY(:user_ids) ORDER BY id FOR UPDATE"
+    ),
+    "DesiredProjectRepository.get_by_user": (
+        "SELECT * FROM desired_projects WHERE user_id = :user_id"
+    ),
+    "ProjectQueries.get_page": (
+        "SELECT id, name, description, logo, status_id, team_id, created_at FROM projects "
+        "ORDER BY created_at, id LIMIT 21"
+    ),
+    "ProjectQueries.get_page(team_id)": (
+        "SELECT id, name, description, logo, status_id, team_id, created_at FROM projects "
+        "WHERE team_id = :team_id ORDER BY created_at, id LIMIT 21"
+    ),
+    "ProjectQueries.get_page(status)": (
+        "SELECT id, name, description, logo, status_id, team_id, created_at FROM projects "
+        "WHERE status_id = :status_id ORDER BY created_at, id LIMIT 21"
+    ),
+    "ProjectQueries.get_page(technology)": (
+        "SELECT id, name, description, logo, status_id, team_id, created_at FROM projects "
+        "WHERE tech_mask & :technology_mask = :technology_mask ORDER BY created_at, id LIMIT 21"
+    ),
+}
+
+SAMPLE_SQL = {
+    "user_id": "SELECT user_id FROM team_members WHERE user_id IS NOT NULL LIMIT 1",
+    "role_id": "SELECT role_id FROM team_members WHERE role_id IS NOT NULL LIMIT 1",
+    "team_id": "SELECT team_id FROM projects WHERE team_id IS NOT NULL LIMIT 1",
+    "status_id": "SELECT status_id FROM projects WHERE status_id IS NOT NULL LIMIT 1",
+    "technology_mask": "SELECT tech_mask FROM projects WHERE tech_mask <> 0 LIMIT 1",
+}
+
+
+async def sample_params(connection: AsyncConnection) -> Dict:
+    params = {}
+    for name, sql in SAMPLE_SQL.items():
+        params[name] = (await connection.execute(text(sql))).scalar()
+
+    params["user_id"] = params["user_id"] or uuid.uuid4()
+    params["user_ids"] = [params["user_id"]]
+    params["technology_mask"] = params["technology_mask"] or 1
+    return params
+
+
+def plan_nodes(plan: Dict) -> List[str]:
+    label = plan["Node Type"]
+    if "Index Name" in plan:
+        label += f" using {plan['Index Name']}"
+    elif "Relation Name" in plan:
+        label += f" on {plan['Relation Name']}"
+
+    nodes = [label]
+    for child in plan.get("Plans", []):
+        nodes.extend(plan_nodes(child))
+    return nodes
+
+
+async def explain_all() -> Dict[str, Dict]:
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+    results = {}
+
+    async with engine.connect() as connection:
+        params = await sample_params(connection)
+
+        for name, sql in QUERIES.items():
+            statement = text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+            explained = (await connection.execute(statement, params)).scalar()
+            root = explained[0]
+
+            results[name] = {
+                "nodes": plan_nodes(root["Plan"]),
+                "total_cost": root["Plan"]["Total Cost"],
+                "execution_ms": root["Execution Time"],
+                "shared_hit_blocks": root["Plan"].get("Shared Hit Blocks", 0),
+                "shared_read_blocks": root["Plan"].get("Shared Read Blocks", 0),
+            }
+
+        await connection.rollback()
+
+    await engine.dispose()
+    return results
+
+
+def print_report(results: Dict[str, Dict], baseline: Dict[str, Dict] | None) -> None:
+    for name, result in results.items():
+        print(name)
+        before = baseline.get(name) if baseline else None
+
+        if before:
+            print(f"  before: {' -> '.join(before['nodes'])}")
+            print(f"          cost {before['total_cost']:.2f}, {before['execution_ms']:.3f} ms, "
+                  f"{before['shared_hit_blocks'] + before['shared_read_blocks']} blocks")
+
+        prefix = "  after: " if before else "  plan:  "
+        print(f"{prefix} {' -> '.join(result['nodes'])}")
+        print(f"          cost {result['total_cost']:.2f}, {result['execution_ms']:.3f} ms, "
+              f"{result['shared_hit_blocks'] + result['shared_read_blocks']} blocks")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", help="write the plans as JSON, to be used as a later --compare baseline")
+    parser.add_argument("--compare", help="JSON written by an earlier --output run")
+    args = parser.parse_args()
+
+    results = asyncio.run(explain_all())
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    print_report(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Peak RSS of the NDJSON export endpoints at growing table sizes.
+
+Usage (from the repository root, DATABASE_URL pointing at a scratch database):
+
+    python -m benchmarks.export_memory --resource projects --rows 10000 100000 1000000
+
+Every size is exported from a fresh child process, so ru_maxrss reflects
+only that run.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+SEED_SQL = {
+    "users": (
+        "INSERT INTO users (id, username, hashed_password, email, created_at) "
+        "SELECT gen_random_uuid(), 'bench_user_' || g, 'bench', 'bench_user_' || g || '@example.com', now() "
+        "FROM generate_series(:start, :stop) g"
+    ),
+    "teams": (
+        "INSERT INTO teams (id, name, description, created_at) "
+        "SELECT gen_random_uuid(), 'bench_team_' || g, 'Benchmark team', now() "
+        "FROM generate_series(:start, :stop) g"
+    ),
+    "projects": (
+        "INSERT INTO projects (id, name, description, team_id, created_at) "
+        "SELECT gen_random_uuid(), 'bench_project_' || g, 'Benchmark project', "
+        "(SELECT id FROM teams ORDER BY created_at LIMIT 1), now() "
+        "FROM generate_series(:start, :stop) g"
+    ),
+}
+
+COUNT_SQL = {
+    "users": "SELECT count(*) FROM users WHERE username LIKE 'bench_user_%'",
+    "teams": "SELECT count(*) FROM teams WHERE name LIKE 'bench_team_%'",
+    "projects": "SELECT count(*) FROM projects WHERE name LIKE 'bench_project_%'",
+}
+
+
+async def seed(resource_name: str, rows: int) -> None:
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+
+    async with engine.begin() as connection:
+        existing = (await connection.execute(text(COUNT_SQL[resource_name]))).scalar_one()
+        if existing < rows:
+            await connection.execute(text(SEED_SQL[resource_name]), {"start": existing + 1, "stop": rows})
+
+    await engine.dispose()
+
+
+async def export(resource_name: str) -> tuple[int, float]:
+    import httpx
+    from presentation.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    exported = 0
+    started = time.perf_counter()
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        async with client.stream("GET", f"/{resource_name}/export") as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line:
+                    exported += 1
+
+    return exported, time.perf_counter() - started
+
+
+def run_child(resource_name: str) -> None:
+    exported, elapsed = asyncio.run(export(resource_name))
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{exported} {elapsed:.3f} {peak_rss_mb:.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resource", choices=sorted(SEED_SQL), default="projects")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.resource)
+        return
+
+    print(f"{'rows':>10} {'exported':>10} {'seconds':>9} {'peak RSS, MB':>13}")
+    for rows in sorted(args.rows):
+        asyncio.run(seed(args.resource, rows))
+
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.export_memory", "--child", "--resource", args.resource],
+            cwd=ROOT_DIR, check=True, capture_output=True, text=True
+        ).stdout.split()
+
+        exported, elapsed, peak_rss_mb = output[-3:]
+        print(f"{rows:>10} {exported:>10} {elapsed:>9} {peak_rss_mb:>13}")
+
+
+if __name__ == "__main__":
+    main()
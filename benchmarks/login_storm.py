@@ -0,0 +1,103 @@
+"""p99 latency of an unrelated endpoint while a login storm is running.
+
+Usage (from the repository root, DATABASE_URL pointing at a migrated database):
+
+    python -m benchmarks.login_storm --logins 200 --concurrency 32
+
+The storm is replayed once per hasher executor: "inline" hashes on the event
+loop the way PasswordHasher used to, "thread" offloads bcrypt to the pool.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+PASSWORD = "benchmark-password"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def storm(logins: int, concurrency: int, probe_interval: float) -> dict:
+    import httpx
+    from presentation.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        username = f"storm_{uuid.uuid4().hex[:12]}"
+        email = f"{username}@example.com"
+        await client.post("/auth/register", json={
+            "id": str(uuid.uuid4()), "username": username, "password": PASSWORD,
+            "email": email, "platform_role": ["User"]
+        })
+
+        semaphore = asyncio.Semaphore(concurrency)
+        statuses: dict[int, int] = {}
+        probe_latencies: list[float] = []
+        storm_done = asyncio.Event()
+
+        async def login() -> None:
+            async with semaphore:
+                response = await client.post("/auth/login", json={"email": email, "password": PASSWORD})
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def probe() -> None:
+            while not storm_done.is_set():
+                started = time.perf_counter()
+                await client.get("/")
+                probe_latencies.append((time.perf_counter() - started) * 1000)
+                await asyncio.sleep(probe_interval)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(logins)))
+        elapsed = time.perf_counter() - started
+        storm_done.set()
+        await probe_task
+
+    return {
+        "logins_per_second": logins / elapsed,
+        "probe_p50_ms": statistics.median(probe_latencies),
+        "probe_p99_ms": percentile(probe_latencies, 99),
+        "statuses": statuses,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--probe-interval", type=float, default=0.01)
+    parser.add_argument("--executors", nargs="+", default=["inline", "thread"])
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(asyncio.run(storm(args.logins, args.concurrency, args.probe_interval)))
+        return
+
+    for executor in args.executors:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.login_storm", "--child",
+             "--logins", str(args.logins), "--concurrency", str(args.concurrency),
+             "--probe-interval", str(args.probe_interval)],
+            cwd=ROOT_DIR, check=True, capture_output=True, text=True,
+            env={**os.environ, "PASSWORD_HASHER_EXECUTOR": executor}
+        ).stdout.strip().splitlines()[-1]
+
+        print(f"{executor:>8}: {output}")
+
+
+if __name__ == "__main__":
+    main()
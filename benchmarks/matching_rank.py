@@ -0,0 +1,97 @@
+"""Ranking latency of the in-memory matching index against a linear scan.
+
+Usage (from the repository root, no database needed):
+
+    python -m benchmarks.matching_rank --projects 100000 --queries 2000 --limit 20
+
+The index is filled with --projects synthetic open projects with random
+technology stacks and free seats. Each query ranks them for a random desired
+project, once through MatchingIndex.rank() and once by scoring every project
+in a list, the way a query-time scan would. Both must return the same scores;
+the script reports p50/p99 latency for each, plus the cost of an upsert.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from typing import List, Tuple
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from domain.project.model import Project
+from domain.shared.tech_mask import TECHNOLOGY_BITS
+from infrastructure.matching.index import MatchingIndex
+
+ALL_TECHNOLOGIES = (1 << len(TECHNOLOGY_BITS)) - 1
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def random_mask(rng: random.Random) -> int:
+    return rng.randint(1, ALL_TECHNOLOGIES)
+
+
+def linear_rank(index: MatchingIndex, projects: List[Tuple[uuid.UUID, int, int]],
+                mask: int, people: int, limit: int) -> List[float]:
+    scored = []
+    for project_id, project_mask, free_seats in projects:
+        result = index._score(mask, people, (project_mask, free_seats))
+        if result is not None:
+            scored.append(result)
+
+    scored.sort(reverse=True)
+    return [score for score, _ in scored[:limit]]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    index = MatchingIndex()
+    projects = []
+
+    upserts: List[float] = []
+    for _ in range(args.projects):
+        project = (uuid.uuid4(), random_mask(rng), rng.randint(1, Project.MAX_PARTICIPANTS - 1))
+        projects.append(project)
+
+        started = time.perf_counter()
+        index.upsert(project[0], project[1], project[2], True)
+        upserts.append((time.perf_counter() - started) * 1_000_000)
+
+    queries = [(random_mask(rng), rng.randint(1, 8)) for _ in range(args.queries)]
+
+    latencies = {"index": [], "linear": []}
+    for mask, people in queries:
+        started = time.perf_counter()
+        matches = index.rank(mask, people, args.limit)
+        latencies["index"].append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        expected = linear_rank(index, projects, mask, people, args.limit)
+        latencies["linear"].append((time.perf_counter() - started) * 1000)
+
+        assert [match.score for match in matches] == expected, "index and linear scan disagree"
+
+    print(f"{args.projects} projects in {len(index._buckets)} buckets, {args.queries} queries, limit {args.limit}")
+    print(f"upsert: p50 {percentile(upserts, 50):.2f} us, p99 {percentile(upserts, 99):.2f} us")
+    print(f"{'strategy':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, samples in latencies.items():
+        print(f"{name:>8} {percentile(samples, 50):>8.3f} {percentile(samples, 99):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Query throughput and pool wait time across connection pool sizes.
+
+Usage (from the repository root, DATABASE_URL pointing at any Postgres):
+
+    python -m benchmarks.pool_throughput --pool-sizes 5 10 20 40 --concurrency 100 --duration 10
+
+Every worker checks out a connection, runs one short query that holds it
+for --query-ms milliseconds and gives it back, as a request handler would.
+"""
+import argparse
+import asyncio
+import dataclasses
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from sqlalchemy import text
+
+from infrastructure.database.session import DATABASE_URL, EngineSettings, create_engine, pool_metrics
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def run(pool_size: int, max_overflow: int, concurrency: int, duration: float, query_ms: float) -> dict:
+    name = f"benchmark-{pool_size}"
+    settings = dataclasses.replace(EngineSettings.from_env(), pool_size=pool_size, max_overflow=max_overflow)
+    engine = create_engine(DATABASE_URL, settings, name=name)
+
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    query = text("SELECT pg_sleep(:seconds)")
+
+    async def worker() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                async with engine.connect() as connection:
+                    await connection.execute(query, {"seconds": query_ms / 1000})
+            except Exception:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    metrics = pool_metrics[name].snapshot()
+    await engine.dispose()
+
+    return {
+        "pool_size": pool_size,
+        "queries_per_second": len(latencies) / duration,
+        "p50_ms": percentile(latencies, 50) if latencies else None,
+        "p99_ms": percentile(latencies, 99) if latencies else None,
+        "pool_wait_avg_ms": metrics["wait_seconds_total"] / max(metrics["checkouts"], 1) * 1000,
+        "pool_wait_max_ms": metrics["wait_seconds_max"] * 1000,
+        "connect_avg_ms": metrics["connect_seconds_total"] / max(metrics["connects"], 1) * 1000,
+        "timeouts": metrics["timeouts"],
+        "errors": errors,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    header = f"{'pool':>5} {'q/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'wait avg':>9} {'wait max':>9} {'conn avg':>9} {'timeouts':>9}"
+    print(header)
+    for pool_size in args.pool_sizes:
+        result = await run(pool_size, args.max_overflow, args.concurrency, args.duration, args.query_ms)
+        print(f"{result['pool_size']:>5} {result['queries_per_second']:>9.1f} {result['p50_ms']:>8.2f} "
+              f"{result['p99_ms']:>8.2f} {result['pool_wait_avg_ms']:>9.2f} {result['pool_wait_max_ms']:>9.2f} "
+              f"{result['connect_avg_ms']:>9.2f} {result['timeouts']:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[5, 10, 20, 40])
+    parser.add_argument("--max-overflow", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--query-ms", type=float, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Full aggregate hydration versus column projections for the list endpoints.
+
+Usage (from the repository root, DATABASE_URL pointing at a seeded database):
+
+    python -m benchmarks.projection_queries --resource projects --limit 100 --repeat 200
+
+The "hydrated" strategy replays what ProjectRepository.get()/TeamRepository.get()
+used to do for listings: load ORM entities with their eager-loaded
+relationships and map them to DTOs. The "projection" strategy goes through
+the query services. For each strategy the script reports rows fetched (ORM
+instances loaded, or plain rows), allocated blocks and peak traced memory
+for one call, and latency over --repeat calls.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from typing import Awaitable, Callable, List
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from application.projects.dto import ProjectDTO
+from application.teams.dto import TeamDTO
+from domain.project.enum import StatusProjectEnum
+from infrastructure.database.models.projects import Project as DBProject, TechnologyToProject as DBTechnologyToProject
+from infrastructure.database.models.teams import Team as DBTeam
+from infrastructure.database.queries.project_queries import ProjectQueries
+from infrastructure.database.queries.team_queries import TeamQueries
+from infrastructure.database.session import async_session_maker, engine
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def hydrated_projects(session: AsyncSession, limit: int) -> int:
+    stmt = (
+        select(DBProject)
+        .options(
+            selectinload(DBProject.participants),
+            selectinload(DBProject.technologies).selectinload(DBTechnologyToProject.technology),
+            selectinload(DBProject.status)
+        )
+        .order_by(DBProject.created_at, DBProject.id)
+        .limit(limit)
+    )
+    db_projects = (await session.execute(stmt)).scalars().all()
+    [
+        ProjectDTO(id=p.id, name=p.name, description=p.description, logo=p.logo,
+                   status=StatusProjectEnum(p.status_id), team_id=p.team_id)
+        for p in db_projects
+    ]
+    return len(session.identity_map)
+
+
+async def projected_projects(session: AsyncSession, limit: int) -> int:
+    page = await ProjectQueries(session).get_page(limit=limit)
+    return len(page.items) + (1 if page.next_cursor else 0)
+
+
+async def hydrated_teams(session: AsyncSession, limit: int) -> int:
+    stmt = (
+        select(DBTeam)
+        .options(selectinload(DBTeam.members))
+        .order_by(DBTeam.created_at, DBTeam.id)
+        .limit(limit)
+    )
+    db_teams = (await session.execute(stmt)).scalars().all()
+    [TeamDTO(id=t.id, name=t.name, description=t.description, avatar_url=t.logo) for t in db_teams]
+    return len(session.identity_map)
+
+
+async def projected_teams(session: AsyncSession, limit: int) -> int:
+    # TeamQueries.get() is unbounded, so the benchmark applies the same limit through the statement
+    stmt = select(*TeamQueries._columns).order_by(DBTeam.created_at, DBTeam.id).limit(limit)
+    rows = (await session.execute(stmt)).all()
+    [TeamQueries._to_dto(row) for row in rows]
+    return len(rows)
+
+
+STRATEGIES = {
+    "projects": {"hydrated": hydrated_projects, "projection": projected_projects},
+    "teams": {"hydrated": hydrated_teams, "projection": projected_teams},
+}
+
+
+async def measure(strategy: Callable[[AsyncSession, int], Awaitable[int]], limit: int, repeat: int) -> dict:
+    # One traced call for rows and allocations, tracing would distort the latency runs
+    async with async_session_maker() as session:
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        rows = await strategy(session, limit)
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+
+    latencies: List[float] = []
+    for _ in range(repeat):
+        async with async_session_maker() as session:
+            started = time.perf_counter()
+            await strategy(session, limit)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    return {
+        "rows": rows,
+        "allocated_blocks": blocks,
+        "peak_kib": peak / 1024,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    print(f"{'strategy':>11} {'rows':>7} {'blocks':>9} {'peak KiB':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, strategy in STRATEGIES[args.resource].items():
+        result = await measure(strategy, args.limit, args.repeat)
+        print(f"{name:>11} {result['rows']:>7} {result['allocated_blocks']:>9} {result['peak_kib']:>9.1f} "
+              f"{result['p50_ms']:>8.2f} {result['p99_ms']:>8.2f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resource", choices=sorted(STRATEGIES), default="projects")
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
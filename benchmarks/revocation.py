@@ -0,0 +1,130 @@
+"""False positive rate and check latency of the token revocation list.
+
+Usage (from the repository root):
+
+    python -m benchmarks.revocation --revoked 100000 --probes 200000
+    python -m benchmarks.revocation --database --revoked 100000 --checks 2000    # DATABASE_URL required
+
+The in-memory part sizes a BloomFilter the way RevocationList does, fills it
+with revoked jtis and probes it with fresh ones. It reports the measured false
+positive rate against the target, the filter size and the check latency.
+
+With --database, the revoked jtis are also inserted into revoked_tokens and
+RevocationList.is_revoked() is timed for tokens that were never revoked, once
+with a synced filter (the common request path) and once without a sync,
+where every check is an exact primary key lookup. The benchmark rows are
+removed afterwards.
+"""
+import argparse
+import asyncio
+import datetime
+import os
+import sys
+import time
+import uuid
+from typing import List
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from infrastructure.auth.bloom import BloomFilter
+
+BENCH_JTI_PREFIX = "bench-revocation-"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def jtis(count: int) -> List[str]:
+    return [BENCH_JTI_PREFIX + uuid.uuid4().hex for _ in range(count)]
+
+
+def bloom_report(revoked: int, probes: int, error_rates: List[float]) -> None:
+    revoked_jtis = jtis(revoked)
+    probe_jtis = jtis(probes)
+
+    for error_rate in error_rates:
+        bloom = BloomFilter(revoked, error_rate)
+        for jti in revoked_jtis:
+            bloom.add(jti)
+
+        latencies = []
+        false_positives = 0
+        for jti in probe_jtis:
+            started = time.perf_counter()
+            hit = jti in bloom
+            latencies.append((time.perf_counter() - started) * 1_000_000)
+            false_positives += hit
+
+        print(f"target fp {error_rate:<8} measured fp {false_positives / probes:.5f} "
+              f"(expected {bloom.expected_false_positive_rate:.5f})  "
+              f"{bloom.size_in_bytes / 1024:8.1f} KiB  k={bloom.hash_count}  "
+              f"check p50 {percentile(latencies, 50):.2f} us  p99 {percentile(latencies, 99):.2f} us")
+
+
+async def database_report(revoked: int, checks: int) -> None:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from infrastructure.auth.revocation import RevocationList
+
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    expires_at = datetime.datetime.utcnow() + datetime.timedelta(days=1)
+
+    revoked_jtis = jtis(revoked)
+    async with engine.begin() as connection:
+        for start in range(0, revoked, 10_000):
+            await connection.execute(
+                text("INSERT INTO revoked_tokens (jti, expires_at, revoked_at) VALUES (:jti, :expires_at, now())"),
+                [{"jti": jti, "expires_at": expires_at} for jti in revoked_jtis[start:start + 10_000]]
+            )
+
+    try:
+        probe_jtis = jtis(checks)
+
+        synced = RevocationList(session_factory, capacity=max(revoked, 1))
+        await synced.sync()
+        exact_only = RevocationList(session_factory, capacity=max(revoked, 1))
+
+        for name, store in (("bloom front", synced), ("exact only", exact_only)):
+            latencies = []
+            for jti in probe_jtis:
+                started = time.perf_counter()
+                await store.is_revoked(jti)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            print(f"{name:>12}: p50 {percentile(latencies, 50):.4f} ms  p99 {percentile(latencies, 99):.4f} ms  "
+                  f"{store.stats.as_dict()}")
+
+        sample = revoked_jtis[:min(checks, revoked)]
+        assert all([await synced.is_revoked(jti) for jti in sample]), "a revoked token passed the check"
+
+    finally:
+        async with engine.begin() as connection:
+            await connection.execute(text("DELETE FROM revoked_tokens WHERE jti LIKE :prefix"),
+                                     {"prefix": f"{BENCH_JTI_PREFIX}%"})
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--revoked", type=int, default=100_000)
+    parser.add_argument("--probes", type=int, default=200_000)
+    parser.add_argument("--error-rates", type=float, nargs="+", default=[0.01, 0.001, 0.0001])
+    parser.add_argument("--database", action="store_true", help="also time RevocationList against DATABASE_URL")
+    parser.add_argument("--checks", type=int, default=2000)
+    args = parser.parse_args()
+
+    bloom_report(args.revoked, args.probes, args.error_rates)
+
+    if args.database:
+        asyncio.run(database_report(args.revoked, args.checks))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Ranked project search through the tsvector/trigram indexes versus ILIKE scans.
+
+Usage (from the repository root, DATABASE_URL pointing at a migrated database):
+
+    python -m benchmarks.search --seed-rows 1000000    # once, inserts synthetic projects
+    python -m benchmarks.search --repeat 200
+    python -m benchmarks.search --cleanup              # removes the synthetic projects
+
+Synthetic projects are inserted with generate_series, with names and
+descriptions drawn from a small vocabulary, and are tagged through their logo
+so --cleanup can remove them. Each run searches random prefixes, whole words
+and misspelled words, once through ProjectQueries.search() and once with the
+ILIKE '%term%' filter a plain query would use, and reports p50/p99 latency
+and matched rows per query.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from typing import List
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from sqlalchemy import select, text
+
+from infrastructure.database.models.projects import Project as DBProject
+from infrastructure.database.queries.project_queries import ProjectQueries
+from infrastructure.database.session import async_session_maker, engine
+
+VOCABULARY = [
+    "team", "matching", "backend", "frontend", "mobile", "analytics", "platform", "gateway",
+    "scheduler", "payments", "chat", "search", "inventory", "booking", "tracker", "dashboard",
+    "learning", "health", "travel", "music", "marketplace", "notes", "calendar", "weather",
+]
+
+BENCH_LOGO_PREFIX = "benchmark-search-"
+
+SEED_SQL = f"""
+INSERT INTO projects (id, name, description, logo, tech_mask, created_at)
+SELECT gen_random_uuid(),
+       words[1 + (i * 7) % array_length(words, 1)] || ' ' || words[1 + (i * 13) % array_length(words, 1)] || ' ' || i,
+       'A project about ' || words[1 + (i * 5) % array_length(words, 1)] || ' and '
+           || words[1 + (i * 11) % array_length(words, 1)] || ' for ' || words[1 + (i * 3) % array_length(words, 1)],
+       '{BENCH_LOGO_PREFIX}' || i,
+       1 + i % 15,
+       now() - (i || ' seconds')::interval
+FROM generate_series(:start, :stop) AS i, (SELECT CAST(:words AS text[]) AS words) AS vocabulary
+"""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def misspell(word: str, rng: random.Random) -> str:
+    position = rng.randrange(1, len(word))
+    return word[:position] + word[position + 1:]
+
+
+def search_terms(count: int, rng: random.Random) -> dict:
+    words = [rng.choice(VOCABULARY) for _ in range(count)]
+    return {
+        "prefix": [word[:4] for word in words],
+        "word": words,
+        "typo": [misspell(word, rng) for word in words],
+    }
+
+
+async def seed(rows: int, batch_size: int = 100_000) -> None:
+    async with engine.begin() as connection:
+        for start in range(1, rows + 1, batch_size):
+            stop = min(start + batch_size - 1, rows)
+            await connection.execute(text(SEED_SQL), {"start": start, "stop": stop, "words": VOCABULARY})
+            print(f"seeded {stop}/{rows}")
+
+        await connection.execute(text("ANALYZE projects"))
+
+
+async def cleanup() -> None:
+    async with engine.begin() as connection:
+        result = await connection.execute(text("DELETE FROM projects WHERE logo LIKE :prefix"),
+                                          {"prefix": f"{BENCH_LOGO_PREFIX}%"})
+        print(f"removed {result.rowcount} projects")
+
+
+async def indexed_search(term: str) -> int:
+    async with async_session_maker() as session:
+        page = await ProjectQueries(session).search(term, limit=20)
+        return len(page.items)
+
+
+async def ilike_search(term: str) -> int:
+    async with async_session_maker() as session:
+        stmt = (
+            select(*ProjectQueries._columns)
+            .where(DBProject.name.ilike(f"%{term}%") | DBProject.description.ilike(f"%{term}%"))
+            .order_by(DBProject.created_at, DBProject.id)
+            .limit(20)
+        )
+        return len((await session.execute(stmt)).all())
+
+
+async def run(repeat: int, seed_value: int) -> None:
+    terms = search_terms(repeat, random.Random(seed_value))
+
+    async with engine.connect() as connection:
+        total = (await connection.execute(text("SELECT count(*) FROM projects"))).scalar()
+    print(f"{total} projects, {repeat} queries per kind")
+
+    print(f"{'kind':>7} {'strategy':>8} {'rows/q':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for kind, kind_terms in terms.items():
+        for name, strategy in (("indexed", indexed_search), ("ilike", ilike_search)):
+            latencies: List[float] = []
+            rows = 0
+
+            for term in kind_terms:
+                started = time.perf_counter()
+                rows += await strategy(term)
+                latencies.append((time.perf_counter() - started) * 1000)
+
+            print(f"{kind:>7} {name:>8} {rows / repeat:>7.1f} {percentile(latencies, 50):>8.2f} "
+                  f"{percentile(latencies, 99):>8.2f}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.cleanup:
+        await cleanup()
+    elif args.seed_rows:
+        await seed(args.seed_rows)
+    else:
+        await run(args.repeat, args.seed)
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed-rows", type=int, help="insert this many synthetic projects and exit")
+    parser.add_argument("--cleanup", action="store_true", help="delete the synthetic projects and exit")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
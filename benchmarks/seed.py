@@ -0,0 +1,325 @@
+"""Deterministic synthetic users, teams, projects and desired projects, bulk loaded with COPY.
+
+Usage (from the repository root, DATABASE_URL pointing at a migrated database):
+
+    python -m benchmarks.seed --scale 10 --seed 42
+    python -m benchmarks.seed --scale 100 --seed 42 --truncate    # empties the seeded tables first
+    python -m benchmarks.seed --scale 1 --dry-run                 # row counts only, no database
+
+One unit of scale is 10,000 users, 2,000 teams, 4,000 projects and 5,000
+desired projects, plus their membership, participant and technology rows.
+The same scale and seed always produce the same ids, names and links.
+
+The rows respect the domain invariants the services enforce:
+    - a team has at most 20 members, its owner included
+    - a user is a member of at most MAX_AMOUNT_OF_TEAMS (3) teams
+    - a project is managed by its team owner and has at most
+      Project.MAX_PARTICIPANTS participants, all of them team members
+    - projects and desired projects have 1 to 10 technologies, mirrored in tech_mask
+
+Rows go through asyncpg's COPY when the engine uses asyncpg, and through
+executemany otherwise. generate() needs no database, so the same data can be
+built in tests and loaded with load() into a test database.
+
+Every seeded user has the password "benchmark-password".
+"""
+import argparse
+import asyncio
+import dataclasses
+import datetime
+import os
+import random
+import sys
+import uuid
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from domain.project.enum import ProjectRoleEnum, StatusProjectEnum
+from domain.project.model import Project
+from domain.shared.enum import TechnologyEnum
+from domain.shared.tech_mask import to_mask
+from domain.team.enum import TeamRoleEnum
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+
+PASSWORD = "benchmark-password"
+
+USERS_PER_SCALE = 10_000
+TEAMS_PER_SCALE = 2_000
+PROJECTS_PER_SCALE = 4_000
+DESIRED_PROJECTS_PER_SCALE = 5_000
+
+MAX_TEAM_MEMBERS = 20
+MAX_AMOUNT_OF_TEAMS = 3
+MAX_TECHNOLOGIES = 10
+
+BASE_TIME = datetime.datetime(2024, 1, 1)
+
+WORDS = [
+    "team", "matching", "backend", "frontend", "mobile", "analytics", "platform", "gateway",
+    "scheduler", "payments", "chat", "search", "inventory", "booking", "tracker", "dashboard",
+    "learning", "health", "travel", "music", "marketplace", "notes", "calendar", "weather",
+]
+
+# Lookup table -> names of its rows, the ids are resolved against the database
+LOOKUPS = {
+    "status_user": [status.value for status in StatusUserEnum],
+    "platform_role": [role.value for role in PlatformRoleEnum],
+    "team_role": [role.value for role in TeamRoleEnum],
+    "status_project": [status.value for status in StatusProjectEnum],
+    "project_participant_role": [role.value for role in ProjectRoleEnum],
+    "technology": [technology.value for technology in TechnologyEnum],
+}
+
+# Insert order, parents first
+TABLE_COLUMNS = {
+    "users": ("id", "username", "hashed_password", "email", "status_id", "created_at",
+              "teams_count", "projects_count", "desired_projects_count"),
+    "user_platform_role": ("user_id", "platform_role_id"),
+    "teams": ("id", "name", "description", "created_at"),
+    "team_members": ("id", "team_id", "user_id", "role_id", "created_at"),
+    "projects": ("id", "name", "description", "tech_mask", "team_id", "status_id", "created_at"),
+    "project_participant": ("id", "project_id", "user_id", "team_member_id", "role_id", "created_at"),
+    "project_technology": ("id", "project_id", "technology_id"),
+    "desired_projects": ("id", "amount_of_people", "description", "tech_mask", "user_id"),
+    "desired_project_technology": ("id", "desired_project_id", "technology_id"),
+}
+
+Lookups = Dict[str, Dict[str, int]]
+
+
+@dataclasses.dataclass
+class Dataset:
+    rows: Dict[str, List[tuple]]
+
+    def counts(self) -> Dict[str, int]:
+        return {table: len(rows) for table, rows in self.rows.items()}
+
+
+def default_lookups() -> Lookups:
+    # Ids in enum order, what a freshly seeded lookup table holds
+    return {table: {name: index for index, name in enumerate(names, start=1)} for table, names in LOOKUPS.items()}
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _phrase(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _technologies(rng: random.Random) -> List[TechnologyEnum]:
+    technologies = list(TechnologyEnum)
+    return rng.sample(technologies, rng.randint(1, min(MAX_TECHNOLOGIES, len(technologies))))
+
+
+def generate(scale: float, seed: int, lookups: Optional[Lookups] = None,
+             password_hash: str = "not-a-valid-hash") -> Dataset:
+    rng = random.Random(seed)
+    lookups = lookups or default_lookups()
+    rows: Dict[str, List[tuple]] = {table: [] for table in TABLE_COLUMNS}
+
+    user_count = max(1, int(USERS_PER_SCALE * scale))
+    team_count = max(1, int(TEAMS_PER_SCALE * scale))
+    project_count = int(PROJECTS_PER_SCALE * scale)
+    desired_project_count = int(DESIRED_PROJECTS_PER_SCALE * scale)
+
+    active = lookups["status_user"][StatusUserEnum.ACTIVE.value]
+    looking = lookups["status_user"][StatusUserEnum.LOOKING_FOR_PROJECT.value]
+    developer_role = lookups["platform_role"][PlatformRoleEnum.DEVELOPER_USER.value]
+
+    users = [_uuid(rng) for _ in range(user_count)]
+
+    #### Teams ####
+
+    # Every user gets up to MAX_AMOUNT_OF_TEAMS membership slots, teams are filled from the shuffled slots
+    slots = [user_id for user_id in users for _ in range(rng.randint(0, MAX_AMOUNT_OF_TEAMS))]
+    rng.shuffle(slots)
+
+    owner_role = lookups["team_role"][TeamRoleEnum.OWNER.value]
+    member_roles = [lookups["team_role"][role.value] for role in TeamRoleEnum if role != TeamRoleEnum.OWNER]
+
+    # team id -> [(user id, team_members id)], the owner first
+    team_members: Dict[uuid.UUID, List[Tuple[uuid.UUID, uuid.UUID]]] = {}
+    position = 0
+    for index in range(team_count):
+        if position >= len(slots):
+            break
+
+        # Mostly small teams with a long tail up to the limit
+        size = min(MAX_TEAM_MEMBERS, 1 + int(rng.expovariate(1 / 5)))
+        picked = list(dict.fromkeys(slots[position:position + size]))
+        position += size
+
+        team_id = _uuid(rng)
+        created_at = BASE_TIME + datetime.timedelta(minutes=index)
+        rows["teams"].append((team_id, f"{_phrase(rng, 2)} team {seed}-{index}", _phrase(rng, 8), created_at))
+
+        members = team_members[team_id] = []
+        for member_index, user_id in enumerate(picked):
+            member_id = _uuid(rng)
+            role_id = owner_role if member_index == 0 else rng.choice(member_roles)
+            rows["team_members"].append((member_id, team_id, user_id, role_id, created_at))
+            members.append((user_id, member_id))
+
+    #### Projects ####
+
+    team_ids = list(team_members)
+    statuses = [lookups["status_project"][status.value] for status in StatusProjectEnum]
+    status_weights = [70, 10, 10, 10]
+    manager_role = lookups["project_participant_role"][ProjectRoleEnum.MANAGER.value]
+    participant_roles = [lookups["project_participant_role"][role.value]
+                         for role in ProjectRoleEnum if role != ProjectRoleEnum.MANAGER]
+    technology_ids = lookups["technology"]
+
+    for index in range(project_count if team_ids else 0):
+        team_id = rng.choice(team_ids)
+        members = team_members[team_id]
+        project_id = _uuid(rng)
+        technologies = _technologies(rng)
+        created_at = BASE_TIME + datetime.timedelta(seconds=30 * index)
+
+        rows["projects"].append((
+            project_id, f"{_phrase(rng, 2)} project {seed}-{index}", _phrase(rng, 12), to_mask(technologies),
+            team_id, rng.choices(statuses, status_weights)[0], created_at
+        ))
+
+        # The team owner manages the project, other participants come from the same team
+        owner_id, owner_member_id = members[0]
+        rows["project_participant"].append((_uuid(rng), project_id, owner_id, owner_member_id, manager_role,
+                                            created_at))
+        others = rng.sample(members[1:], min(len(members) - 1, rng.randint(0, Project.MAX_PARTICIPANTS - 1)))
+        for user_id, member_id in others:
+            rows["project_participant"].append((_uuid(rng), project_id, user_id, member_id,
+                                                rng.choice(participant_roles), created_at))
+
+        for technology in technologies:
+            rows["project_technology"].append((_uuid(rng), project_id, technology_ids[technology.value]))
+
+    #### Desired projects ####
+
+    for _ in range(desired_project_count):
+        desired_project_id = _uuid(rng)
+        technologies = _technologies(rng)
+
+        rows["desired_projects"].append((
+            desired_project_id, rng.randint(1, Project.MAX_PARTICIPANTS), _phrase(rng, 10), to_mask(technologies),
+            rng.choice(users)
+        ))
+        for technology in technologies:
+            rows["desired_project_technology"].append((_uuid(rng), desired_project_id,
+                                                       technology_ids[technology.value]))
+
+    #### Users, with the membership counters the repositories maintain ####
+
+    teams_count = Counter(row[2] for row in rows["team_members"])
+    projects_count = Counter(row[2] for row in rows["project_participant"])
+    desired_projects_count = Counter(row[4] for row in rows["desired_projects"])
+
+    for index, user_id in enumerate(users):
+        rows["users"].append((
+            user_id, f"seed_user_{seed}_{index}", password_hash, f"seed_user_{seed}_{index}@example.com",
+            looking if index % 4 == 0 else active, BASE_TIME + datetime.timedelta(seconds=index),
+            teams_count[user_id], projects_count[user_id], desired_projects_count[user_id]
+        ))
+        rows["user_platform_role"].append((user_id, developer_role))
+
+    return Dataset(rows)
+
+
+#### Loading ####
+
+async def resolve_lookups(connection) -> Lookups:
+    from sqlalchemy import text
+
+    lookups = {}
+    for table, names in LOOKUPS.items():
+        for name in names:
+            await connection.execute(
+                text(f"INSERT INTO {table} (name) VALUES (:name) ON CONFLICT (name) DO NOTHING"), {"name": name}
+            )
+        result = await connection.execute(text(f"SELECT name, id FROM {table}"))
+        lookups[table] = dict(result.all())
+    return lookups
+
+
+async def copy_rows(connection, table: str, columns: Sequence[str], rows: Iterable[tuple],
+                    batch_size: int = 50_000) -> None:
+    from sqlalchemy import text
+
+    rows = list(rows)
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+
+    if hasattr(driver_connection, "copy_records_to_table"):
+        for start in range(0, len(rows), batch_size):
+            await driver_connection.copy_records_to_table(
+                table, records=rows[start:start + batch_size], columns=list(columns)
+            )
+        return
+
+    statement = text(f"INSERT INTO {table} ({', '.join(columns)}) "
+                     f"VALUES ({', '.join(':' + column for column in columns)})")
+    for start in range(0, len(rows), batch_size):
+        await connection.execute(statement, [dict(zip(columns, row)) for row in rows[start:start + batch_size]])
+
+
+async def load(connection, dataset: Dataset) -> None:
+    from sqlalchemy import text
+
+    for table, columns in TABLE_COLUMNS.items():
+        await copy_rows(connection, table, columns, dataset.rows[table])
+
+    for table in TABLE_COLUMNS:
+        await connection.execute(text(f"ANALYZE {table}"))
+
+
+async def truncate(connection) -> None:
+    from sqlalchemy import text
+
+    await connection.execute(text(f"TRUNCATE {', '.join(TABLE_COLUMNS)} CASCADE"))
+
+
+def print_counts(dataset: Dataset) -> None:
+    for table, count in dataset.counts().items():
+        print(f"{table:>28}: {count} rows")
+
+
+async def seed(scale: float, seed_value: int, reset: bool) -> None:
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from infrastructure.auth.hashing import pwd_context
+
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+    async with engine.begin() as connection:
+        if reset:
+            await truncate(connection)
+
+        lookups = await resolve_lookups(connection)
+        dataset = generate(scale, seed_value, lookups, password_hash=pwd_context.hash(PASSWORD))
+        await load(connection, dataset)
+
+    await engine.dispose()
+    print_counts(dataset)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--truncate", action="store_true", help="empty the seeded tables before loading")
+    parser.add_argument("--dry-run", action="store_true", help="print the row counts without a database")
+    args = parser.parse_args()
+
+    if args.dry_run:
+        print_counts(generate(args.scale, args.seed))
+        return
+
+    asyncio.run(seed(args.scale, args.seed, args.truncate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""Scripted HTTP scenarios against presentation.main:app with a JSON baseline to compare runs.
+
+Usage (from the repository root, DATABASE_URL pointing at a migrated and seeded database):
+
+    python -m benchmarks.suite run --output baseline.json
+    # ... change something ...
+    python -m benchmarks.suite run --output current.json
+    python -m benchmarks.suite compare baseline.json current.json --tolerance 0.10
+
+Every scenario runs in its own process, so the peak RSS it reports is its own,
+and drives the app in-process through httpx's ASGI transport. The app is
+imported with QUERY_STATS_HEADERS enabled, and SQL statements per request are
+read from the X-DB-Statements header set by the query stats middleware.
+
+Scenarios:
+    login_storm              POST /auth/login for one user
+    list_projects            GET /projects/ first page
+    batch_add_participants   POST /projects/{id}/participants, one project per worker
+    team_role_churn          PUT /teams/{id}/team_member/{user}/roles, one member per worker
+
+compare exits with status 1 when a scenario got slower, lost throughput or
+grew its peak RSS by more than the tolerance, or issues more SQL statements
+per request than in the baseline.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import uuid
+from typing import Dict, List, Optional
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+PASSWORD = "benchmark-password"
+PARTICIPANTS_PER_BATCH = 10
+# Team.add_member allows 20 members, the owner included
+MAX_CHURNED_MEMBERS = 19
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Recorder:
+
+    def __init__(self):
+        self.latencies_ms: List[float] = []
+        self.statements: List[int] = []
+        self.statuses: Dict[int, int] = {}
+
+    async def measure(self, request):
+        started = time.perf_counter()
+        response = await request
+        self.latencies_ms.append((time.perf_counter() - started) * 1000)
+
+        self.statuses[response.status_code] = self.statuses.get(response.status_code, 0) + 1
+        if "x-db-statements" in response.headers:
+            self.statements.append(int(response.headers["x-db-statements"]))
+        return response
+
+
+#### Fixtures ####
+
+async def register(client, prefix: str) -> dict:
+    username = f"{prefix}_{uuid.uuid4().hex[:12]}"
+    user_id = uuid.uuid4()
+    response = await client.post("/auth/register", json={
+        "id": str(user_id), "username": username, "password": PASSWORD,
+        "email": f"{username}@example.com", "platform_role": ["User"]
+    })
+    response.raise_for_status()
+    return {
+        "id": user_id,
+        "email": f"{username}@example.com",
+        "headers": {"Authorization": f"Bearer {response.json()['access_token']}"},
+    }
+
+
+async def create_team(client, owner: dict) -> uuid.UUID:
+    response = await client.post("/teams/", headers=owner["headers"], json={
+        "name": f"bench {uuid.uuid4().hex[:12]}", "description": "Team created by the benchmark suite",
+    })
+    response.raise_for_status()
+    return uuid.UUID(response.json()["id"])
+
+
+async def create_project(client, owner: dict, team_id: uuid.UUID) -> uuid.UUID:
+    response = await client.post("/projects/", headers=owner["headers"], json={
+        "name": f"bench {uuid.uuid4().hex[:12]}", "team_id": str(team_id),
+        "description": "Project created by the benchmark suite",
+    })
+    response.raise_for_status()
+    return uuid.UUID(response.json()["id"])
+
+
+#### Scenarios ####
+
+async def login_storm(client, recorder: Recorder, requests: int, concurrency: int) -> None:
+    user = await register(client, "suite_login")
+
+    async def worker(worker_id: int) -> None:
+        for _ in range(worker_id, requests, concurrency):
+            await recorder.measure(client.post("/auth/login", json={"email": user["email"], "password": PASSWORD}))
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+
+async def list_projects(client, recorder: Recorder, requests: int, concurrency: int) -> None:
+    async def worker(worker_id: int) -> None:
+        for _ in range(worker_id, requests, concurrency):
+            await recorder.measure(client.get("/projects/", params={"limit": 20}))
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+
+async def batch_add_participants(client, recorder: Recorder, requests: int, concurrency: int) -> None:
+    owner = await register(client, "suite_manager")
+    team_id = await create_team(client, owner)
+    participants = [(await register(client, "suite_participant"))["id"] for _ in range(PARTICIPANTS_PER_BATCH)]
+    projects = [await create_project(client, owner, team_id) for _ in range(concurrency)]
+
+    async def worker(worker_id: int) -> None:
+        project_id = projects[worker_id]
+        for _ in range(worker_id, requests, concurrency):
+            await recorder.measure(client.post(
+                f"/projects/{project_id}/participants", headers=owner["headers"],
+                json={"project_id": str(project_id),
+                      "participants": [{"user_id": str(user_id), "roles": ["Developer"]}
+                                       for user_id in participants]}
+            ))
+            # Untimed, puts the project back for the next batch
+            await client.request(
+                "DELETE", f"/projects/{project_id}/participants", headers=owner["headers"],
+                json={"project_id": str(project_id), "user_ids": [str(user_id) for user_id in participants]}
+            )
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+
+async def team_role_churn(client, recorder: Recorder, requests: int, concurrency: int) -> None:
+    concurrency = min(concurrency, MAX_CHURNED_MEMBERS)
+    owner = await register(client, "suite_owner")
+    team_id = await create_team(client, owner)
+    members = [(await register(client, "suite_member"))["id"] for _ in range(concurrency)]
+
+    response = await client.post(f"/teams/{team_id}/team_members", headers=owner["headers"], json={
+        "team_id": str(team_id),
+        "members": [{"user_id": str(user_id), "roles": ["Backend Developer"]} for user_id in members],
+    })
+    response.raise_for_status()
+
+    role_sets = (["Frontend Developer", "Designer"], ["Backend Developer"])
+
+    async def worker(worker_id: int) -> None:
+        user_id = members[worker_id]
+        for step in range(worker_id, requests, concurrency):
+            await recorder.measure(client.put(
+                f"/teams/{team_id}/team_member/{user_id}/roles", headers=owner["headers"],
+                json={"user_id": str(user_id), "roles": role_sets[step // concurrency % 2]}
+            ))
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+
+SCENARIOS = {
+    "login_storm": login_storm,
+    "list_projects": list_projects,
+    "batch_add_participants": batch_add_participants,
+    "team_role_churn": team_role_churn,
+}
+
+
+#### Running ####
+
+async def run_scenario(name: str, requests: int, concurrency: int) -> dict:
+    os.environ["QUERY_STATS_HEADERS"] = "true"
+
+    import httpx
+    from presentation.main import app
+
+    recorder = Recorder()
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            started = time.perf_counter()
+            await SCENARIOS[name](client, recorder, requests, concurrency)
+            elapsed = time.perf_counter() - started
+
+    latencies = recorder.latencies_ms
+    statements = recorder.statements
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "throughput_rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "statements_mean": sum(statements) / len(statements) if statements else None,
+        "statements_max": max(statements) if statements else None,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "statuses": {str(code): count for code, count in sorted(recorder.statuses.items())},
+    }
+
+
+def run(scenarios: List[str], requests: int, concurrency: int) -> dict:
+    results = {}
+    for name in scenarios:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.suite", "child", name,
+             "--requests", str(requests), "--concurrency", str(concurrency)],
+            cwd=ROOT_DIR, check=True, capture_output=True, text=True
+        ).stdout.strip().splitlines()[-1]
+
+        results[name] = json.loads(output)
+        result = results[name]
+        print(f"{name:>24}: {result['throughput_rps']:8.1f} req/s  p50 {result['p50_ms']:7.2f} ms  "
+              f"p95 {result['p95_ms']:7.2f} ms  p99 {result['p99_ms']:7.2f} ms  "
+              f"sql/req {result['statements_mean'] if result['statements_mean'] is not None else '-'}  "
+              f"rss {result['peak_rss_mb']:.0f} MB  {result['statuses']}")
+
+    return {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "requests": requests,
+        "concurrency": concurrency,
+        "scenarios": results,
+    }
+
+
+#### Comparing ####
+
+# metric -> True when a higher value is better
+COMPARED_METRICS = {
+    "throughput_rps": True,
+    "p50_ms": False,
+    "p95_ms": False,
+    "p99_ms": False,
+    "peak_rss_mb": False,
+}
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> List[str]:
+    regressions = []
+
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if before is None:
+            print(f"{name}: not in the baseline")
+            continue
+
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = before[metric], result[metric]
+            change = (new - old) / old if old else 0.0
+            regressed = change < -tolerance if higher_is_better else change > tolerance
+
+            flag = "REGRESSION" if regressed else ""
+            print(f"{name:>24} {metric:>16}: {old:10.2f} -> {new:10.2f} ({change:+7.1%}) {flag}")
+            if regressed:
+                regressions.append(f"{name}.{metric}")
+
+        # Statement counts are deterministic, any growth is an N+1 creeping in
+        old, new = before.get("statements_max"), result.get("statements_max")
+        if old is not None and new is not None:
+            flag = "REGRESSION" if new > old else ""
+            print(f"{name:>24} {'statements_max':>16}: {old:10d} -> {new:10d} {flag}")
+            if new > old:
+                regressions.append(f"{name}.statements_max")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the scenarios")
+    run_parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    run_parser.add_argument("--requests", type=int, default=500)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--output", help="write the results as JSON, to be used as a baseline")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions between two runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.10,
+                                help="allowed relative change before a metric counts as regressed")
+
+    child_parser = commands.add_parser("child")
+    child_parser.add_argument("scenario", choices=sorted(SCENARIOS))
+    child_parser.add_argument("--requests", type=int, required=True)
+    child_parser.add_argument("--concurrency", type=int, required=True)
+
+    args = parser.parse_args()
+
+    if args.command == "child":
+        print(json.dumps(asyncio.run(run_scenario(args.scenario, args.requests, args.concurrency))))
+        return
+
+    if args.command == "run":
+        results = run(args.scenarios, args.requests, args.concurrency)
+        if args.output:
+            with open(args.output, "w") as file:
+                json.dump(results, file, indent=2)
+        return
+
+    with open(args.baseline) as file:
+        baseline = json.load(file)
+    with open(args.current) as file:
+        current = json.load(file)
+
+    regressions = compare(baseline, current, args.tolerance)
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Technology stacks as a bitmask versus a set of enum members and a join table.
+
+Usage (from the repository root):
+
+    python -m benchmarks.tech_mask --aggregates 100000
+    python -m benchmarks.tech_mask --filters --repeat 200    # DATABASE_URL pointing at a seeded database
+
+The memory part builds --aggregates technology profiles twice, once the way
+TechValueObject stored them before (a set of TechnologyEnum members) and once
+as the current bitmask, and reports traced bytes per aggregate.
+
+With --filters, "projects using any/all of X" pages run against the
+project_technology join table and against the projects.tech_mask column, and
+the script reports p50/p99 latency and row counts for each, which must match.
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Callable, List, Set
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+from domain.shared.enum import TechnologyEnum
+from domain.shared.tech_mask import to_mask
+from domain.shared.value_object import TechValueObject
+
+TECHNOLOGIES = list(TechnologyEnum)
+
+JOIN_FILTERS = {
+    "any": (
+        "SELECT id FROM projects WHERE EXISTS (SELECT 1 FROM project_technology JOIN technology "
+        "ON project_technology.technology_id = technology.id "
+        "WHERE project_technology.project_id = projects.id AND technology.name = ANY(:names)) "
+        "ORDER BY created_at, id LIMIT 100"
+    ),
+    "all": (
+        "SELECT id FROM projects WHERE (SELECT count(*) FROM project_technology JOIN technology "
+        "ON project_technology.technology_id = technology.id "
+        "WHERE project_technology.project_id = projects.id AND technology.name = ANY(:names)) = :count "
+        "ORDER BY created_at, id LIMIT 100"
+    ),
+}
+
+MASK_FILTERS = {
+    "any": "SELECT id FROM projects WHERE tech_mask & :mask <> 0 ORDER BY created_at, id LIMIT 100",
+    "all": "SELECT id FROM projects WHERE tech_mask & :mask = :mask ORDER BY created_at, id LIMIT 100",
+}
+
+
+# The layout TechValueObject had before the stack became a bitmask
+@dataclass(frozen=True)
+class SetTechProfile:
+    description: str
+    technologies: Set[TechnologyEnum] = field(default_factory=set)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def traced_bytes(build: Callable[[], list]) -> int:
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    built = build()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del built
+    return after - before
+
+
+def memory_report(aggregates: int, seed: int) -> None:
+    rng = random.Random(seed)
+    description = "Benchmark project description"
+    stacks = [set(rng.sample(TECHNOLOGIES, rng.randint(1, len(TECHNOLOGIES)))) for _ in range(aggregates)]
+
+    results = {
+        "set": traced_bytes(lambda: [SetTechProfile(description, set(stack)) for stack in stacks]),
+        "bitmask": traced_bytes(lambda: [TechValueObject(description, to_mask(stack)) for stack in stacks]),
+    }
+
+    print(f"{'layout':>8} {'bytes/aggregate':>16}")
+    for name, total in results.items():
+        print(f"{name:>8} {total / aggregates:>16.1f}")
+
+
+async def filter_report(repeat: int, seed: int) -> None:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    rng = random.Random(seed)
+    engine = create_async_engine(os.environ["DATABASE_URL"])
+
+    print(f"{'filter':>6} {'strategy':>8} {'rows':>6} {'p50 ms':>8} {'p99 ms':>8}")
+    async with engine.connect() as connection:
+        for mode in ("any", "all"):
+            stacks = [rng.sample(TECHNOLOGIES, rng.randint(1, 2)) for _ in range(repeat)]
+
+            for strategy, sql in (("join", JOIN_FILTERS[mode]), ("bitmask", MASK_FILTERS[mode])):
+                latencies: List[float] = []
+                rows = 0
+
+                for stack in stacks:
+                    params = {"names": [t.value for t in stack], "count": len(stack), "mask": to_mask(stack)}
+
+                    started = time.perf_counter()
+                    result = await connection.execute(text(sql), params)
+                    rows += len(result.all())
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+                print(f"{mode:>6} {strategy:>8} {rows:>6} {percentile(latencies, 50):>8.2f} "
+                      f"{percentile(latencies, 99):>8.2f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--aggregates", type=int, default=100_000)
+    parser.add_argument("--filters", action="store_true", help="also time the filter queries against DATABASE_URL")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    memory_report(args.aggregates, args.seed)
+
+    if args.filters:
+        asyncio.run(filter_report(args.repeat, args.seed))
+
+
+if __name__ == "__main__":
+    main()
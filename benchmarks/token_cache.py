@@ -0,0 +1,107 @@
+"""Throughput of access token authentication with and without the verified claims cache.
+
+Usage (from the repository root, DATABASE_URL set; importing the app creates the engine but
+the benchmark never connects):
+
+    python -m benchmarks.token_cache --requests 50000 --clients 100
+
+Replays the stateless path of AuthUserProvider.get_current_principal:
+bearer extraction, decode_token, the revocation check and the principal built
+from the claims. It runs once over a plain JWTService, where every request
+verifies the HMAC and parses the JSON, and once over CachedTokenService. Every
+client reuses its own token, the way a browser tab does until the token
+expires. The revocation list is a synced RevocationList filter with no
+revoked tokens, so no database is needed.
+"""
+import argparse
+import asyncio
+import datetime
+import os
+import sys
+import time
+import uuid
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "15")
+os.environ.setdefault("REFRESH_TOKEN_EXPIRE_DAYS", "7")
+
+from starlette.requests import Request
+
+from application.auth.dto import AuthPrincipal
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+from infrastructure.auth.jwt import JWTService
+from infrastructure.auth.revocation import RevocationList
+from infrastructure.auth.token_cache import CachedTokenService
+from presentation.security import _decode_access_token
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def bearer_request(token: str) -> Request:
+    return Request({
+        "type": "http", "method": "GET", "path": "/", "query_string": b"",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+    })
+
+
+def synced_revocation_list() -> RevocationList:
+    # An empty filter marked as synced, every check is a bloom miss like for any non revoked token
+    revocation_list = RevocationList(session_factory=None)
+    revocation_list._synced_until = datetime.datetime.utcnow()
+    return revocation_list
+
+
+async def authenticate(requests: int, clients: int, token_service) -> dict:
+    issuer = JWTService()
+    tokens = [
+        issuer.create_access_token(AuthPrincipal(
+            id=uuid.uuid4(), status_user=StatusUserEnum.ACTIVE, platform_role=[PlatformRoleEnum.DEVELOPER_USER]
+        ).to_claims())
+        for _ in range(clients)
+    ]
+    revocation_list = synced_revocation_list()
+
+    latencies = []
+    started = time.perf_counter()
+    for index in range(requests):
+        request = bearer_request(tokens[index % clients])
+
+        request_started = time.perf_counter()
+        payload = await _decode_access_token(request, token_service, revocation_list)
+        AuthPrincipal.from_claims(payload)
+        latencies.append((time.perf_counter() - request_started) * 1_000_000)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "requests_per_second": requests / elapsed,
+        "p50_us": percentile(latencies, 50),
+        "p99_us": percentile(latencies, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--clients", type=int, default=100)
+    args = parser.parse_args()
+
+    for name, token_service in (("uncached", JWTService()), ("cached", CachedTokenService(JWTService()))):
+        result = asyncio.run(authenticate(args.requests, args.clients, token_service))
+        print(f"{name:>9}: {result['requests_per_second']:10.0f} req/s  "
+              f"p50 {result['p50_us']:7.1f} us  p99 {result['p99_us']:7.1f} us")
+
+        stats = getattr(token_service, "stats", None)
+        if stats is not None:
+            print(f"{'':>9}  {stats.as_dict()}")
+
+
+if __name__ == "__main__":
+    main()
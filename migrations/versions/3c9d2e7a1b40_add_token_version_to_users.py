@@ -0,0 +1,28 @@
+"""Add token version to users
+
+Revision ID: 3c9d2e7a1b40
+Revises: f57358452437
+Create Date: 2026-10-18 10:12:41.532918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9d2e7a1b40'
+down_revision: Union[str, Sequence[str], None] = 'f57358452437'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
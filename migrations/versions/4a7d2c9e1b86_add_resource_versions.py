@@ -0,0 +1,34 @@
+"""Add version counters to projects, teams and users
+
+Revision ID: 4a7d2c9e1b86
+Revises: e8c1d5b7a2f4
+Create Date: 2026-10-18 18:05:12.640871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a7d2c9e1b86'
+down_revision: Union[str, Sequence[str], None] = 'e8c1d5b7a2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TABLES = ['projects', 'teams', 'users']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A constant server default is stored in the catalog, existing rows are not rewritten
+    for table in TABLES:
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(TABLES):
+        op.drop_column(table, 'version')
@@ -0,0 +1,28 @@
+"""Add the project url column
+
+Revision ID: 5d1f9a3c7e22
+Revises: a3e9b7c51d20
+Create Date: 2026-10-18 21:12:40.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1f9a3c7e22'
+down_revision: Union[str, Sequence[str], None] = 'a3e9b7c51d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('projects', sa.Column('url_project', sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('projects', 'url_project')
@@ -0,0 +1,45 @@
+"""Add denormalized membership counters to users
+
+Revision ID: 6c2f8e1a9d47
+Revises: 4a7d2c9e1b86
+Create Date: 2026-10-18 19:42:37.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c2f8e1a9d47'
+down_revision: Union[str, Sequence[str], None] = '4a7d2c9e1b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# users column -> table holding the counted rows
+COUNTERS = {
+    'teams_count': 'team_members',
+    'projects_count': 'project_participant',
+    'desired_projects_count': 'desired_projects',
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COUNTERS:
+        op.add_column('users', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    for column, table in COUNTERS.items():
+        op.execute(
+            f"UPDATE users SET {column} = counted.amount "
+            f"FROM (SELECT user_id, count(*) AS amount FROM {table} WHERE user_id IS NOT NULL GROUP BY user_id) "
+            f"AS counted WHERE users.id = counted.user_id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(list(COUNTERS)):
+        op.drop_column('users', column)
@@ -0,0 +1,47 @@
+"""Add indexes for hot lookup columns
+
+Revision ID: 9f3b6d1a7c55
+Revises: d4a8c2e91f07
+Create Date: 2026-10-18 14:21:07.482906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9f3b6d1a7c55'
+down_revision: Union[str, Sequence[str], None] = 'd4a8c2e91f07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# name, table, columns, covered columns
+INDEXES = [
+    ('ix_project_participant_user_id', 'project_participant', ['user_id'], ['project_id']),
+    ('ix_team_members_user_id_role_id', 'team_members', ['user_id', 'role_id'], ['team_id']),
+    ('ix_team_members_team_id', 'team_members', ['team_id'], None),
+    ('ix_desired_projects_user_id', 'desired_projects', ['user_id'], None),
+    ('ix_desired_project_technology_desired_project_id', 'desired_project_technology', ['desired_project_id'], None),
+    ('ix_project_technology_technology_id_project_id', 'project_technology', ['technology_id', 'project_id'], None),
+    ('ix_projects_created_at_id', 'projects', ['created_at', 'id'], None),
+    ('ix_projects_team_id_created_at_id', 'projects', ['team_id', 'created_at', 'id'], None),
+    ('ix_projects_status_id_created_at_id', 'projects', ['status_id', 'created_at', 'id'], None),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction, and it does not block writes on live tables
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            op.create_index(name, table, columns, unique=False, if_not_exists=True,
+                            postgresql_concurrently=True, postgresql_include=include or [])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,58 @@
+"""Add denormalized technology masks to projects and desired projects
+
+Revision ID: b2e6f4a9d310
+Revises: 9f3b6d1a7c55
+Create Date: 2026-10-18 16:02:44.913250
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e6f4a9d310'
+down_revision: Union[str, Sequence[str], None] = '9f3b6d1a7c55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Frozen copy of domain.shared.tech_mask.TECHNOLOGY_BITS at the time of this revision
+TECHNOLOGY_BITS = {
+    'Python': 0,
+    'JavaScript': 1,
+    'React': 2,
+    'Docker': 3,
+}
+
+BIT_CASE = "CASE technology.name {} END".format(
+    " ".join(f"WHEN '{name}' THEN {bit}" for name, bit in TECHNOLOGY_BITS.items())
+)
+
+# table, link table, link column pointing at the table
+TABLES = [
+    ('projects', 'project_technology', 'project_id'),
+    ('desired_projects', 'desired_project_technology', 'desired_project_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, link_table, link_column in TABLES:
+        op.add_column(table, sa.Column('tech_mask', sa.BigInteger(), server_default='0', nullable=False))
+
+        op.execute(
+            f"UPDATE {table} SET tech_mask = masks.tech_mask "
+            f"FROM (SELECT {link_table}.{link_column} AS id, bit_or(1::bigint << {BIT_CASE}) AS tech_mask "
+            f"FROM {link_table} JOIN technology ON {link_table}.technology_id = technology.id "
+            f"WHERE technology.name IN ({', '.join(repr(name) for name in TECHNOLOGY_BITS)}) "
+            f"GROUP BY {link_table}.{link_column}) AS masks "
+            f"WHERE {table}.id = masks.id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in reversed(TABLES):
+        op.drop_column(table, 'tech_mask')
@@ -0,0 +1,46 @@
+"""Add desired project tables
+
+Revision ID: d4a8c2e91f07
+Revises: 7b1e4f0c2d93
+Create Date: 2026-10-18 14:05:52.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8c2e91f07'
+down_revision: Union[str, Sequence[str], None] = '7b1e4f0c2d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('desired_projects',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('amount_of_people', sa.Integer(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('user_id', sa.UUID(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_desired_projects_id'), 'desired_projects', ['id'], unique=False)
+    op.create_table('desired_project_technology',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('desired_project_id', sa.UUID(), nullable=True),
+    sa.Column('technology_id', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['desired_project_id'], ['desired_projects.id'], ),
+    sa.ForeignKeyConstraint(['technology_id'], ['technology.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('desired_project_technology')
+    op.drop_index(op.f('ix_desired_projects_id'), table_name='desired_projects')
+    op.drop_table('desired_projects')
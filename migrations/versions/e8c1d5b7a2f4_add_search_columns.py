@@ -0,0 +1,57 @@
+"""Add full-text search vectors and trigram name indexes to projects and teams
+
+Revision ID: e8c1d5b7a2f4
+Revises: b2e6f4a9d310
+Create Date: 2026-10-18 17:11:35.208416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c1d5b7a2f4'
+down_revision: Union[str, Sequence[str], None] = 'b2e6f4a9d310'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')"
+)
+
+TABLES = ['projects', 'teams']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # A stored generated column is recomputed by Postgres for each written row, no trigger or backfill job
+    for table in TABLES:
+        op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(),
+                                       sa.Computed(SEARCH_VECTOR, persisted=True), nullable=True))
+
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False,
+                            if_not_exists=True, postgresql_concurrently=True, postgresql_using='gin')
+            op.create_index(f'ix_{table}_name_trgm', table, ['name'], unique=False,
+                            if_not_exists=True, postgresql_concurrently=True, postgresql_using='gin',
+                            postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table in reversed(TABLES):
+            op.drop_index(f'ix_{table}_name_trgm', table_name=table, if_exists=True, postgresql_concurrently=True)
+            op.drop_index(f'ix_{table}_search_vector', table_name=table, if_exists=True,
+                          postgresql_concurrently=True)
+
+    for table in reversed(TABLES):
+        op.drop_column(table, 'search_vector')
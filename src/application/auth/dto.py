@@ -1,5 +1,11 @@
+import uuid
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel, EmailStr
 
+from domain.user.enum import StatusUserEnum, PlatformRoleEnum
+from domain.user.model import User as DomainUser
+
 class LoginRequestDTO(BaseModel):
     email: EmailStr
     password: str
@@ -10,4 +16,40 @@ class TokenResponseDTO(BaseModel):
 
 class ChangePasswordDTO(BaseModel):
     new_password: str
-    old_password: str
\ No newline at end of file
+    old_password: str
+
+class AuthPrincipal(BaseModel):
+    id: uuid.UUID
+    status_user: StatusUserEnum
+    platform_role: List[PlatformRoleEnum]
+    token_version: int = 0
+
+    @classmethod
+    def from_user(cls, user: DomainUser) -> 'AuthPrincipal':
+        return cls(
+            id=user.id,
+            status_user=StatusUserEnum(user.status_user),
+            platform_role=[PlatformRoleEnum(role) for role in user.platform_role or []],
+            token_version=user.token_version
+        )
+
+    @classmethod
+    def from_claims(cls, claims: Dict) -> Optional['AuthPrincipal']:
+        # Tokens issued without the principal claims have to be resolved from the database
+        if not {"sub", "status", "roles", "ver"} <= claims.keys():
+            return None
+
+        return cls(
+            id=uuid.UUID(claims["sub"]),
+            status_user=StatusUserEnum(claims["status"]),
+            platform_role=[PlatformRoleEnum(role) for role in claims["roles"]],
+            token_version=claims["ver"]
+        )
+
+    def to_claims(self) -> Dict:
+        return {
+            "sub": str(self.id),
+            "status": self.status_user.value,
+            "roles": [role.value for role in self.platform_role],
+            "ver": self.token_version,
+        }
@@ -1,4 +1,7 @@
 from application.shared.exceptions import BaseHandleException
 
 class IncorrectLoginData(BaseHandleException):
-    pass
\ No newline at end of file
+    pass
+
+class HashingUnavailableException(BaseHandleException):
+    pass
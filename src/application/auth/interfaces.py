@@ -1,5 +1,7 @@
+import datetime
+import uuid
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Optional
 
 class ITokenService(ABC):
 
@@ -22,12 +24,25 @@ class ITokenService(ABC):
 
 class IPasswordHasher(ABC):
 
-    @staticmethod
     @abstractmethod
-    def verify_password(plain_password: str, hashed_password) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         pass
 
-    @staticmethod
     @abstractmethod
-    def get_password_hash(password: str) -> str:
-        pass
\ No newline at end of file
+    async def get_password_hash(self, password: str) -> str:
+        pass
+
+
+class IRevocationStore(ABC):
+
+    @abstractmethod
+    async def is_revoked(self, jti: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def revoke(self, jti: str, user_id: Optional[uuid.UUID], expires_at: datetime.datetime) -> None:
+        pass
+
+    @abstractmethod
+    async def sync(self) -> None:
+        pass
@@ -1,9 +1,11 @@
+import datetime
 import uuid
+from typing import Optional
 
 from application.users.dto import UserDTO, UserCreatedDTO
-from application.auth.dto import LoginRequestDTO, ChangePasswordDTO
+from application.auth.dto import LoginRequestDTO, ChangePasswordDTO, AuthPrincipal
 
-from application.auth.interfaces import ITokenService, IPasswordHasher
+from application.auth.interfaces import ITokenService, IPasswordHasher, IRevocationStore
 from application.uow.interfaces import IUnitOfWork
 from application.users.interfaces import IUserService
 
@@ -14,16 +16,20 @@ from application.auth.exceptions import IncorrectLoginData
 class AuthService:
 
     def __init__(self, token_service: ITokenService, user_service: IUserService,
-                 password_hasher: IPasswordHasher, uow: IUnitOfWork):
+                 password_hasher: IPasswordHasher, uow: IUnitOfWork,
+                 revocation_store: Optional[IRevocationStore] = None,
+                 require_token_version: bool = False):
 
         self.token_service = token_service
         self.password_hasher = password_hasher
         self.user_service = user_service
         self.uow = uow
+        self.revocation_store = revocation_store
+        self.require_token_version = require_token_version
 
     async def register(self, user_data:  UserDTO):
 
-        hashed_password = self.password_hasher.get_password_hash(user_data.password)
+        hashed_password = await self.password_hasher.get_password_hash(user_data.password)
 
 
         new_user = UserCreatedDTO(
@@ -33,9 +39,15 @@ class AuthService:
 
         created_user = await self.user_service.add_user(new_user)
 
-        token_data = {"sub": str(created_user.id)}
-        access_token = self.token_service.create_access_token(data=token_data)
-        refresh_token = self.token_service.create_refresh_token(data=token_data)
+        principal = AuthPrincipal(
+            id=created_user.id,
+            status_user=created_user.status_user,
+            platform_role=created_user.platform_role
+        )
+        access_token = self.token_service.create_access_token(data=principal.to_claims())
+        refresh_token = self.token_service.create_refresh_token(
+            data={"sub": str(created_user.id), "ver": principal.token_version}
+        )
 
         return access_token, refresh_token
 
@@ -46,20 +58,30 @@ class AuthService:
             user = await self.uow.users.get_user_by_email(login_data.email)
 
 
-        if not user or not self.password_hasher.verify_password(login_data.password, user.hashed_password):
+        if not user or not await self.password_hasher.verify_password(login_data.password, user.hashed_password):
             raise IncorrectLoginData("Incorrect password or email")
 
-        token_data = {"sub": str(user.id)}
-
-        access_token = self.token_service.create_access_token(data=token_data)
-        refresh_token = self.token_service.create_refresh_token(data=token_data)
+        access_token = self.token_service.create_access_token(data=AuthPrincipal.from_user(user).to_claims())
+        refresh_token = self.token_service.create_refresh_token(data={"sub": str(user.id), "ver": user.token_version})
 
         return access_token, refresh_token
 
 
     async def refresh_access_token(self, refresh_token: str) -> str:
 
-        user_id = self.token_service.get_user_id_by_refresh_token(refresh_token)
+        payload = self.token_service.decode_token(refresh_token)
+
+        if payload.get("type") != "refresh":
+            raise ValueError(f"Invalid token type: {payload.get('type')}")
+
+        jti = payload.get("jti")
+        if jti and self.revocation_store is not None and await self.revocation_store.is_revoked(jti):
+            raise ValueError("Refresh token has been revoked")
+
+        try:
+            user_id = uuid.UUID(payload.get("sub"))
+        except (TypeError, ValueError):
+            raise ValueError("Invalid subject in refresh token")
 
         async with self.uow:
             user = await self.uow.users.get_by_id(user_id)
@@ -67,13 +89,45 @@ class AuthService:
         if not user:
             raise NotFoundException("User were not found")
 
-        token_data = {"sub": str(user_id)}
+        # A password change or a forced logout also ends the refresh tokens issued before it
+        # Refresh tokens issued before ver was added pass until require_token_version is set
+        if "ver" not in payload:
+            if self.require_token_version:
+                raise ValueError("Refresh token has been invalidated")
+        elif payload["ver"] != user.token_version:
+            raise ValueError("Refresh token has been invalidated")
 
-        new_access_token = self.token_service.create_access_token(data=token_data)
+        new_access_token = self.token_service.create_access_token(data=AuthPrincipal.from_user(user).to_claims())
 
         return new_access_token
 
 
+    async def logout(self, *tokens: Optional[str]) -> None:
+        if self.revocation_store is None:
+            return
+
+        for token in tokens:
+            if not token:
+                continue
+
+            # A token that does not decode is not accepted anywhere, there is nothing to revoke
+            try:
+                payload = self.token_service.decode_token(token)
+            except ValueError:
+                continue
+
+            if not payload.get("jti") or not payload.get("exp"):
+                continue
+
+            try:
+                user_id = uuid.UUID(payload.get("sub"))
+            except (TypeError, ValueError):
+                user_id = None
+
+            expires_at = datetime.datetime.fromtimestamp(payload["exp"], tz=datetime.timezone.utc).replace(tzinfo=None)
+            await self.revocation_store.revoke(payload["jti"], user_id, expires_at)
+
+
     async def change_password(self, user_id: uuid.UUID, password_data: ChangePasswordDTO):
 
         async with self.uow:
@@ -81,12 +135,12 @@ class AuthService:
             if not user:
                 raise NotFoundException("User were not found")
 
-            check_password = self.password_hasher.verify_password(password_data.old_password, user.hashed_password)
+            check_password = await self.password_hasher.verify_password(password_data.old_password, user.hashed_password)
 
             if not check_password:
                 raise IncorrectLoginData("Incorrect old password")
 
-            new_hashed_password = self.password_hasher.get_password_hash(password_data.new_password)
+            new_hashed_password = await self.password_hasher.get_password_hash(password_data.new_password)
 
             user.change_password(new_hashed_password)
 
@@ -1,5 +1,6 @@
 import uuid
 from abc import ABC, abstractmethod
+from typing import List
 
 from application.shared.interfaces import IGenericRepository
 from domain.desired_project.model import DesiredProject
@@ -10,3 +11,7 @@ class IDesiredProjectRepository(IGenericRepository[DesiredProject], ABC):
     @abstractmethod
     async def count_desired_project_for_user(self, user_id: uuid.UUID) -> int:
         pass
+
+    @abstractmethod
+    async def get_by_user(self, user_id: uuid.UUID) -> List[DesiredProject]:
+        pass
@@ -0,0 +1,21 @@
+import uuid
+from typing import List, Set
+
+from pydantic import BaseModel, Field
+
+from domain.shared.enum import TechnologyEnum
+
+
+class ProjectMatchDTO(BaseModel):
+    project_id: uuid.UUID
+    score: float
+    technology_overlap: float
+    shared_technologies: Set[TechnologyEnum]
+    free_seats: int
+
+class DesiredProjectMatchesDTO(BaseModel):
+    desired_project_id: uuid.UUID
+    matches: List[ProjectMatchDTO]
+
+class MatchingFilterDTO(BaseModel):
+    limit: int = Field(20, ge=1, le=100)
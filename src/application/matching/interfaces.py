@@ -0,0 +1,36 @@
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+
+from domain.project.enum import StatusProjectEnum
+from domain.project.model import Project
+
+
+@dataclass(frozen=True)
+class ProjectMatch:
+    project_id: uuid.UUID
+    score: float
+    technology_overlap: float
+    technology_mask: int
+    free_seats: int
+
+
+class IMatchingIndex(ABC):
+
+    @abstractmethod
+    def rank(self, technology_mask: int, amount_of_people: Optional[int], limit: int,
+             exclude: Iterable[uuid.UUID] = ()) -> List[ProjectMatch]:
+        pass
+
+    @abstractmethod
+    def upsert(self, project_id: uuid.UUID, technology_mask: int, free_seats: int, is_open: bool) -> None:
+        pass
+
+    @abstractmethod
+    def remove(self, project_id: uuid.UUID) -> None:
+        pass
+
+    def upsert_project(self, project: Project) -> None:
+        self.upsert(project.id, project.technology_mask, project.free_seats,
+                    project.status == StatusProjectEnum.ACTIVE)
@@ -0,0 +1,41 @@
+import uuid
+from typing import List
+
+from application.matching.dto import DesiredProjectMatchesDTO, MatchingFilterDTO, ProjectMatchDTO
+from application.matching.interfaces import IMatchingIndex, ProjectMatch
+from application.uow.interfaces import IUnitOfWork
+
+from domain.desired_project.model import DesiredProject as DomainDesiredProject
+from domain.shared.tech_mask import from_mask
+
+
+class MatchingService:
+    def __init__(self, uow: IUnitOfWork, index: IMatchingIndex):
+        self.uow = uow
+        self.index = index
+
+    @staticmethod
+    def _to_dto(match: ProjectMatch, desired_mask: int) -> ProjectMatchDTO:
+        return ProjectMatchDTO(
+            project_id=match.project_id,
+            score=round(match.score, 4),
+            technology_overlap=round(match.technology_overlap, 4),
+            shared_technologies=from_mask(desired_mask & match.technology_mask),
+            free_seats=match.free_seats
+        )
+
+    def _match(self, desired_project: DomainDesiredProject, limit: int) -> DesiredProjectMatchesDTO:
+        desired_mask = desired_project.technology_mask
+        matches = self.index.rank(desired_mask, desired_project.amount_of_people, limit)
+
+        return DesiredProjectMatchesDTO(
+            desired_project_id=desired_project.id,
+            matches=[self._to_dto(match, desired_mask) for match in matches]
+        )
+
+
+    async def match_for_user(self, user_id: uuid.UUID, filters: MatchingFilterDTO) -> List[DesiredProjectMatchesDTO]:
+        async with self.uow.read_only():
+            desired_projects = await self.uow.desired_projects.get_by_user(user_id)
+
+        return [self._match(desired_project, filters.limit) for desired_project in desired_projects]
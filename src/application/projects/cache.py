@@ -0,0 +1,60 @@
+import functools
+import uuid
+from typing import Collection
+
+from application.projects.dto import ProjectDTO, ProjectFilterDTO, ProjectPageDTO
+from application.projects.services import ProjectService
+from application.shared.exceptions import NotModifiedException
+from application.shared.interfaces import IResponseCache
+from application.uow.interfaces import IUnitOfWork
+
+from domain.shared.events import DomainEvent, ProjectCreated, ProjectDeleted, ProjectUpdated
+
+PROJECT_LIST_NAMESPACE = "projects"
+
+
+def project_namespace(project_id: uuid.UUID) -> str:
+    return f"project:{project_id}"
+
+
+class CachedProjectService(ProjectService):
+
+    def __init__(self, uow: IUnitOfWork, cache: IResponseCache):
+        super().__init__(uow)
+        self.cache = cache
+
+    async def get_all_projects(self, filters: ProjectFilterDTO) -> ProjectPageDTO:
+        return await self.cache.get_or_load(
+            f"projects:page:{filters.model_dump_json()}",
+            [PROJECT_LIST_NAMESPACE],
+            ProjectPageDTO,
+            functools.partial(super().get_all_projects, filters)
+        )
+
+    async def get_project_by_id(self, project_id: uuid.UUID, known_versions: Collection[int] = ()) -> ProjectDTO:
+        project = await self.cache.get_or_load(
+            f"project:{project_id}",
+            [project_namespace(project_id)],
+            ProjectDTO,
+            functools.partial(super().get_project_by_id, project_id, known_versions),
+            variant=",".join(str(version) for version in sorted(known_versions))
+        )
+
+        if project.version in known_versions:
+            raise NotModifiedException(project.version)
+
+        return project
+
+
+class ProjectCacheInvalidator:
+    EVENTS = (ProjectCreated, ProjectUpdated, ProjectDeleted)
+
+    def __init__(self, cache: IResponseCache):
+        self.cache = cache
+
+    async def __call__(self, event: DomainEvent) -> None:
+        namespaces = [PROJECT_LIST_NAMESPACE]
+        if not isinstance(event, ProjectCreated):
+            namespaces.append(project_namespace(event.project_id))
+
+        await self.cache.invalidate(namespaces)
@@ -17,11 +17,32 @@ class ProjectDTO(BaseModel):
     url_project: Optional[str] = None
     status: StatusProjectEnum
     team_id: uuid.UUID
+    version: Optional[int] = None
 
     class Config:
         from_attributes = True
 
 
+        ### LISTING DTO ###
+class ProjectFilterDTO(BaseModel):
+    status: Optional[StatusProjectEnum] = None
+    team_id: Optional[uuid.UUID] = None
+    technology: Optional[TechnologyEnum] = None
+    any_technologies: Set[TechnologyEnum] = Field(default_factory=set)
+    all_technologies: Set[TechnologyEnum] = Field(default_factory=set)
+    cursor: Optional[str] = None
+    limit: int = Field(20, ge=1, le=100)
+
+class ProjectPageDTO(BaseModel):
+    items: List[ProjectDTO]
+    next_cursor: Optional[str] = None
+
+class ProjectSearchDTO(BaseModel):
+    query: str = Field(..., min_length=1, max_length=100)
+    cursor: Optional[str] = None
+    limit: int = Field(20, ge=1, le=100)
+
+
         ### CRUD DTO ###
 class ProjectCreateDTO(BaseModel):
     name: str = Field(..., min_length=3, max_length=100)
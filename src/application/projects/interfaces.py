@@ -1,9 +1,13 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Optional, Set
 
+from application.projects.dto import ProjectDTO
 from application.shared.interfaces import IGenericRepository
+from application.shared.pagination import KeysetCursor, Page, RankCursor
+from domain.project.enum import StatusProjectEnum
 from domain.project.model import Project
+from domain.shared.enum import TechnologyEnum
 
 
 class IProjectRepository(IGenericRepository[Project], ABC):
@@ -16,7 +20,45 @@ class IProjectRepository(IGenericRepository[Project], ABC):
     async def exists_project_by_name(self, name: str) -> bool:
         pass
 
+    @abstractmethod
+    async def try_add(self, entity: Project) -> bool:
+        pass
+
     @abstractmethod
     async def count_project_for_member(self, user_id: uuid.UUID) -> int:
         pass
 
+
+class IProjectQueries(ABC):
+
+    @abstractmethod
+    async def get_by_id(self, project_id: uuid.UUID) -> Optional[ProjectDTO]:
+        pass
+
+    @abstractmethod
+    async def get_version(self, project_id: uuid.UUID) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> Optional[ProjectDTO]:
+        pass
+
+    @abstractmethod
+    async def get_page(
+            self,
+            limit: int,
+            cursor: Optional[KeysetCursor] = None,
+            status: Optional[StatusProjectEnum] = None,
+            team_id: Optional[uuid.UUID] = None,
+            any_technologies: Optional[Set[TechnologyEnum]] = None,
+            all_technologies: Optional[Set[TechnologyEnum]] = None
+    ) -> Page[ProjectDTO]:
+        pass
+
+    @abstractmethod
+    async def search(self, text: str, limit: int, cursor: Optional[RankCursor] = None) -> Page[ProjectDTO]:
+        pass
+
+    @abstractmethod
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[ProjectDTO]:
+        pass
@@ -1,10 +1,13 @@
 import uuid
-from typing import List
+from typing import AsyncIterator, Collection, List
 
 from application.projects.dto import (
     ProjectCreateDTO,
     ProjectUpdateDTO,
     ProjectDTO,
+    ProjectFilterDTO,
+    ProjectPageDTO,
+    ProjectSearchDTO,
     BatchRemoveParticipantsDTO,
     BatchAddParticipantsDTO,
     SetProjectRolesDTO,
@@ -14,12 +17,15 @@ from application.projects.dto import (
     RemoveTechnologyDTO, AddTechnologyDTO
 )
 from domain.project.model import Project as DomainProject
-from domain.user.model import User as DomainUser
 from domain.project.enum import ProjectRoleEnum, StatusProjectEnum
+from domain.shared.events import ProjectCreated, ProjectDeleted, ProjectUpdated
 
+from application.auth.dto import AuthPrincipal
 from application.uow.interfaces import IUnitOfWork
+from application.shared.pagination import KeysetCursor, RankCursor
 
-from application.shared.exceptions import NotFoundException, AccessDeniedException, ValidationException
+from application.shared.exceptions import (NotFoundException, AccessDeniedException, ValidationException,
+                                           NotModifiedException, AlreadyExistsException)
 
 
 
@@ -45,27 +51,68 @@ class ProjectService:
         return project
 
 
-    async def get_all_projects(self) -> List[ProjectDTO]:
-        async with self.uow:
-            projects = await self.uow.projects.get()
-            return [ProjectDTO.from_domain(projects) for projects in projects]
+    async def get_all_projects(self, filters: ProjectFilterDTO) -> ProjectPageDTO:
+        cursor = KeysetCursor.decode(filters.cursor) if filters.cursor else None
 
-    async def get_project_by_id(self, project_id: uuid.UUID) -> ProjectDTO:
-        async with self.uow:
-            project = await self.uow.projects.get_by_id(project_id)
+        all_technologies = set(filters.all_technologies)
+        if filters.technology:
+            all_technologies.add(filters.technology)
+
+        async with self.uow.read_only():
+            page = await self.uow.project_queries.get_page(
+                limit=filters.limit,
+                cursor=cursor,
+                status=filters.status,
+                team_id=filters.team_id,
+                any_technologies=filters.any_technologies,
+                all_technologies=all_technologies
+            )
+
+            return ProjectPageDTO(
+                items=page.items,
+                next_cursor=page.next_cursor.encode() if page.next_cursor else None
+            )
+
+    async def search_projects(self, filters: ProjectSearchDTO) -> ProjectPageDTO:
+        cursor = RankCursor.decode(filters.cursor) if filters.cursor else None
+
+        async with self.uow.read_only():
+            page = await self.uow.project_queries.search(filters.query, filters.limit, cursor)
+
+            return ProjectPageDTO(
+                items=page.items,
+                next_cursor=page.next_cursor.encode() if page.next_cursor else None
+            )
+
+    async def export_projects(self) -> AsyncIterator[ProjectDTO]:
+        async with self.uow.read_only():
+            async for project in self.uow.project_queries.stream():
+                yield project
+
+    async def get_project_by_id(self, project_id: uuid.UUID, known_versions: Collection[int] = ()) -> ProjectDTO:
+        async with self.uow.read_only():
+            # A client that already holds the current version only costs a primary key lookup
+            if known_versions:
+                version = await self.uow.project_queries.get_version(project_id)
+                if version is None:
+                    raise NotFoundException("Project not found")
+                if version in known_versions:
+                    raise NotModifiedException(version)
+
+            project = await self.uow.project_queries.get_by_id(project_id)
             if not project:
                 raise NotFoundException("Project not found")
-            return ProjectDTO.from_domain(project)
+            return project
 
     async def get_project_by_name(self, name: str) -> ProjectDTO:
-        async with self.uow:
-            project = await self.uow.projects.get_project_by_name(name)
+        async with self.uow.read_only():
+            project = await self.uow.project_queries.get_by_name(name)
             if not project:
                 raise NotFoundException(f"Project with name '{name}' not found")
-            return ProjectDTO.from_domain(project)
+            return project
 
 
-    async def create_project(self, current_user: DomainUser, project_data: ProjectCreateDTO) -> ProjectDTO:
+    async def create_project(self, current_user: AuthPrincipal, project_data: ProjectCreateDTO) -> ProjectDTO:
         async with self.uow:
 
             team = await self.uow.teams.get_by_id(project_data.team_id)
@@ -75,9 +122,6 @@ class ProjectService:
             if not team.is_owner_or_maintainer(current_user.id):
                 raise AccessDeniedException("You must be a team member to create a project")
 
-            if await self.uow.projects.exists_project_by_name(project_data.name):
-                raise ValidationException(f"Project with name '{project_data.name}' already exists")
-
             new_project = DomainProject(
                 id=uuid.uuid4(),
                 name=project_data.name,
@@ -89,13 +133,17 @@ class ProjectService:
                 status=StatusProjectEnum.ACTIVE
             )
 
-            await self.uow.projects.add(new_project)
+            if not await self.uow.projects.try_add(new_project):
+                if await self.uow.projects.exists_project_by_name(project_data.name):
+                    raise AlreadyExistsException(f"Project with name '{project_data.name}' already exists")
+                raise AlreadyExistsException("Project with this logo already exists")
+            self.uow.emit(ProjectCreated(new_project.id))
 
             new_project = ProjectDTO.from_domain(new_project)
 
             return new_project
 
-    async def update_project(self, current_user: DomainUser, project_id: uuid.UUID,
+    async def update_project(self, current_user: AuthPrincipal, project_id: uuid.UUID,
                              update_data: ProjectUpdateDTO) -> ProjectDTO:
         async with self.uow:
             project = await self._get_project_and_check_permissions(
@@ -110,23 +158,25 @@ class ProjectService:
             project.update(**update_dict)
 
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
             project = ProjectDTO.from_domain(project)
 
             return project
 
-    async def delete_project(self, project_id: uuid.UUID, current_user: DomainUser):
+    async def delete_project(self, project_id: uuid.UUID, current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
             )
 
             await self.uow.projects.delete(project_id)
+            self.uow.emit(ProjectDeleted(project_id))
 
 
                             #### TECHNOLOGY METHOD ####
 
-    async def add_technology(self, dto: AddTechnologyDTO, current_user: DomainUser):
+    async def add_technology(self, dto: AddTechnologyDTO, current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 dto.project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
@@ -134,8 +184,9 @@ class ProjectService:
 
             project.add_technology(dto.technology)
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
-    async def remove_technology(self, dto: RemoveTechnologyDTO, current_user: DomainUser):
+    async def remove_technology(self, dto: RemoveTechnologyDTO, current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 dto.project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
@@ -143,8 +194,9 @@ class ProjectService:
 
             project.remove_technology(dto.technology)
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
-    async def set_technologies(self, dto: SetTechnologiesDTO, current_user: DomainUser):
+    async def set_technologies(self, dto: SetTechnologiesDTO, current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 dto.project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
@@ -152,12 +204,13 @@ class ProjectService:
 
             project.set_technologies(dto.technologies)
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
 
                             #### MANAGING PARTICIPANT'S ROLES ####
 
     async def assign_role_to_participant(self, project_id: uuid.UUID, dto: AssignProjectRoleDTO,
-                                         current_user: DomainUser):
+                                         current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
@@ -165,9 +218,10 @@ class ProjectService:
 
             project.assign_role_to_participant(dto.user_id, dto.role_to_assign)
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
     async def revoke_role_from_participant(self, project_id: uuid.UUID, dto: RevokeProjectRoleDTO,
-                                           current_user: DomainUser):
+                                           current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
@@ -175,8 +229,9 @@ class ProjectService:
 
             project.revoke_role_from_participant(dto.user_id, dto.role_to_revoke)
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
-    async def set_participant_roles(self, project_id: uuid.UUID, dto: SetProjectRolesDTO, current_user: DomainUser):
+    async def set_participant_roles(self, project_id: uuid.UUID, dto: SetProjectRolesDTO, current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 project_id, current_user.id, required_role=ProjectRoleEnum.MANAGER
@@ -184,11 +239,12 @@ class ProjectService:
 
             project.set_participant_roles(dto.user_id, dto.roles)
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
 
                             #### MANAGING PARTICIPANT ####
 
-    async def add_participants_batch(self, dto: BatchAddParticipantsDTO, current_user: DomainUser):
+    async def add_participants_batch(self, dto: BatchAddParticipantsDTO, current_user: AuthPrincipal):
 
         async with self.uow:
             project = await self._get_project_and_check_permissions(
@@ -198,8 +254,11 @@ class ProjectService:
             team = await self.uow.teams.get_by_id(project.team_id)
             if not team: raise NotFoundException("Parent team not found")
 
+            users_to_add = await self.uow.users.get_many(item.user_id for item in dto.participants)
+            users_by_id = {user.id: user for user in users_to_add}
+
             for item in dto.participants:
-                user_to_add = await self.uow.users.get_by_id(item.user_id)
+                user_to_add = users_by_id.get(item.user_id)
                 if not user_to_add:
                     raise NotFoundException(f"User {item.user_id} not found")
 
@@ -211,8 +270,9 @@ class ProjectService:
                 project.add_participant(user_to_add.id, item.roles)
 
             await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
 
-    async def remove_participants_batch(self, dto: BatchRemoveParticipantsDTO, current_user: DomainUser):
+    async def remove_participants_batch(self, dto: BatchRemoveParticipantsDTO, current_user: AuthPrincipal):
         async with self.uow:
             project = await self._get_project_and_check_permissions(
                 dto.project_id, current_user.id
@@ -234,4 +294,5 @@ class ProjectService:
 
                 project.remove_participant(user_id_to_remove)
 
-            await self.uow.projects.update(project)
\ No newline at end of file
+            await self.uow.projects.update(project)
+            self.uow.emit(ProjectUpdated(project.id))
@@ -14,3 +14,8 @@ class ValidationException(BaseHandleException):
 
 class AlreadyExistsException(BaseHandleException):
     pass
+
+class NotModifiedException(BaseHandleException):
+    def __init__(self, version: int):
+        self.version = version
+        super().__init__("Resource not modified")
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, List, Optional
+from typing import Any, Awaitable, Callable, TypeVar, Generic, Iterable, List, Optional, Sequence
 import uuid
 
+from domain.shared.events import DomainEvent
+
 T = TypeVar('T')
+R = TypeVar('R')
 
 class IGenericRepository(Generic[T], ABC):
 
@@ -24,4 +27,23 @@ class IGenericRepository(Generic[T], ABC):
 
     @abstractmethod
     async def delete(self, id: uuid.UUID) -> None:
-        pass
\ No newline at end of file
+        pass
+
+
+class IEventPublisher(ABC):
+
+    @abstractmethod
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        pass
+
+
+class IResponseCache(ABC):
+
+    @abstractmethod
+    async def get_or_load(self, key: str, namespaces: Sequence[str], response_type: Any,
+                          loader: Callable[[], Awaitable[R]], variant: str = "") -> R:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, namespaces: Iterable[str]) -> None:
+        pass
@@ -0,0 +1,58 @@
+import base64
+import binascii
+import datetime
+import json
+import uuid
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar, Union
+
+from application.shared.exceptions import ValidationException
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    created_at: datetime.datetime
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        raw = json.dumps([self.created_at.isoformat(), str(self.id)]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> 'KeysetCursor':
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            created_at, id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(created_at=datetime.datetime.fromisoformat(created_at), id=uuid.UUID(id))
+
+        except (binascii.Error, ValueError, TypeError):
+            raise ValidationException("Invalid pagination cursor")
+
+
+@dataclass(frozen=True)
+class RankCursor:
+    # Position in a relevance ordered listing: rank descending, then id
+    rank: float
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        raw = json.dumps([self.rank, str(self.id)]).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> 'RankCursor':
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            rank, id = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(rank=float(rank), id=uuid.UUID(id))
+
+        except (binascii.Error, ValueError, TypeError):
+            raise ValidationException("Invalid pagination cursor")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[Union[KeysetCursor, RankCursor]] = None
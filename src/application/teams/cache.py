@@ -0,0 +1,60 @@
+import functools
+import uuid
+from typing import Collection, List
+
+from application.shared.exceptions import NotModifiedException
+from application.shared.interfaces import IResponseCache
+from application.teams.dto import TeamDTO
+from application.teams.services import TeamService
+from application.uow.interfaces import IUnitOfWork
+
+from domain.shared.events import DomainEvent, TeamCreated, TeamDeleted, TeamUpdated
+
+TEAM_LIST_NAMESPACE = "teams"
+
+
+def team_namespace(team_id: uuid.UUID) -> str:
+    return f"team:{team_id}"
+
+
+class CachedTeamService(TeamService):
+
+    def __init__(self, uow: IUnitOfWork, cache: IResponseCache):
+        super().__init__(uow)
+        self.cache = cache
+
+    async def get_all_teams(self) -> List[TeamDTO]:
+        return await self.cache.get_or_load(
+            "teams:all",
+            [TEAM_LIST_NAMESPACE],
+            List[TeamDTO],
+            super().get_all_teams
+        )
+
+    async def get_team_by_id(self, team_id: uuid.UUID, known_versions: Collection[int] = ()) -> TeamDTO:
+        team = await self.cache.get_or_load(
+            f"team:{team_id}",
+            [team_namespace(team_id)],
+            TeamDTO,
+            functools.partial(super().get_team_by_id, team_id, known_versions),
+            variant=",".join(str(version) for version in sorted(known_versions))
+        )
+
+        if team.version in known_versions:
+            raise NotModifiedException(team.version)
+
+        return team
+
+
+class TeamCacheInvalidator:
+    EVENTS = (TeamCreated, TeamUpdated, TeamDeleted)
+
+    def __init__(self, cache: IResponseCache):
+        self.cache = cache
+
+    async def __call__(self, event: DomainEvent) -> None:
+        namespaces = [TEAM_LIST_NAMESPACE]
+        if not isinstance(event, TeamCreated):
+            namespaces.append(team_namespace(event.team_id))
+
+        await self.cache.invalidate(namespaces)
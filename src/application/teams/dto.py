@@ -11,10 +11,21 @@ class TeamDTO(BaseModel):
     name: constr(min_length=3, max_length=50)
     description: constr(min_length=10, max_length=500)
     avatar_url: Optional[constr(min_length=10, max_length=500)] = None
+    version: Optional[int] = None
 
     class Config:
         from_attributes = True
 
+        ### LISTING DTO ###
+class TeamPageDTO(BaseModel):
+    items: List[TeamDTO]
+    next_cursor: Optional[str] = None
+
+class TeamSearchDTO(BaseModel):
+    query: str = Field(..., min_length=1, max_length=100)
+    cursor: Optional[str] = None
+    limit: int = Field(20, ge=1, le=100)
+
 class TeamCreateDTO(BaseModel):
     name: constr(min_length=3, max_length=50)
     description: constr(min_length=10, max_length=500)
@@ -1,8 +1,10 @@
 import uuid
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterator, Dict, Iterable, List, Optional
 
 from application.shared.interfaces import IGenericRepository
+from application.shared.pagination import Page, RankCursor
+from application.teams.dto import TeamDTO
 from domain.team.model import Team
 
 
@@ -16,6 +18,10 @@ class ITeamRepository(IGenericRepository[Team], ABC):
     async def exists_team_by_name(self, name: str) -> bool:
         pass
 
+    @abstractmethod
+    async def try_add(self, entity: Team) -> bool:
+        pass
+
     @abstractmethod
     async def is_user_owner_any_team(self, user: uuid.UUID) -> bool:
         pass
@@ -24,3 +30,33 @@ class ITeamRepository(IGenericRepository[Team], ABC):
     async def count_teams_for_member(self, user_id: uuid.UUID) -> int:
         pass
 
+    @abstractmethod
+    async def count_teams_for_members(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, int]:
+        pass
+
+
+class ITeamQueries(ABC):
+
+    @abstractmethod
+    async def get(self) -> List[TeamDTO]:
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, team_id: uuid.UUID) -> Optional[TeamDTO]:
+        pass
+
+    @abstractmethod
+    async def get_version(self, team_id: uuid.UUID) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def get_by_name(self, name: str) -> Optional[TeamDTO]:
+        pass
+
+    @abstractmethod
+    async def search(self, text: str, limit: int, cursor: Optional[RankCursor] = None) -> Page[TeamDTO]:
+        pass
+
+    @abstractmethod
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[TeamDTO]:
+        pass
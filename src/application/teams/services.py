@@ -1,19 +1,24 @@
 import uuid
-from typing import List
+from typing import AsyncIterator, Collection, List
 
 from application.teams.dto import (
     TeamDTO,
+    TeamPageDTO,
+    TeamSearchDTO,
     UpdateTeamDTO,
     AssignRoleDTO,
     BatchAddPMemberTeamDTO,
     BatchRemoveMemberTeamDTO
 )
+from application.auth.dto import AuthPrincipal
 from application.uow.interfaces import IUnitOfWork
+from application.shared.pagination import RankCursor
 
-from domain.user.model import User as DomainUser
 from domain.team.model import Team as DomainTeam
+from domain.shared.events import TeamCreated, TeamDeleted, TeamUpdated
 
-from application.shared.exceptions import NotFoundException, AccessDeniedException, ValidationException
+from application.shared.exceptions import (NotFoundException, AccessDeniedException, ValidationException,
+                                           NotModifiedException, AlreadyExistsException)
 from application.teams.exceptions import TooManyTeamException
 
 
@@ -23,7 +28,7 @@ class TeamService:
         self.MAX_AMOUNT_OF_TEAMS = 3
 
     async def _receive_team_and_check_permissions(self, team_id: uuid.UUID,
-                                                  current_user: DomainUser) -> DomainTeam:
+                                                  current_user: AuthPrincipal) -> DomainTeam:
         team = await self.uow.teams.get_by_id(team_id)
         if team is None:
             raise NotFoundException("Team not found")
@@ -35,32 +40,51 @@ class TeamService:
 
 
     async def get_all_teams(self) -> List[TeamDTO]:
-        async with self.uow:
-            teams = await self.uow.teams.get()
-            return [TeamDTO.from_domain(team) for team in teams]
+        async with self.uow.read_only():
+            return await self.uow.team_queries.get()
 
-    async def get_team_by_id(self, team_id: uuid.UUID) -> TeamDTO:
-        async with self.uow:
-            team = await self.uow.teams.get_by_id(team_id)
+    async def search_teams(self, filters: TeamSearchDTO) -> TeamPageDTO:
+        cursor = RankCursor.decode(filters.cursor) if filters.cursor else None
+
+        async with self.uow.read_only():
+            page = await self.uow.team_queries.search(filters.query, filters.limit, cursor)
+
+            return TeamPageDTO(
+                items=page.items,
+                next_cursor=page.next_cursor.encode() if page.next_cursor else None
+            )
+
+    async def export_teams(self) -> AsyncIterator[TeamDTO]:
+        async with self.uow.read_only():
+            async for team in self.uow.team_queries.stream():
+                yield team
+
+    async def get_team_by_id(self, team_id: uuid.UUID, known_versions: Collection[int] = ()) -> TeamDTO:
+        async with self.uow.read_only():
+            # A client that already holds the current version only costs a primary key lookup
+            if known_versions:
+                version = await self.uow.team_queries.get_version(team_id)
+                if version is None:
+                    raise NotFoundException("Team not found")
+                if version in known_versions:
+                    raise NotModifiedException(version)
+
+            team = await self.uow.team_queries.get_by_id(team_id)
             if not team:
                 raise NotFoundException("Team not found")
-            return TeamDTO.from_domain(team)
+            return team
 
     async def get_team_by_name(self, name: str) -> TeamDTO:
-        async with self.uow:
-            project = await self.uow.teams.get_team_by_name(name)
-            if not project:
+        async with self.uow.read_only():
+            team = await self.uow.team_queries.get_by_name(name)
+            if not team:
                 raise NotFoundException(f"Team with name '{name}' not found")
-            return TeamDTO.from_domain(project)
+            return team
 
 
-    async def create_team(self, current_user: DomainUser, team_data: TeamDTO) -> TeamDTO:
+    async def create_team(self, current_user: AuthPrincipal, team_data: TeamDTO) -> TeamDTO:
 
         async with self.uow:
-            is_exiting_team_name = await self.uow.teams.exists_team_by_name(team_data.name)
-            if is_exiting_team_name:
-                raise ValidationException("Team with this name already exists")
-
             count_team_membership_user = await self.uow.teams.count_teams_for_member(current_user.id)
             if count_team_membership_user >= self.MAX_AMOUNT_OF_TEAMS:
                 raise TooManyTeamException(f"User cannot be a member of more than {self.MAX_AMOUNT_OF_TEAMS} teams.")
@@ -73,13 +97,17 @@ class TeamService:
                 owner_id=current_user.id
             )
 
-            await self.uow.teams.add(new_team)
+            if not await self.uow.teams.try_add(new_team):
+                if await self.uow.teams.exists_team_by_name(team_data.name):
+                    raise AlreadyExistsException("Team with this name already exists")
+                raise AlreadyExistsException("Team with this logo already exists")
+            self.uow.emit(TeamCreated(new_team.id))
 
             new_team = TeamDTO.from_domain(new_team)
             return new_team
 
 
-    async def update_team(self, current_user: DomainUser, team_id: uuid.UUID,
+    async def update_team(self, current_user: AuthPrincipal, team_id: uuid.UUID,
                           team_data_to_update: UpdateTeamDTO) -> DomainTeam:
         async with self.uow:
             team = await self._receive_team_and_check_permissions(team_id, current_user)
@@ -95,13 +123,14 @@ class TeamService:
             team.update(**updated_team_data)
 
             await self.uow.teams.update(team)
+            self.uow.emit(TeamUpdated(team.id))
 
             team = TeamDTO.from_domain(team)
 
             return team
 
 
-    async def delete_team(self, current_user: DomainUser, team_id: uuid.UUID):
+    async def delete_team(self, current_user: AuthPrincipal, team_id: uuid.UUID):
 
         async with self.uow:
             team = await self.uow.teams.get_by_id(team_id)
@@ -115,31 +144,37 @@ class TeamService:
             # TODO - Add logic to change status project on Freeze or smth like that using domain events
 
             await self.uow.teams.delete(team_id)
+            self.uow.emit(TeamDeleted(team_id))
 
 
     async def add_members_batch(self, dto: BatchAddPMemberTeamDTO,
-                         current_user: DomainUser):
+                         current_user: AuthPrincipal):
 
         async with self.uow:
             team = await self._receive_team_and_check_permissions(dto.team_id, current_user)
 
+            user_ids = [user_dto_to_add.user_id for user_dto_to_add in dto.members]
+
+            users_by_id = {user.id: user for user in await self.uow.users.get_many(user_ids)}
+            team_counts = await self.uow.teams.count_teams_for_members(user_ids)
+
             for user_dto_to_add in dto.members:
 
-                user_to_add = await self.uow.users.get_by_id(user_dto_to_add.user_id)
+                user_to_add = users_by_id.get(user_dto_to_add.user_id)
                 if user_to_add is None:
                     raise NotFoundException('User to add not found')
 
-                count_team_membership_user = await self.uow.teams.count_teams_for_member(user_dto_to_add.user_id)
-                if count_team_membership_user >= self.MAX_AMOUNT_OF_TEAMS:
+                if team_counts[user_to_add.id] >= self.MAX_AMOUNT_OF_TEAMS:
                     raise TooManyTeamException(f"User cannot be a member of more than {self.MAX_AMOUNT_OF_TEAMS} teams.")
 
                 team.add_member(user_to_add.id, user_dto_to_add.roles)
 
             await self.uow.teams.update(team)
+            self.uow.emit(TeamUpdated(team.id))
 
 
     async def remove_members_batch(self, dto: BatchRemoveMemberTeamDTO,
-                            current_user: DomainUser):
+                            current_user: AuthPrincipal):
 
         async with self.uow:
             team = await self.uow.teams.get_by_id(dto.team_id)
@@ -157,9 +192,10 @@ class TeamService:
                 team.remove_member(user_id_to_remove)
 
             await self.uow.teams.update(team)
+            self.uow.emit(TeamUpdated(team.id))
 
 
-    async def assign_role_to_team_member(self, team_id: uuid.UUID, user_data: AssignRoleDTO, current_user: DomainUser):
+    async def assign_role_to_team_member(self, team_id: uuid.UUID, user_data: AssignRoleDTO, current_user: AuthPrincipal):
         async with self.uow:
 
             team = await self._receive_team_and_check_permissions(team_id, current_user)
@@ -167,9 +203,10 @@ class TeamService:
             team.assign_role_to_member(user_data.user_id, user_data.role)
 
             await self.uow.teams.update(team)
+            self.uow.emit(TeamUpdated(team.id))
 
 
-    async def revoke_role_from_team_member(self, team_id: uuid.UUID, user_data: AssignRoleDTO, current_user: DomainUser):
+    async def revoke_role_from_team_member(self, team_id: uuid.UUID, user_data: AssignRoleDTO, current_user: AuthPrincipal):
         async with self.uow:
 
             team = await self._receive_team_and_check_permissions(team_id, current_user)
@@ -177,9 +214,10 @@ class TeamService:
             team.revoke_role_from_member(user_data.user_id, user_data.role)
 
             await self.uow.teams.update(team)
+            self.uow.emit(TeamUpdated(team.id))
 
 
-    async def set_roles_to_team_member(self, team_id: uuid.UUID, user_data: AssignRoleDTO, current_user: DomainUser):
+    async def set_roles_to_team_member(self, team_id: uuid.UUID, user_data: AssignRoleDTO, current_user: AuthPrincipal):
         async with self.uow:
 
             team = await self._receive_team_and_check_permissions(team_id, current_user)
@@ -187,4 +225,5 @@ class TeamService:
             team.set_member_roles(user_data.user_id, user_data.role)
 
             await self.uow.teams.update(team)
+            self.uow.emit(TeamUpdated(team.id))
 
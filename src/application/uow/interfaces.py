@@ -1,14 +1,23 @@
 from abc import ABC, abstractmethod
+from typing import Callable
 
-from application.projects.interfaces import IProjectRepository
-from application.teams.interfaces import ITeamRepository
+from application.desired_projects.interfaces import IDesiredProjectRepository
+from application.projects.interfaces import IProjectQueries, IProjectRepository
+from application.teams.interfaces import ITeamQueries, ITeamRepository
 from application.users.interfaces import IUserRepository
+from domain.shared.events import DomainEvent
 
 
 class IUnitOfWork(ABC):
     users: IUserRepository
     teams: ITeamRepository
     projects: IProjectRepository
+    desired_projects: IDesiredProjectRepository
+    project_queries: IProjectQueries
+    team_queries: ITeamQueries
+
+    def read_only(self) -> 'IUnitOfWork':
+        return self
 
     async def __aenter__(self):
         return self
@@ -25,4 +34,12 @@ class IUnitOfWork(ABC):
 
     @abstractmethod
     async def rollback(self):
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+    @abstractmethod
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def emit(self, event: DomainEvent) -> None:
+        raise NotImplementedError
@@ -1,9 +1,11 @@
 from typing import Literal, Optional, List
+import datetime
 import uuid
 
 from pydantic import BaseModel, EmailStr, constr
 
 from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+from domain.user.model import User as DomainUser
 
 
 class UserDTO(BaseModel):
@@ -16,6 +18,33 @@ class UserDTO(BaseModel):
     class Config:
         from_attributes = True
 
+class UserResponseDTO(BaseModel):
+    id: uuid.UUID
+    username: str
+    email: str
+    avatar_url: Optional[str] = None
+    github_url: Optional[str] = None
+    linkedin_url: Optional[str] = None
+    status_user: Optional[StatusUserEnum] = None
+    platform_role: List[PlatformRoleEnum]
+    created_at: Optional[datetime.datetime] = None
+    version: Optional[int] = None
+
+    @classmethod
+    def from_domain(cls, user: DomainUser) -> 'UserResponseDTO':
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            avatar_url=user.avatar_url,
+            github_url=user.github_url,
+            linkedin_url=user.linkedin_url,
+            status_user=user.status_user,
+            platform_role=user.platform_role,
+            created_at=user.created_at,
+            version=user.version
+        )
+
 class UserCreatedDTO(BaseModel):
     username: constr(min_length=3, max_length=50)
     hashed_password: constr(min_length=8)
@@ -1,4 +1,6 @@
+import uuid
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Iterable, List, Optional
 
 from application.shared.interfaces import IGenericRepository
 from domain.user.model import User
@@ -20,6 +22,22 @@ class IUserRepository(IGenericRepository[User], ABC):
     async def exists_by_username(self, username: str) -> User:
         pass
 
+    @abstractmethod
+    async def try_add(self, entity: User) -> bool:
+        pass
+
     @abstractmethod
     async def get_user_by_email(self, email: str) -> User:
         pass
+
+    @abstractmethod
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        pass
+
+    @abstractmethod
+    async def get_many(self, user_ids: Iterable[uuid.UUID]) -> List[User]:
+        pass
+
+    @abstractmethod
+    async def get_version(self, user_id: uuid.UUID) -> Optional[int]:
+        pass
@@ -1,10 +1,11 @@
 import uuid
-from typing import List
+from typing import AsyncIterator, Collection, List
 
 from application.uow.interfaces import IUnitOfWork
 from application.users.interfaces import IUserService
-from application.users.dto import UserUpdateDTO, UserCreatedDTO, UserDTO
-from application.shared.exceptions import AlreadyExistsException, NotFoundException
+from application.users.dto import UserUpdateDTO, UserCreatedDTO, UserResponseDTO
+from application.shared.exceptions import AlreadyExistsException, NotFoundException, NotModifiedException
+from application.auth.dto import AuthPrincipal
 
 from domain.user.enum import StatusUserEnum
 from domain.user.model import User as DomainUser
@@ -14,30 +15,34 @@ class UserService(IUserService):
     def __init__(self, uow: IUnitOfWork):
         self.uow = uow
 
-    async def get_all_users(self) -> List[UserDTO]:
-        async with self.uow:
+    async def get_all_users(self) -> List[UserResponseDTO]:
+        async with self.uow.read_only():
             users = await self.uow.users.get()
-            return [UserDTO.from_domain(user) for user in users]
+            return [UserResponseDTO.from_domain(user) for user in users]
+
+    async def export_users(self) -> AsyncIterator[UserResponseDTO]:
+        async with self.uow.read_only():
+            async for user in self.uow.users.stream():
+                yield UserResponseDTO.from_domain(user)
+
+    async def get_user_by_id(self, user_id: uuid.UUID, known_versions: Collection[int] = ()) -> UserResponseDTO:
+        async with self.uow.read_only():
+            if known_versions:
+                version = await self.uow.users.get_version(user_id)
+                if version is None:
+                    raise NotFoundException("User not found")
+                if version in known_versions:
+                    raise NotModifiedException(version)
 
-    async def get_user_by_id(self, user_id: uuid.UUID) -> UserDTO:
-        async with self.uow:
             user = await self.uow.users.get_by_id(user_id)
             if not user:
                 raise NotFoundException("Project not found")
-            return UserDTO.from_domain(user)
+            return UserResponseDTO.from_domain(user)
 
 
     async def add_user(self, user_data: UserCreatedDTO) -> DomainUser:
 
         async with self.uow:
-            is_name_exist = await self.uow.users.exists_by_username(user_data.username)
-            if is_name_exist:
-                raise AlreadyExistsException(f'User with this username {user_data.username} already exists')
-
-            is_email_exist = await self.uow.users.exists_by_email(user_data.username)
-            if is_email_exist:
-                raise AlreadyExistsException(f'User with this email {user_data.username} already exists')
-
             new_user = DomainUser(
                 id=uuid.uuid4(),
                 username=user_data.username,
@@ -47,14 +52,18 @@ class UserService(IUserService):
                 platform_role=user_data.platform_role
             )
 
-            created_user = await self.uow.users.add(new_user)
+            if not await self.uow.users.try_add(new_user):
+                # Only the conflicting path pays for a lookup, to tell which unique field clashed
+                if await self.uow.users.exists_by_username(user_data.username):
+                    raise AlreadyExistsException(f'User with this username {user_data.username} already exists')
+                raise AlreadyExistsException(f'User with this email {user_data.email} already exists')
 
-            user = UserDTO.from_domain(created_user)
+            user = UserResponseDTO.from_domain(new_user)
 
             return user
 
 
-    async def update_user(self, current_user: DomainUser, user_data_to_update: UserUpdateDTO) -> DomainUser:
+    async def update_user(self, current_user: AuthPrincipal, user_data_to_update: UserUpdateDTO) -> DomainUser:
         async with self.uow:
             user = await self.uow.users.get_by_id(current_user.id)
 
@@ -80,7 +89,7 @@ class UserService(IUserService):
 
             await self.uow.users.update(user)
 
-            user = UserDTO.from_domain(user)
+            user = UserResponseDTO.from_domain(user)
 
             return user
 
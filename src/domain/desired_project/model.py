@@ -1,6 +1,7 @@
 import uuid
 from typing import Optional, Set
 
+from domain.shared.change_tracking import ChangeLog
 from domain.shared.enum import TechnologyEnum
 from domain.shared.value_object import TechValueObject
 
@@ -19,11 +20,26 @@ class DesiredProject:
             raise ValueError("Desired amount of people cannot be negative")
         self.amount_of_people = amount_of_people
 
-        self.tech_profile = TechValueObject(
+        self.tech_profile = TechValueObject.from_technologies(
             description=description,
             technologies=initial_stack_technologies
         )
 
+        self._changes = ChangeLog()
+
+    @classmethod
+    def _reconstitute(cls, id: uuid.UUID, owner_id: uuid.UUID, amount_of_people: Optional[int],
+                      tech_profile: TechValueObject):
+        instance = cls.__new__(cls)
+
+        instance.id = id
+        instance.owner_id = owner_id
+        instance.amount_of_people = amount_of_people
+        instance.tech_profile = tech_profile
+        instance._changes = ChangeLog()
+
+        return instance
+
     @property
     def description(self) -> str:
         return self.tech_profile.description
@@ -32,22 +48,37 @@ class DesiredProject:
     def stack_technologies(self) -> Set[TechnologyEnum]:
         return self.tech_profile.technologies
 
+    @property
+    def technology_mask(self) -> int:
+        return self.tech_profile.technology_mask
+
+    @property
+    def changes(self) -> ChangeLog:
+        return self._changes
+
 
     def update(self, description: str, amount_of_people: int | None):
-        if description:
+        if description and description != self.description:
             self.tech_profile = self.tech_profile.with_description(description)
+            self._changes.touch("description")
 
         if amount_of_people:
             if amount_of_people < 0:
                 raise ValueError("Desired amount of people cannot be negative")
-            self.amount_of_people = amount_of_people
+            if amount_of_people != self.amount_of_people:
+                self.amount_of_people = amount_of_people
+                self._changes.touch("amount_of_people")
 
 
     def add_technology(self, technology: TechnologyEnum):
         self.tech_profile = self.tech_profile.with_add_tech(technology)
+        self._changes.add_technology(technology)
 
     def remove_technology(self, technology: TechnologyEnum):
         self.tech_profile = self.tech_profile.with_remove_tech(technology)
+        self._changes.remove_technology(technology)
 
     def set_technologies(self, technologies: Set[TechnologyEnum]):
-        self.tech_profile = self.tech_profile.with_set_tech(technologies)
\ No newline at end of file
+        old_technologies = self.stack_technologies
+        self.tech_profile = self.tech_profile.with_set_tech(technologies)
+        self._changes.set_technologies(old_technologies, technologies)
@@ -3,6 +3,7 @@ import uuid
 from typing import Set, Dict, List, Optional
 
 from domain.project.enum import ProjectRoleEnum, StatusProjectEnum
+from domain.shared.change_tracking import ChangeLog
 from domain.shared.enum import TechnologyEnum
 from domain.shared.value_object import TechValueObject
 
@@ -13,6 +14,8 @@ class ProjectParticipant:
 
 
 class Project:
+    MAX_PARTICIPANTS = 11
+
     def __init__(
         self,
         id: uuid.UUID,
@@ -32,7 +35,7 @@ class Project:
         self.url_project = url_project
         self.team_id = team_id
 
-        self.tech_profile = TechValueObject(
+        self.tech_profile = TechValueObject.from_technologies(
             description=description,
             technologies=initial_stack_technologies
         )
@@ -41,6 +44,8 @@ class Project:
             manager_id: ProjectParticipant(user_id=manager_id, roles={ProjectRoleEnum.MANAGER})
         }
 
+        self._changes = ChangeLog()
+
     @classmethod
     def _reconstitute(
         cls,
@@ -62,6 +67,7 @@ class Project:
         instance.team_id = team_id
         instance._participants = participants
         instance.tech_profile = tech_profile
+        instance._changes = ChangeLog()
         return instance
 
 
@@ -73,6 +79,10 @@ class Project:
     def stack_technologies(self) -> Set[TechnologyEnum]:
         return self.tech_profile.technologies
 
+    @property
+    def technology_mask(self) -> int:
+        return self.tech_profile.technology_mask
+
     @property
     def manager_id(self) -> uuid.UUID | None:
         for user_id, project_participant in self._participants.items():
@@ -84,6 +94,19 @@ class Project:
     def participants(self) -> List[ProjectParticipant]:
         return list(self._participants.values())
 
+    @property
+    def free_seats(self) -> int:
+        return max(self.MAX_PARTICIPANTS - len(self._participants), 0)
+
+    @property
+    def changes(self) -> ChangeLog:
+        return self._changes
+
+    def _set_field(self, name: str, value) -> None:
+        if getattr(self, name) != value:
+            setattr(self, name, value)
+            self._changes.touch(name)
+
 
     def update(
         self,
@@ -93,13 +116,14 @@ class Project:
         description: Optional[str] = None
     ):
         if name:
-            self.name = name
+            self._set_field("name", name)
         if url_project:
-            self.url_project = url_project
+            self._set_field("url_project", url_project)
         if logo:
-            self.logo = logo
-        if description:
+            self._set_field("logo", logo)
+        if description and description != self.description:
             self.tech_profile = self.tech_profile.with_description(description)
+            self._changes.touch("description")
 
     def get_participant(self, participant_id: uuid.UUID) -> ProjectParticipant | None:
         return self._participants.get(participant_id)
@@ -124,10 +148,11 @@ class Project:
             raise ValueError("Cannot add a participant with no roles.")
         if ProjectRoleEnum.MANAGER in roles:
             raise ValueError("Cannot add another manager to the team.")
-        if len(self._participants) > 10:
-            raise ValueError("Cannot add more than 10 participants.")
+        if len(self._participants) >= self.MAX_PARTICIPANTS:
+            raise ValueError(f"Cannot add more than {self.MAX_PARTICIPANTS - 1} participants.")
 
         self._participants[user_id_to_add] = ProjectParticipant(user_id=user_id_to_add, roles=roles)
+        self._changes.add_member(user_id_to_add)
 
     def remove_participant(self, user_id_to_remove: uuid.UUID):
 
@@ -138,16 +163,21 @@ class Project:
             raise ValueError("The project manager cannot be removed.")
 
         del self._participants[user_id_to_remove]
+        self._changes.remove_member(user_id_to_remove)
 
 
     def add_technology(self, technology: TechnologyEnum):
         self.tech_profile = self.tech_profile.with_add_tech(technology)
+        self._changes.add_technology(technology)
 
     def remove_technology(self, technology: TechnologyEnum):
         self.tech_profile = self.tech_profile.with_remove_tech(technology)
+        self._changes.remove_technology(technology)
 
     def set_technologies(self, technologies: Set[TechnologyEnum]):
+        old_technologies = self.stack_technologies
         self.tech_profile = self.tech_profile.with_set_tech(technologies)
+        self._changes.set_technologies(old_technologies, technologies)
 
 
     def assign_role_to_participant(self, user_id: uuid.UUID, role_to_add: ProjectRoleEnum):
@@ -161,7 +191,9 @@ class Project:
         if len(participant.roles) >= 4:
             raise ValueError("The roles limit for a single participant has been reached")
 
-        participant.roles.add(role_to_add)
+        if role_to_add not in participant.roles:
+            participant.roles.add(role_to_add)
+            self._changes.re_role_member(user_id)
         print(f"Role '{role_to_add.value}' assigned to user {user_id}.")
 
     def revoke_role_from_participant(self, user_id: uuid.UUID, role_to_remove: ProjectRoleEnum):
@@ -176,6 +208,7 @@ class Project:
             raise ValueError("User does not have that role.")
 
         participant.roles.remove(role_to_remove)
+        self._changes.re_role_member(user_id)
         print(f"Role '{role_to_remove.value}' revoked from user {user_id}.")
 
     def set_participant_roles(self, user_id: uuid.UUID, new_roles: Set[ProjectRoleEnum]):
@@ -191,8 +224,10 @@ class Project:
         if len(new_roles) > 5:
             raise ValueError("A participant must have at most 5 roles.")
 
-        participant.roles.clear()
-        participant.roles.update(new_roles)
+        if participant.roles != new_roles:
+            participant.roles.clear()
+            participant.roles.update(new_roles)
+            self._changes.re_role_member(user_id)
         print(f"Roles for user {user_id} set to: {[r.value for r in new_roles]}")
 
     def change_status(self, new_status: StatusProjectEnum):
@@ -201,4 +236,5 @@ class Project:
         if new_status == StatusProjectEnum.COMPLETED.value:
             raise ValueError("Cannot change status of project when it is completed.")
 
-        self.status = new_status
\ No newline at end of file
+        self.status = new_status
+        self._changes.touch("status")
\ No newline at end of file
@@ -0,0 +1,80 @@
+import uuid
+from dataclasses import dataclass, field
+from typing import Hashable, Iterable, Set
+
+from domain.shared.enum import TechnologyEnum
+
+
+@dataclass
+class ChangeLog:
+    fields: Set[str] = field(default_factory=set)
+
+    added_members: Set[uuid.UUID] = field(default_factory=set)
+    removed_members: Set[uuid.UUID] = field(default_factory=set)
+    re_roled_members: Set[uuid.UUID] = field(default_factory=set)
+
+    added_technologies: Set[TechnologyEnum] = field(default_factory=set)
+    removed_technologies: Set[TechnologyEnum] = field(default_factory=set)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.fields or self.added_members or self.removed_members or self.re_roled_members
+                    or self.added_technologies or self.removed_technologies)
+
+
+    def touch(self, field_name: str) -> None:
+        self.fields.add(field_name)
+
+
+    def add_member(self, user_id: uuid.UUID) -> None:
+        # Removed and added back in one unit of work, the row is still there and only its role may differ
+        if user_id in self.removed_members:
+            self.removed_members.discard(user_id)
+            self.re_roled_members.add(user_id)
+        else:
+            self.added_members.add(user_id)
+
+    def remove_member(self, user_id: uuid.UUID) -> None:
+        self.re_roled_members.discard(user_id)
+
+        if user_id in self.added_members:
+            self.added_members.discard(user_id)
+        else:
+            self.removed_members.add(user_id)
+
+    def re_role_member(self, user_id: uuid.UUID) -> None:
+        # A member added in this unit of work is inserted with its final roles anyway
+        if user_id not in self.added_members:
+            self.re_roled_members.add(user_id)
+
+
+    def add_technology(self, technology: TechnologyEnum) -> None:
+        self._toggle(technology, self.added_technologies, self.removed_technologies)
+
+    def remove_technology(self, technology: TechnologyEnum) -> None:
+        self._toggle(technology, self.removed_technologies, self.added_technologies)
+
+    def set_technologies(self, old: Iterable[TechnologyEnum], new: Iterable[TechnologyEnum]) -> None:
+        old, new = set(old), set(new)
+
+        for technology in new - old:
+            self.add_technology(technology)
+        for technology in old - new:
+            self.remove_technology(technology)
+
+
+    @staticmethod
+    def _toggle(item: Hashable, target: Set, opposite: Set) -> None:
+        if item in opposite:
+            opposite.discard(item)
+        else:
+            target.add(item)
+
+
+    def clear(self) -> None:
+        self.fields.clear()
+        self.added_members.clear()
+        self.removed_members.clear()
+        self.re_roled_members.clear()
+        self.added_technologies.clear()
+        self.removed_technologies.clear()
@@ -0,0 +1,35 @@
+import uuid
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    pass
+
+
+#### Projects ####
+@dataclass(frozen=True)
+class ProjectCreated(DomainEvent):
+    project_id: uuid.UUID
+
+@dataclass(frozen=True)
+class ProjectUpdated(DomainEvent):
+    project_id: uuid.UUID
+
+@dataclass(frozen=True)
+class ProjectDeleted(DomainEvent):
+    project_id: uuid.UUID
+
+
+#### Teams ####
+@dataclass(frozen=True)
+class TeamCreated(DomainEvent):
+    team_id: uuid.UUID
+
+@dataclass(frozen=True)
+class TeamUpdated(DomainEvent):
+    team_id: uuid.UUID
+
+@dataclass(frozen=True)
+class TeamDeleted(DomainEvent):
+    team_id: uuid.UUID
@@ -0,0 +1,30 @@
+from typing import Dict, Iterable, Set
+
+from domain.shared.enum import TechnologyEnum
+
+# Bit positions are a stored format, a new technology takes the next free bit and existing ones never move
+TECHNOLOGY_BITS: Dict[TechnologyEnum, int] = {
+    TechnologyEnum.PYTHON: 0,
+    TechnologyEnum.JAVASCRIPT: 1,
+    TechnologyEnum.REACT: 2,
+    TechnologyEnum.DOCKER: 3,
+}
+
+
+def technology_bit(technology: TechnologyEnum) -> int:
+    return 1 << TECHNOLOGY_BITS[technology]
+
+
+def to_mask(technologies: Iterable[TechnologyEnum]) -> int:
+    mask = 0
+    for technology in technologies:
+        mask |= technology_bit(technology)
+    return mask
+
+
+def from_mask(mask: int) -> Set[TechnologyEnum]:
+    return {technology for technology, bit in TECHNOLOGY_BITS.items() if mask & (1 << bit)}
+
+
+def count_technologies(mask: int) -> int:
+    return mask.bit_count()
@@ -1,40 +1,51 @@
-from dataclasses import dataclass, field
-from typing import Set
+from dataclasses import dataclass
+from typing import Iterable, Set
 
 from domain.shared.enum import TechnologyEnum
+from domain.shared.tech_mask import count_technologies, from_mask, technology_bit, to_mask
 
 
 @dataclass(frozen=True)
 class TechValueObject:
     description: str
-    technologies: Set[TechnologyEnum] = field(default_factory=set)
+    # The stack is kept as a bitmask, see domain.shared.tech_mask for the bit of each technology
+    technology_mask: int = 0
 
     def __post_init__(self):
         if len(self.description) < 10:
             raise ValueError("Description must be at least 10 characters long")
-        if not self.technologies:
+        if not self.technology_mask:
             raise ValueError("Technologies must not be empty")
-        if len(self.technologies) > 10:
+        if count_technologies(self.technology_mask) > 10:
             raise ValueError("Project cannot have more than 10 technologies.")
 
+    @classmethod
+    def from_technologies(cls, description: str, technologies: Iterable[TechnologyEnum]) -> 'TechValueObject':
+        return cls(description, to_mask(technologies))
+
+    @property
+    def technologies(self) -> Set[TechnologyEnum]:
+        return from_mask(self.technology_mask)
+
+    def has_tech(self, technology: TechnologyEnum) -> bool:
+        return bool(self.technology_mask & technology_bit(technology))
+
     def with_add_tech(self, technology: TechnologyEnum) -> 'TechValueObject':
-        if technology in self.technologies:
+        if self.has_tech(technology):
             raise ValueError("Technology already exists in the project.")
 
-        new_stack = self.technologies | {technology}
-        return TechValueObject(self.description, new_stack)
+        return TechValueObject(self.description, self.technology_mask | technology_bit(technology))
 
     def with_remove_tech(self, technology: TechnologyEnum) -> 'TechValueObject':
-        if len(self.technologies) <= 1:
+        if count_technologies(self.technology_mask) <= 1:
             raise ValueError("Project must have at least one technology.")
-        if technology not in self.technologies:
+        if not self.has_tech(technology):
             raise ValueError("Technology not found in the stack.")
 
-        new_stack = {t for t in self.technologies if t != technology}
-        return TechValueObject(self.description, new_stack)
+        return TechValueObject(self.description, self.technology_mask & ~technology_bit(technology))
 
     def with_set_tech(self, technologies: Set[TechnologyEnum]) -> 'TechValueObject':
-        return TechValueObject(self.description, technologies)
+        return TechValueObject.from_technologies(self.description, technologies)
 
     def with_description(self, description: str) -> 'TechValueObject':
-        return TechValueObject(description, self.technologies)
\ No newline at end of file
+        return TechValueObject(description, self.technology_mask)
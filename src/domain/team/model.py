@@ -2,6 +2,7 @@ import dataclasses
 import uuid
 from typing import Set, Dict, List
 
+from domain.shared.change_tracking import ChangeLog
 from domain.team.enum import TeamRoleEnum
 
 
@@ -23,6 +24,8 @@ class Team:
             owner_id: TeamMember(user_id=owner_id, roles={TeamRoleEnum.OWNER})
         }
 
+        self._changes = ChangeLog()
+
 
     @classmethod
     def _reconstitute(cls, id: uuid.UUID, name: str, description: str, logo: str,
@@ -34,6 +37,7 @@ class Team:
         instance.description = description
         instance.logo = logo
         instance._members = members
+        instance._changes = ChangeLog()
 
         return instance
 
@@ -49,6 +53,15 @@ class Team:
     def members(self) -> List[TeamMember]:
         return list(self._members.values())
 
+    @property
+    def changes(self) -> ChangeLog:
+        return self._changes
+
+    def _set_field(self, name: str, value) -> None:
+        if getattr(self, name) != value:
+            setattr(self, name, value)
+            self._changes.touch(name)
+
     def is_member(self, user_id: uuid.UUID) -> bool:
         if user_id in self._members:
             return True
@@ -60,13 +73,13 @@ class Team:
     def update(self, name: str | None, description: str | None, logo: str | None):
 
         if name:
-            self.name = name
+            self._set_field("name", name)
 
         if description:
-            self.description = description
+            self._set_field("description", description)
 
         if logo:
-            self.logo = logo # Add logic to check logo using regex pattern
+            self._set_field("logo", logo) # Add logic to check logo using regex pattern
 
 
 
@@ -90,6 +103,7 @@ class Team:
 
         new_member = TeamMember(user_id=user_id_to_add, roles=roles)
         self._members[user_id_to_add] = new_member
+        self._changes.add_member(user_id_to_add)
 
 
     def remove_member(self, user_id_to_remove: uuid.UUID):
@@ -102,6 +116,7 @@ class Team:
             raise ValueError("Cannot remove the owner of the team.")
 
         del self._members[user_id_to_remove]
+        self._changes.remove_member(user_id_to_remove)
 
 
 
@@ -110,7 +125,9 @@ class Team:
         if not member:
             raise ValueError("Member not found in the team.")
 
-        member.roles.add(role_to_add)
+        if role_to_add not in member.roles:
+            member.roles.add(role_to_add)
+            self._changes.re_role_member(user_id)
         print(f"Role '{role_to_add.value}' assigned to user {user_id}.")
 
 
@@ -129,6 +146,7 @@ class Team:
             raise ValueError("User does not have that role.")
 
         member.roles.remove(role_to_remove)
+        self._changes.re_role_member(user_id)
         print(f"Role '{role_to_remove.value}' revoked from user {user_id}.")
 
 
@@ -143,6 +161,8 @@ class Team:
         if not new_roles:
             raise ValueError("A member must have at least one role.")
 
-        member.roles.clear()
-        member.roles.update(new_roles)
+        if member.roles != new_roles:
+            member.roles.clear()
+            member.roles.update(new_roles)
+            self._changes.re_role_member(user_id)
         print(f"Roles for user {user_id} set to: {[r.value for r in new_roles]}")
\ No newline at end of file
@@ -8,7 +8,8 @@ from domain.user.enum import StatusUserEnum, PlatformRoleEnum
 class User:
     def __init__(self, id: uuid.UUID, username: str, email: str, hashed_password: str,
                  status_user: StatusUserEnum, platform_role: list[PlatformRoleEnum], created_at: datetime = None,
-                 avatar_url: str | None = None, linkedin_url: str | None = None, github_url: str | None = None):
+                 avatar_url: str | None = None, linkedin_url: str | None = None, github_url: str | None = None,
+                 token_version: int = 0, version: int = 1):
 
         self.id = id
         self.username = username
@@ -20,6 +21,8 @@ class User:
         self.status_user = status_user
         self.platform_role = platform_role
         self.created_at = created_at
+        self.token_version = token_version
+        self.version = version
 
     def ban(self):
         if self.status_user == StatusUserEnum.BANNED:
@@ -65,3 +68,7 @@ class User:
         if new_hashed_password == self.hashed_password:
             raise ValueError("New password cannot be the same as the old one.")
         self.hashed_password = new_hashed_password
+        self.revoke_tokens()
+
+    def revoke_tokens(self):
+        self.token_version += 1
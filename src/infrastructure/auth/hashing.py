@@ -1,15 +1,87 @@
-from application.auth.interfaces import IPasswordHasher
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
 from passlib.context import CryptContext
 
+from application.auth.exceptions import HashingUnavailableException
+from application.auth.interfaces import IPasswordHasher
+
+# "thread", "process" or "inline" (hash on the event loop, for local debugging only)
+PASSWORD_HASHER_EXECUTOR = os.getenv("PASSWORD_HASHER_EXECUTOR", "thread")
+PASSWORD_HASHER_WORKERS = int(os.getenv("PASSWORD_HASHER_WORKERS", "4"))
+PASSWORD_HASHER_MAX_PENDING = int(os.getenv("PASSWORD_HASHER_MAX_PENDING", "64"))
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+T = TypeVar('T')
+
+
+# Module level functions, so a process pool is able to pickle them
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+def _get_password_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def create_hashing_executor(kind: str = PASSWORD_HASHER_EXECUTOR,
+                            workers: int = PASSWORD_HASHER_WORKERS) -> Optional[Executor]:
+    if kind == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hasher")
+    if kind == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    if kind == "inline":
+        return None
+
+    raise ValueError(f"Unknown password hasher executor - {kind}")
+
+
 class PasswordHasher(IPasswordHasher):
 
-    @staticmethod
-    def verify_password(plain_password: str, hashed_password) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    def __init__(self, executor: Optional[Executor] = None, executor_kind: str = PASSWORD_HASHER_EXECUTOR,
+                 max_pending: int = PASSWORD_HASHER_MAX_PENDING):
+
+        self._executor = executor
+        self._executor_kind = executor_kind
+        self._max_pending = max_pending
+        self._pending = 0
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._executor_kind == "inline" and self._executor is None:
+            return func(*args)
+
+        # Running and queued jobs share one budget, the caller gets a 503 instead of an unbounded queue
+        if self._pending >= self._max_pending:
+            raise HashingUnavailableException("Password hashing is overloaded, try again later")
+
+        # The pool is created lazily, so building a hasher never spawns workers by itself
+        if self._executor is None:
+            self._executor = create_hashing_executor(self._executor_kind)
+
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func, *args)
+        self._pending += 1
+
+        # A cancelled caller does not stop a job that already started, its slot is released only
+        # when the worker is actually free. The callback runs on the worker, the count stays on the loop
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+        return await asyncio.wrap_future(future, loop=loop)
+
+    def _release(self) -> None:
+        self._pending -= 1
+
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(_verify_password, plain_password, hashed_password)
+
+    async def get_password_hash(self, password: str) -> str:
+        return await self._run(_get_password_hash, password)
 
-    @staticmethod
-    def get_password_hash(password: str) -> str:
-        return pwd_context.hash(password)
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta, timezone
 import os
+import uuid
 from typing import Dict
 from jose import JWTError, jwt
 from application.auth.interfaces import ITokenService
@@ -15,7 +16,7 @@ class JWTService(ITokenService):
         copy_data_to_encode = data.copy()
         expire_time = datetime.now(timezone.utc) + timedelta(minutes=int(ACCESS_TOKEN_EXPIRE_MINUTES))
 
-        copy_data_to_encode.update({"exp": expire_time, "type":"access"})
+        copy_data_to_encode.update({"exp": expire_time, "type":"access", "jti": uuid.uuid4().hex})
 
         return jwt.encode(copy_data_to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
@@ -23,7 +24,7 @@ class JWTService(ITokenService):
         copy_data_to_encode = data.copy()
         expire_time = datetime.now(timezone.utc) + timedelta(days=int(REFRESH_TOKEN_EXPIRE_DAYS))
 
-        copy_data_to_encode.update({"exp": expire_time, "type": "refresh"})
+        copy_data_to_encode.update({"exp": expire_time, "type": "refresh", "jti": uuid.uuid4().hex})
 
         return jwt.encode(copy_data_to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
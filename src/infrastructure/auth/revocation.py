@@ -0,0 +1,138 @@
+import asyncio
+import datetime
+import logging
+import os
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from application.auth.interfaces import IRevocationStore
+from infrastructure.auth.bloom import BloomFilter
+from infrastructure.database.repositories.revoked_token_repo import RevokedTokenRepository
+
+logger = logging.getLogger(__name__)
+
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "100000"))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.001"))
+REVOCATION_SYNC_INTERVAL_SECONDS = float(os.getenv("REVOCATION_SYNC_INTERVAL_SECONDS", "5"))
+REVOCATION_REBUILD_INTERVAL_SECONDS = float(os.getenv("REVOCATION_REBUILD_INTERVAL_SECONDS", "3600"))
+
+# Incremental syncs re-read a little of the previous window, a revocation committed by a slow
+# transaction carries a revoked_at from before the last sync
+SYNC_OVERLAP = datetime.timedelta(seconds=30)
+
+
+@dataclass
+class RevocationStats:
+    checks: int = 0
+    bloom_negatives: int = 0
+    exact_checks: int = 0
+    false_positives: int = 0
+    revocations: int = 0
+    syncs: int = 0
+    rebuilds: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class RevocationList(IRevocationStore):
+
+    def __init__(self, session_factory: async_sessionmaker,
+                 capacity: int = REVOCATION_BLOOM_CAPACITY,
+                 error_rate: float = REVOCATION_BLOOM_ERROR_RATE,
+                 rebuild_interval: float = REVOCATION_REBUILD_INTERVAL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+
+        self.stats = RevocationStats()
+
+        self._session_factory = session_factory
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._rebuild_interval = rebuild_interval
+        self._clock = clock
+
+        self._bloom = BloomFilter(capacity, error_rate)
+        # None until the first sync, every check is exact before that
+        self._synced_until: Optional[datetime.datetime] = None
+        self._rebuilt_at = 0.0
+
+    @property
+    def bloom(self) -> BloomFilter:
+        return self._bloom
+
+    async def is_revoked(self, jti: str) -> bool:
+        self.stats.checks += 1
+
+        if self._synced_until is not None and jti not in self._bloom:
+            self.stats.bloom_negatives += 1
+            return False
+
+        self.stats.exact_checks += 1
+        async with self._session_factory() as session:
+            revoked = await RevokedTokenRepository(session).exists(jti)
+
+        if not revoked and self._synced_until is not None:
+            self.stats.false_positives += 1
+        return revoked
+
+    async def revoke(self, jti: str, user_id: Optional[uuid.UUID], expires_at: datetime.datetime) -> None:
+        async with self._session_factory() as session:
+            await RevokedTokenRepository(session).add(jti, user_id, expires_at)
+            await session.commit()
+
+        # Exact in this process right away, the other processes pick it up on their next sync
+        self._bloom.add(jti)
+        self.stats.revocations += 1
+
+    async def sync(self) -> None:
+        if self._synced_until is None or self._clock() - self._rebuilt_at >= self._rebuild_interval:
+            await self._rebuild()
+            return
+
+        started = datetime.datetime.utcnow()
+        async with self._session_factory() as session:
+            jtis = await RevokedTokenRepository(session).revoked_since(self._synced_until - SYNC_OVERLAP)
+
+        for jti in jtis:
+            self._bloom.add(jti)
+
+        self._synced_until = started
+        self.stats.syncs += 1
+
+    async def _rebuild(self) -> None:
+        # A bloom filter cannot forget, expired revocations only leave it when it is rebuilt
+        started = datetime.datetime.utcnow()
+        async with self._session_factory() as session:
+            repository = RevokedTokenRepository(session)
+            await repository.delete_expired(started)
+            await session.commit()
+
+            jtis = [jti async for jti in repository.stream_active(started)]
+
+        bloom = BloomFilter(max(self._capacity, 2 * len(jtis)), self._error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+
+        # Revocations committed while the active set was being read
+        async with self._session_factory() as session:
+            for jti in await RevokedTokenRepository(session).revoked_since(started - SYNC_OVERLAP):
+                bloom.add(jti)
+
+        self._bloom = bloom
+        self._synced_until = started
+        self._rebuilt_at = self._clock()
+        self.stats.rebuilds += 1
+
+
+async def run_revocation_sync(store: IRevocationStore, interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await store.sync()
+        except Exception:
+            # The previous filter stays in use, the next round retries
+            logger.exception("Revocation list sync failed")
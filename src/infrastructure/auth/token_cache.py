@@ -0,0 +1,55 @@
+import hashlib
+import os
+import time
+from typing import Callable, Dict
+
+from application.auth.interfaces import ITokenService
+from infrastructure.cache.ttl_lru import TTLLRUCache
+
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+TOKEN_CACHE_TTL_SECONDS = float(os.getenv("TOKEN_CACHE_TTL_SECONDS", "300"))
+
+
+class CachedTokenService(ITokenService):
+
+    def __init__(self, token_service: ITokenService, max_size: int = TOKEN_CACHE_MAX_SIZE,
+                 ttl: float = TOKEN_CACHE_TTL_SECONDS, wall_clock: Callable[[], float] = time.time):
+        self._token_service = token_service
+        self._wall_clock = wall_clock
+        # Keyed by a digest, the cache never holds a usable token
+        self._claims: TTLLRUCache[bytes, Dict] = TTLLRUCache(max_size, ttl)
+
+    @property
+    def stats(self):
+        return self._claims.stats
+
+    def create_access_token(self, data: Dict) -> str:
+        return self._token_service.create_access_token(data)
+
+    def create_refresh_token(self, data: Dict) -> str:
+        return self._token_service.create_refresh_token(data)
+
+    def decode_token(self, token: str) -> Dict:
+        key = hashlib.sha256(token.encode()).digest()
+
+        # A hit skips the signature check, the token was verified when it was cached
+        claims = self._claims.get(key)
+        if claims is not None:
+            return dict(claims)
+
+        claims = self._token_service.decode_token(token)
+
+        # Never outlives the token, an expired one goes back through the verifier and fails there
+        expires_in = claims.get("exp", 0) - self._wall_clock()
+        if expires_in > 0:
+            self._claims.set(key, dict(claims), ttl=expires_in)
+
+        return claims
+
+    def get_user_id_by_refresh_token(self, refresh_token: str) -> str:
+        payload_token = self.decode_token(refresh_token)
+
+        if payload_token.get("type") != "refresh":
+            raise ValueError(f"Invalid token type: {payload_token['type']}")
+
+        return payload_token.get("sub")
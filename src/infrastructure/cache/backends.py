@@ -0,0 +1,64 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+from infrastructure.cache.ttl_lru import TTLLRUCache
+
+RESPONSE_CACHE_URL = os.getenv("RESPONSE_CACHE_URL", "memory://")
+RESPONSE_CACHE_MAX_SIZE = int(os.getenv("RESPONSE_CACHE_MAX_SIZE", "10000"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+
+
+# The subset of the redis.asyncio client the response cache uses, so a Redis client fits as is
+class ICacheBackend(ABC):
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        pass
+
+
+class MemoryCacheBackend(ICacheBackend):
+
+    def __init__(self, max_size: int = RESPONSE_CACHE_MAX_SIZE, ttl: float = RESPONSE_CACHE_TTL_SECONDS):
+        self._values: TTLLRUCache[str, bytes] = TTLLRUCache(max_size, ttl)
+        # Counters are never evicted, a counter that restarted could make old entries current again
+        self._counters: Dict[str, int] = {}
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        stats = self._values.stats.as_dict()
+        stats["size"] = len(self._values)
+        return stats
+
+    async def get(self, key: str) -> Optional[bytes]:
+        counter = self._counters.get(key)
+        if counter is not None:
+            return str(counter).encode()
+        return self._values.get(key)
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self._values.set(key, value, ex)
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+
+def create_cache_backend(url: str = RESPONSE_CACHE_URL) -> ICacheBackend:
+    if url.startswith("memory://"):
+        return MemoryCacheBackend()
+
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        # Only deployments that share the cache between workers need the redis package
+        from redis.asyncio import Redis
+        return Redis.from_url(url)
+
+    raise ValueError(f"Unsupported response cache URL: {url}")
@@ -0,0 +1,71 @@
+import math
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Sequence, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+
+from application.shared.interfaces import IResponseCache
+from infrastructure.cache.backends import ICacheBackend, RESPONSE_CACHE_TTL_SECONDS
+from infrastructure.cache.single_flight import SingleFlight
+
+R = TypeVar('R')
+
+
+# Entries are keyed by the current generation of every namespace they depend on. Invalidation only
+# bumps a generation, so stale entries are never read again and simply age out of the backend.
+class ResponseCache(IResponseCache):
+
+    def __init__(self, backend: ICacheBackend, ttl: float = RESPONSE_CACHE_TTL_SECONDS, prefix: str = "response:"):
+        self._backend = backend
+        # Redis refuses a zero expiry, a sub-second TTL is rounded up to the shortest one it accepts
+        self._ttl = max(1, math.ceil(ttl))
+        self._prefix = prefix
+        self._adapters: Dict[Any, TypeAdapter] = {}
+        self._single_flight: SingleFlight[str, Any] = SingleFlight()
+
+    def _adapter(self, response_type: Any) -> TypeAdapter:
+        adapter = self._adapters.get(response_type)
+        if adapter is None:
+            adapter = self._adapters[response_type] = TypeAdapter(response_type)
+        return adapter
+
+    async def _generations(self, namespaces: Sequence[str]) -> List[str]:
+        generations = []
+        for namespace in namespaces:
+            generation = await self._backend.get(f"{self._prefix}gen:{namespace}")
+            generations.append(f"{namespace}={generation.decode() if generation else 0}")
+        return generations
+
+
+    # Loaders whose outcome depends on more than the key, such as a conditional load that may raise
+    # NotModifiedException, pass a variant: concurrent loads only coalesce within one variant, while
+    # the entry they store stays shared by all of them.
+    async def get_or_load(self, key: str, namespaces: Sequence[str], response_type: Any,
+                          loader: Callable[[], Awaitable[R]], variant: str = "") -> R:
+        generations = await self._generations(namespaces)
+        full_key = f"{self._prefix}{key}@{','.join(generations)}"
+        adapter = self._adapter(response_type)
+
+        cached = await self._backend.get(full_key)
+        if cached is not None:
+            try:
+                return adapter.validate_json(cached)
+            except ValidationError:
+                # Rows written before the current DTO constraints do not round-trip, they are served uncached
+                pass
+
+        async def load() -> R:
+            value = await loader()
+            await self._backend.set(full_key, adapter.dump_json(value), ex=self._ttl)
+            return value
+
+        return await self._single_flight.do(f"{full_key}#{variant}" if variant else full_key, load)
+
+
+    async def invalidate(self, namespaces: Iterable[str]) -> None:
+        for namespace in namespaces:
+            await self._backend.incr(f"{self._prefix}gen:{namespace}")
+
+    def stats(self) -> Dict[str, int]:
+        stats = self._single_flight.stats.as_dict()
+        stats.update(getattr(self._backend, "stats", {}))
+        return stats
@@ -0,0 +1,55 @@
+import asyncio
+from dataclasses import dataclass, asdict
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar('K', bound=Hashable)
+V = TypeVar('V')
+
+
+@dataclass
+class SingleFlightStats:
+    leaders: int = 0
+    coalesced: int = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+class SingleFlight(Generic[K, V]):
+    # Concurrent calls for the same key share one in-flight load instead of each running it
+
+    def __init__(self):
+        self._calls: Dict[K, asyncio.Future] = {}
+        self.stats = SingleFlightStats()
+
+    async def do(self, key: K, load: Callable[[], Awaitable[V]]) -> V:
+        while key in self._calls:
+            future = self._calls[key]
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled, not this caller, so one of the waiters takes over
+                if future.cancelled():
+                    continue
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.stats.leaders += 1
+
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Marks the exception retrieved when nobody was waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
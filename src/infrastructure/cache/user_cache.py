@@ -0,0 +1,79 @@
+import copy
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional
+
+from domain.user.model import User as DomainUser
+from infrastructure.cache.ttl_lru import TTLLRUCache
+
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+# The cache lives in each worker process and a commit only evicts from the worker that made it.
+# Other workers may keep serving the previous row, token_version and ban status included, for at
+# most USER_CACHE_TTL_SECONDS. Conditional GETs still read the version from the database.
+# 0 disables the cache.
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+
+
+class UserCache:
+
+    def __init__(self, max_size: int = USER_CACHE_MAX_SIZE, ttl: float = USER_CACHE_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self._users: TTLLRUCache[uuid.UUID, DomainUser] = TTLLRUCache(max_size, ttl, clock)
+        self._ids_by_email: TTLLRUCache[str, uuid.UUID] = TTLLRUCache(max_size, ttl, clock)
+
+        # Every invalidation gets a sequence number. A load that started before the latest
+        # invalidation of its user may have read the old row, so its result is not cached.
+        self._sequence = 0
+        self._invalidated: OrderedDict[uuid.UUID, int] = OrderedDict()
+        self._max_tracked = max(max_size, 1)
+        self._forgotten_sequence = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._users.max_size > 0 and self._users.ttl > 0
+
+    def begin_load(self) -> int:
+        return self._sequence
+
+    def get(self, user_id: uuid.UUID) -> Optional[DomainUser]:
+        user = self._users.get(user_id)
+        return copy.deepcopy(user) if user is not None else None
+
+    def get_by_email(self, email: str) -> Optional[DomainUser]:
+        user_id = self._ids_by_email.get(email)
+        if user_id is None:
+            return None
+
+        user = self.get(user_id)
+        if user is None or user.email != email:
+            return None
+
+        return user
+
+    def put(self, user: DomainUser, load_sequence: int) -> None:
+        if load_sequence < self._forgotten_sequence:
+            return
+
+        if self._invalidated.get(user.id, 0) > load_sequence:
+            return
+
+        self._users.set(user.id, copy.deepcopy(user))
+        self._ids_by_email.set(user.email, user.id)
+
+    def invalidate(self, user_ids: Iterable[uuid.UUID]) -> None:
+        for user_id in user_ids:
+            self._sequence += 1
+            self._invalidated[user_id] = self._sequence
+            self._invalidated.move_to_end(user_id)
+            self._users.invalidate(user_id)
+
+        while len(self._invalidated) > self._max_tracked:
+            _, sequence = self._invalidated.popitem(last=False)
+            self._forgotten_sequence = sequence
+
+    def stats(self) -> Dict[str, int]:
+        stats = self._users.stats.as_dict()
+        stats["size"] = len(self._users)
+        return stats
@@ -0,0 +1,58 @@
+import uuid
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Mapping
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.expressions import in_uuids
+from infrastructure.database.models.users import User as DBUser
+
+# Denormalized per-user counters on users, kept in sync by the repositories that own the counted rows
+TEAMS_COUNT = "teams_count"
+PROJECTS_COUNT = "projects_count"
+DESIRED_PROJECTS_COUNT = "desired_projects_count"
+
+
+async def lock_counters(session: AsyncSession, counter: str, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, int]:
+    user_ids = set(user_ids)
+    if not user_ids:
+        return {}
+
+    # The row locks are held until the unit of work ends, so a limit check and the write it guards
+    # cannot interleave with a concurrent one. Locking in id order keeps two batches from deadlocking.
+    column = getattr(DBUser, counter)
+    stmt = (
+        select(DBUser.id, column)
+        .where(in_uuids(DBUser.id, user_ids))
+        .order_by(DBUser.id)
+        .with_for_update()
+    )
+    result = await session.execute(stmt)
+
+    counts = {user_id: 0 for user_id in user_ids}
+    counts.update({user_id: count for user_id, count in result.all()})
+    return counts
+
+
+async def adjust_counters(session: AsyncSession, counter: str, deltas: Mapping[uuid.UUID, int]) -> None:
+    # One statement per distinct delta, in practice +1 for added rows and -1 for removed ones
+    by_delta: Dict[int, List[uuid.UUID]] = defaultdict(list)
+    for user_id, delta in deltas.items():
+        if delta:
+            by_delta[delta].append(user_id)
+
+    column = getattr(DBUser, counter)
+    for delta, user_ids in sorted(by_delta.items()):
+        await session.execute(
+            update(DBUser)
+            .where(in_uuids(DBUser.id, sorted(user_ids)))
+            .values({counter: column + delta})
+        )
+
+
+def count_deltas(added: Iterable[uuid.UUID] = (), removed: Iterable[uuid.UUID] = ()) -> Counter:
+    # Only the ids count, a Counter built from a mapping (project participants) would take its values as counts
+    deltas = Counter(list(added))
+    deltas.subtract(list(removed))
+    return deltas
@@ -0,0 +1,36 @@
+import uuid
+from enum import Enum
+from typing import Iterable
+
+from sqlalchemy import BigInteger, String, any_, literal, select
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.sql.elements import ColumnElement
+
+
+# Binds the ids as one array parameter, so the statement text does not change with the batch size
+def uuid_array(ids: Iterable[uuid.UUID]) -> ColumnElement:
+    return literal(list(ids), ARRAY(UUID(as_uuid=True)))
+
+
+def in_uuids(column: ColumnElement, ids: Iterable[uuid.UUID]) -> ColumnElement:
+    return column == any_(uuid_array(ids))
+
+
+# Lookup tables (statuses, roles, technologies) are keyed by serial ids while the enums carry the row names,
+# so the ids are resolved by name inside the statement that needs them
+def lookup_id(model, value: Enum) -> ColumnElement:
+    return select(model.id).where(model.name == value.value).scalar_subquery()
+
+
+def in_lookups(column: ColumnElement, model, values: Iterable[Enum]) -> ColumnElement:
+    names = literal([value.value for value in values], ARRAY(String))
+    return column.in_(select(model.id).where(model.name == any_(names)))
+
+
+# Bitwise predicates over a technology mask column, see domain.shared.tech_mask
+def mask_any(column: ColumnElement, mask: int) -> ColumnElement:
+    return column.op("&")(literal(mask, BigInteger)) != 0
+
+
+def mask_all(column: ColumnElement, mask: int) -> ColumnElement:
+    return column.op("&")(literal(mask, BigInteger)) == mask
@@ -0,0 +1,53 @@
+import uuid
+from dataclasses import asdict, dataclass
+from typing import Dict, Hashable, Optional, Tuple
+
+
+@dataclass
+class IdentityMapMetrics:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def avoided_queries(self) -> int:
+        return self.hits
+
+    def as_dict(self) -> Dict[str, int]:
+        return {**asdict(self), "avoided_queries": self.avoided_queries}
+
+
+# Process wide, every unit of work reports into it
+identity_map_metrics = IdentityMapMetrics()
+
+
+class IdentityMap:
+
+    def __init__(self, metrics: IdentityMapMetrics = identity_map_metrics):
+        self.metrics = metrics
+        self._entries: Dict[Tuple[Hashable, uuid.UUID], object] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, kind: Hashable, id: uuid.UUID) -> Optional[object]:
+        aggregate = self._entries.get((kind, id))
+
+        if aggregate is None:
+            self.metrics.misses += 1
+        else:
+            self.metrics.hits += 1
+
+        return aggregate
+
+    def peek(self, kind: Hashable, id: uuid.UUID) -> Optional[object]:
+        return self._entries.get((kind, id))
+
+    def add(self, kind: Hashable, id: uuid.UUID, aggregate: object) -> object:
+        # The first hydrated instance wins, so every caller in the unit of work mutates the same aggregate
+        return self._entries.setdefault((kind, id), aggregate)
+
+    def remove(self, kind: Hashable, id: uuid.UUID) -> None:
+        self._entries.pop((kind, id), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,85 @@
+import heapq
+import json
+import logging
+import os
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger("teamup.sql")
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+SLOWEST_STATEMENTS_KEPT = int(os.getenv("SLOWEST_STATEMENTS_KEPT", "5"))
+
+
+@dataclass
+class RequestStats:
+    statements: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    # Min-heap of (seconds, statement), only the slowest few are kept
+    slowest: List[Tuple[float, str]] = field(default_factory=list)
+
+    def record_statement(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.db_seconds += seconds
+
+        if len(self.slowest) < SLOWEST_STATEMENTS_KEPT:
+            heapq.heappush(self.slowest, (seconds, statement))
+        elif seconds > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, (seconds, statement))
+
+    def slowest_statements(self) -> List[Tuple[float, str]]:
+        return sorted(self.slowest, reverse=True)
+
+
+# Set by the request middleware. SQLAlchemy runs the sync event hooks in a greenlet that shares
+# the context of the awaiting task, so the hooks see the stats of the request they work for.
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def record_pool_wait(seconds: float) -> None:
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.pool_wait_seconds += seconds
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_started"].pop()
+    seconds = time.perf_counter() - started
+
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.record_statement(statement, seconds)
+
+    if seconds * 1000 >= SLOW_QUERY_THRESHOLD_MS:
+        logger.warning(json.dumps({
+            "event": "slow_query",
+            "duration_ms": round(seconds * 1000, 2),
+            "statement": statement,
+            "executemany": executemany,
+            "database": conn.engine.url.render_as_string(hide_password=True),
+        }))
+
+
+def _handle_error(exception_context):
+    # A failed statement never reaches after_cursor_execute, drop its start time
+    started = exception_context.connection.info.get("query_started") if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def instrument_engine(engine: AsyncEngine) -> AsyncEngine:
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+    return engine
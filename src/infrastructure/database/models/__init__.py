@@ -1,4 +1,8 @@
 from src.infrastructure.database.session import Base
 
 from .users import User, StatusUser, PlatformRole
-from .teams import TeamRole, Team, TeamMember
\ No newline at end of file
+from .teams import TeamRole, Team, TeamMember
+from .projects import (ProjectParticipantRole, StatusProject, Technology, Project, ProjectParticipant,
+                       TechnologyToProject)
+from .desired_projects import DesiredProject, TechnologyToDesiredProject
+from .revoked_tokens import RevokedToken
@@ -1,7 +1,7 @@
 import uuid
 
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy import Column, Integer, ForeignKey, Text
+from sqlalchemy import BigInteger, Column, Integer, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.database.session import Base
@@ -9,19 +9,27 @@ from src.infrastructure.database.session import Base
 
 class DesiredProject(Base):
     __tablename__ = 'desired_projects'
+    __table_args__ = (
+        Index('ix_desired_projects_user_id', 'user_id'),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
     amount_of_people = Column(Integer)
     description = Column(Text, nullable=True)
+    # Denormalized from desired_project_technology, bit per technology as in domain.shared.tech_mask
+    tech_mask = Column(BigInteger, nullable=False, default=0, server_default='0')
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'))
-    user = relationship("User", back_populates="team_members")
+    user = relationship("User", back_populates="desired_projects")
 
-    technologies = relationship("TechnologyToDesiredProject", back_populates="project", cascade="all, delete-orphan")
+    technologies = relationship("TechnologyToDesiredProject", back_populates="desired_project", cascade="all, delete-orphan")
 
 
 class TechnologyToDesiredProject(Base):
     __tablename__ = 'desired_project_technology'
+    __table_args__ = (
+        Index('ix_desired_project_technology_desired_project_id', 'desired_project_id'),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     desired_project_id = Column(UUID(as_uuid=True), ForeignKey('desired_projects.id'))
@@ -29,4 +37,4 @@ class TechnologyToDesiredProject(Base):
     technology_id = Column(Integer, ForeignKey('technology.id'))
 
     desired_project = relationship("DesiredProject", back_populates="technologies")
-    technology = relationship("Technology", back_populates="technologies")
+    technology = relationship("Technology", back_populates="desired_project_tech")
@@ -1,8 +1,9 @@
 import datetime
 import uuid
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (BigInteger, Column, Computed, Integer, String, DateTime, ForeignKey, Text, UniqueConstraint,
+                        Index)
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from src.infrastructure.database.session import Base
 
 
@@ -27,15 +28,33 @@ class Technology(Base):
     name = Column(String, nullable=False, unique=True)
 
     project_tech = relationship("TechnologyToProject", back_populates="technology")
-    desired_project_tech = relationship("TechnologyToDesiredProject", back_populates="technologies")
+    desired_project_tech = relationship("TechnologyToDesiredProject", back_populates="technology")
 
 
 class Project(Base):
     __tablename__ = 'projects'
+    __table_args__ = (
+        # Keyset pages, unfiltered and filtered by team or status
+        Index('ix_projects_created_at_id', 'created_at', 'id'),
+        Index('ix_projects_team_id_created_at_id', 'team_id', 'created_at', 'id'),
+        Index('ix_projects_status_id_created_at_id', 'status_id', 'created_at', 'id'),
+        # Full-text and typo tolerant name search
+        Index('ix_projects_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_projects_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String, nullable=False, unique=True)
     description = Column(Text, nullable=True)
     logo = Column(String, nullable=True, unique=True)
+    url_project = Column(String, nullable=True)
+    # Denormalized from project_technology, bit per technology as in domain.shared.tech_mask
+    tech_mask = Column(BigInteger, nullable=False, default=0, server_default='0')
+    # Maintained by Postgres on every insert and update, only search queries read it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')",
+        persisted=True
+    )))
 
     team_id = Column(UUID(as_uuid=True), ForeignKey('teams.id'))
     team = relationship("Team", back_populates="projects")
@@ -48,20 +67,28 @@ class Project(Base):
 
     participants = relationship("ProjectParticipant", back_populates="project", cascade="all, delete-orphan")
 
+    # Bumped by every repository update, the ETag of conditional GETs is derived from it
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     finished_at = Column(DateTime, nullable=True)
 
 
 class ProjectParticipant(Base):
     __tablename__ = "project_participant"
+    __table_args__ = (
+        UniqueConstraint('project_id', 'user_id', name='uq_project_participant_project_id_user_id'),
+        Index('ix_project_participant_user_id', 'user_id', postgresql_include=['project_id']),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'))
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False)
     team_member_id = Column(UUID(as_uuid=True), ForeignKey('team_members.id'))
     role_id = Column(Integer, ForeignKey('project_participant_role.id'))
 
     project = relationship("Project", back_populates="participants")
-    team_member = relationship("TeamMember")
+    team_member = relationship("TeamMember", back_populates="participant")
     role = relationship("ProjectParticipantRole", back_populates="participants")
 
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
@@ -69,6 +96,10 @@ class ProjectParticipant(Base):
 
 class TechnologyToProject(Base):
     __tablename__ = 'project_technology'
+    __table_args__ = (
+        UniqueConstraint('project_id', 'technology_id', name='uq_project_technology_project_id_technology_id'),
+        Index('ix_project_technology_technology_id_project_id', 'technology_id', 'project_id'),
+    )
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
     project_id = Column(UUID(as_uuid=True), ForeignKey('projects.id'))
@@ -0,0 +1,21 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, Index, String
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.database.session import Base
+
+
+class RevokedToken(Base):
+    __tablename__ = 'revoked_tokens'
+    __table_args__ = (
+        # Incremental syncs of the in-process bloom filters, and the purge of expired rows
+        Index('ix_revoked_tokens_revoked_at', 'revoked_at'),
+        Index('ix_revoked_tokens_expires_at', 'expires_at'),
+    )
+
+    jti = Column(String(64), primary_key=True)
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+    # The row is only needed until the token would have expired anyway
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
@@ -1,10 +1,10 @@
 import datetime
 import uuid
 
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Integer, String, DateTime, ForeignKey, Text, Index
+from sqlalchemy.orm import deferred, relationship
 from src.infrastructure.database.session import Base
 
 class TeamRole(Base):
@@ -13,7 +13,7 @@ class TeamRole(Base):
 
     name = Column(String, nullable=False, unique=True)
 
-    team_member = relationship("TeamMember", back_populates="team_role")
+    team_members = relationship("TeamMember", back_populates="role")
 
     def __str__(self):
         return self.name
@@ -21,6 +21,11 @@ class TeamRole(Base):
 
 class Team(Base):
     __tablename__ = "teams"
+    __table_args__ = (
+        # Full-text and typo tolerant name search
+        Index('ix_teams_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_teams_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
     name = Column(String, nullable=False, unique=True)
@@ -28,9 +33,19 @@ class Team(Base):
 
     logo = Column(String, nullable=True, unique=True)
 
+    # Maintained by Postgres on every insert and update, only search queries read it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')",
+        persisted=True
+    )))
+
     members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
     projects = relationship("Project", back_populates="team")
 
+    # Bumped by every repository update, the ETag of conditional GETs is derived from it
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
     def __str__(self):
@@ -39,19 +54,23 @@ class Team(Base):
 
 class TeamMember(Base): 
     __tablename__ = "team_members"
+    __table_args__ = (
+        Index('ix_team_members_user_id_role_id', 'user_id', 'role_id', postgresql_include=['team_id']),
+        Index('ix_team_members_team_id', 'team_id'),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
 
     team_id = Column(UUID(as_uuid=True), ForeignKey('teams.id'))
-    team = relationship("Team", back_populates="team_members")
+    team = relationship("Team", back_populates="members")
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'))
-    user = relationship("User", back_populates="team_members")
+    user = relationship("User", back_populates="team_memberships")
 
     role_id = Column(Integer, ForeignKey('team_role.id'))
     role = relationship("TeamRole", back_populates="team_members")
 
-    participant = relationship("ProjectParticipant", back_populates="project")
+    participant = relationship("ProjectParticipant", back_populates="team_member")
 
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
@@ -38,10 +38,18 @@ class User(Base):
     status_id = Column(Integer, ForeignKey('status_user.id'))
     status = relationship("StatusUser", back_populates="users")
 
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Maintained by the repositories in the same transaction as the rows they count
+    teams_count = Column(Integer, nullable=False, default=0, server_default="0")
+    projects_count = Column(Integer, nullable=False, default=0, server_default="0")
+    desired_projects_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped by every repository update, the ETag of conditional GETs is derived from it
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
     team_memberships = relationship("TeamMember", back_populates="user")
     desired_projects = relationship("DesiredProject", back_populates="user")
     social_media = relationship("SocialMediaData", back_populates="user", uselist=False)
-    platform_roles = relationship("UserPlatformRole", back_populates="user")
+    platform_roles = relationship("UserPlatformRole", back_populates="user", cascade="all, delete-orphan")
 
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
@@ -71,10 +79,10 @@ class UserPlatformRole(Base):
     id = Column(Integer, primary_key=True)
 
     user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'))
-    user = relationship("User", back_populates="user_platform_role")
+    user = relationship("User", back_populates="platform_roles")
 
     platform_role_id = Column(Integer, ForeignKey('platform_role.id'))
-    platform_role = relationship("PlatformRole", back_populates="user_platform_role")
+    platform_role = relationship("PlatformRole")
 
     def __str__(self):
         return f"User - {self.user.username} Role - {self.platform_role.name}"
@@ -0,0 +1,100 @@
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Type
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool
+
+from .instrumentation import record_pool_wait
+
+# Time spent opening connections during the current checkout, _do_get and _create_connection run in the same greenlet
+_connect_seconds: ContextVar[float] = ContextVar("pool_connect_seconds", default=0.0)
+
+
+@dataclass
+class PoolMetrics:
+    checkouts: int = 0
+    checkins: int = 0
+    connects: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+    connect_seconds_total: float = 0.0
+    connect_seconds_max: float = 0.0
+    pool: Optional[Pool] = field(default=None, repr=False)
+
+    def record_wait(self, seconds: float) -> None:
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def record_connect(self, seconds: float) -> None:
+        self.connect_seconds_total += seconds
+        self.connect_seconds_max = max(self.connect_seconds_max, seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        snapshot = {
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "connects": self.connects,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+            "connect_seconds_total": self.connect_seconds_total,
+            "connect_seconds_max": self.connect_seconds_max,
+        }
+
+        if isinstance(self.pool, AsyncAdaptedQueuePool):
+            snapshot.update({
+                "size": self.pool.size(),
+                "checked_out": self.pool.checkedout(),
+                "overflow": self.pool.overflow(),
+            })
+
+        return snapshot
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    metrics: PoolMetrics
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The pool is re-created on engine.dispose(), the new instance takes over the gauges
+        self.metrics.pool = self
+
+    def _do_get(self):
+        started = time.perf_counter()
+        connecting = _connect_seconds.set(0.0)
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        finally:
+            # An overflow checkout opens a new connection, that time is reported as connect time, not as queue wait
+            waited = time.perf_counter() - started - _connect_seconds.get()
+            _connect_seconds.reset(connecting)
+            self.metrics.record_wait(waited)
+            record_pool_wait(waited)
+
+        self.metrics.checkouts += 1
+        return connection
+
+    def _do_return_conn(self, record):
+        self.metrics.checkins += 1
+        super()._do_return_conn(record)
+
+    def _create_connection(self):
+        self.metrics.connects += 1
+        started = time.perf_counter()
+        try:
+            return super()._create_connection()
+        finally:
+            connected = time.perf_counter() - started
+            self.metrics.record_connect(connected)
+            _connect_seconds.set(_connect_seconds.get() + connected)
+
+
+def instrumented_pool_class(metrics: PoolMetrics) -> Type[InstrumentedQueuePool]:
+    # create_async_engine only accepts a pool class, so every engine gets a subclass bound to its metrics
+    return type("InstrumentedQueuePool", (InstrumentedQueuePool,), {"metrics": metrics})
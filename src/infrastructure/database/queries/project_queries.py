@@ -0,0 +1,155 @@
+import uuid
+from typing import AsyncIterator, Optional, Set
+
+from sqlalchemy import Row, Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.projects.dto import ProjectDTO
+from application.projects.interfaces import IProjectQueries
+from application.shared.pagination import KeysetCursor, Page, RankCursor
+from domain.project.enum import StatusProjectEnum
+from domain.shared.enum import TechnologyEnum
+from domain.shared.tech_mask import to_mask
+from infrastructure.database.expressions import mask_all, mask_any
+from infrastructure.database.search import after_rank, search_predicate
+from infrastructure.database.models.projects import Project as DBProject, StatusProject as DBStatusProject
+
+
+class ProjectQueries(IProjectQueries):
+
+    # Only the columns ProjectDTO needs, no relationships and no aggregate rebuild
+    _columns = (
+        DBProject.id,
+        DBProject.name,
+        DBProject.description,
+        DBProject.logo,
+        DBProject.url_project,
+        DBStatusProject.name.label("status"),
+        DBProject.team_id,
+        DBProject.created_at,
+        DBProject.version,
+    )
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @classmethod
+    def _select(cls, *columns) -> Select:
+        # status_id is a status_project key, only the status name maps onto StatusProjectEnum
+        return (
+            select(*cls._columns, *columns)
+            .outerjoin(DBStatusProject, DBStatusProject.id == DBProject.status_id)
+        )
+
+    @staticmethod
+    def _to_dto(row: Row) -> ProjectDTO:
+        # Rows come straight from our own tables, pydantic validation would only repeat the column types
+        return ProjectDTO.model_construct(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            logo=row.logo,
+            url_project=row.url_project,
+            status=StatusProjectEnum(row.status) if row.status else None,
+            team_id=row.team_id,
+            version=row.version
+        )
+
+
+    async def get_by_id(self, project_id: uuid.UUID) -> Optional[ProjectDTO]:
+        stmt = self._select().where(DBProject.id == project_id)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        return self._to_dto(row) if row else None
+
+
+    async def get_version(self, project_id: uuid.UUID) -> Optional[int]:
+        result = await self.session.execute(select(DBProject.version).where(DBProject.id == project_id))
+        return result.scalar_one_or_none()
+
+
+    async def get_by_name(self, name: str) -> Optional[ProjectDTO]:
+        stmt = self._select().where(DBProject.name == name)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        return self._to_dto(row) if row else None
+
+
+    async def get_page(
+            self,
+            limit: int,
+            cursor: Optional[KeysetCursor] = None,
+            status: Optional[StatusProjectEnum] = None,
+            team_id: Optional[uuid.UUID] = None,
+            any_technologies: Optional[Set[TechnologyEnum]] = None,
+            all_technologies: Optional[Set[TechnologyEnum]] = None
+    ) -> Page[ProjectDTO]:
+        stmt = (
+            self._select()
+            .order_by(DBProject.created_at, DBProject.id)
+            .limit(limit + 1)
+        )
+
+        if cursor:
+            stmt = stmt.where(tuple_(DBProject.created_at, DBProject.id) > tuple_(cursor.created_at, cursor.id))
+
+        if status:
+            stmt = stmt.where(DBStatusProject.name == status.value)
+
+        if team_id:
+            stmt = stmt.where(DBProject.team_id == team_id)
+
+        if any_technologies:
+            stmt = stmt.where(mask_any(DBProject.tech_mask, to_mask(any_technologies)))
+
+        if all_technologies:
+            stmt = stmt.where(mask_all(DBProject.tech_mask, to_mask(all_technologies)))
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        # One extra row is fetched only to learn whether another page exists
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = KeysetCursor(created_at=rows[-1].created_at, id=rows[-1].id)
+
+        return Page(items=[self._to_dto(row) for row in rows], next_cursor=next_cursor)
+
+
+    async def search(self, text: str, limit: int, cursor: Optional[RankCursor] = None) -> Page[ProjectDTO]:
+        predicate, rank = search_predicate(DBProject.search_vector, DBProject.name, text)
+        stmt = (
+            self._select(rank.label("rank"))
+            .where(predicate)
+            .order_by(rank.desc(), DBProject.id)
+            .limit(limit + 1)
+        )
+
+        if cursor:
+            stmt = stmt.where(after_rank(rank, DBProject.id, cursor))
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = RankCursor(rank=rows[-1].rank, id=rows[-1].id)
+
+        return Page(items=[self._to_dto(row) for row in rows], next_cursor=next_cursor)
+
+
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[ProjectDTO]:
+        stmt = (
+            self._select()
+            .order_by(DBProject.created_at, DBProject.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+
+        async for rows in result.partitions():
+            for row in rows:
+                yield self._to_dto(row)
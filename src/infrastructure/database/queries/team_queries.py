@@ -0,0 +1,100 @@
+import uuid
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from application.teams.dto import TeamDTO
+from application.teams.interfaces import ITeamQueries
+from application.shared.pagination import Page, RankCursor
+from infrastructure.database.models.teams import Team as DBTeam
+from infrastructure.database.search import after_rank, search_predicate
+
+
+class TeamQueries(ITeamQueries):
+
+    # Only the columns TeamDTO needs, members are never loaded for listings
+    _columns = (
+        DBTeam.id,
+        DBTeam.name,
+        DBTeam.description,
+        DBTeam.logo,
+        DBTeam.version,
+    )
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def _to_dto(row: Row) -> TeamDTO:
+        return TeamDTO.model_construct(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            avatar_url=row.logo,
+            version=row.version
+        )
+
+
+    async def get(self) -> List[TeamDTO]:
+        stmt = select(*self._columns).order_by(DBTeam.created_at, DBTeam.id)
+        result = await self.session.execute(stmt)
+
+        return [self._to_dto(row) for row in result]
+
+
+    async def get_by_id(self, team_id: uuid.UUID) -> Optional[TeamDTO]:
+        stmt = select(*self._columns).where(DBTeam.id == team_id)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        return self._to_dto(row) if row else None
+
+
+    async def get_version(self, team_id: uuid.UUID) -> Optional[int]:
+        result = await self.session.execute(select(DBTeam.version).where(DBTeam.id == team_id))
+        return result.scalar_one_or_none()
+
+
+    async def get_by_name(self, name: str) -> Optional[TeamDTO]:
+        stmt = select(*self._columns).where(DBTeam.name == name)
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        return self._to_dto(row) if row else None
+
+
+    async def search(self, text: str, limit: int, cursor: Optional[RankCursor] = None) -> Page[TeamDTO]:
+        predicate, rank = search_predicate(DBTeam.search_vector, DBTeam.name, text)
+        stmt = (
+            select(*self._columns, rank.label("rank"))
+            .where(predicate)
+            .order_by(rank.desc(), DBTeam.id)
+            .limit(limit + 1)
+        )
+
+        if cursor:
+            stmt = stmt.where(after_rank(rank, DBTeam.id, cursor))
+
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = RankCursor(rank=rows[-1].rank, id=rows[-1].id)
+
+        return Page(items=[self._to_dto(row) for row in rows], next_cursor=next_cursor)
+
+
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[TeamDTO]:
+        stmt = (
+            select(*self._columns)
+            .order_by(DBTeam.created_at, DBTeam.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+
+        async for rows in result.partitions():
+            for row in rows:
+                yield self._to_dto(row)
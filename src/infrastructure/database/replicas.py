@@ -0,0 +1,56 @@
+import asyncio
+import itertools
+import logging
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaPool:
+
+    def __init__(self, session_makers: List[async_sessionmaker], retry_after: float = 30,
+                 clock: Callable[[], float] = time.monotonic):
+        self._session_makers = session_makers
+        self._retry_after = retry_after
+        self._clock = clock
+        self._unhealthy_until: Dict[int, float] = {}
+        self._round_robin = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._session_makers)
+
+    def choose(self) -> Optional[Tuple[int, async_sessionmaker]]:
+        now = self._clock()
+
+        for _ in range(len(self._session_makers)):
+            index = next(self._round_robin) % len(self._session_makers)
+            if self._unhealthy_until.get(index, 0) <= now:
+                return index, self._session_makers[index]
+
+        return None
+
+    def mark_unhealthy(self, index: int) -> None:
+        logger.warning("Database replica %s is unhealthy, routing reads elsewhere for %ss", index, self._retry_after)
+        self._unhealthy_until[index] = self._clock() + self._retry_after
+
+    def mark_healthy(self, index: int) -> None:
+        self._unhealthy_until.pop(index, None)
+
+    async def check_health(self) -> None:
+        for index, session_maker in enumerate(self._session_makers):
+            try:
+                async with session_maker() as session:
+                    await session.execute(text("SELECT 1"))
+            except Exception:
+                self.mark_unhealthy(index)
+            else:
+                self.mark_healthy(index)
+
+    async def run_health_checks(self, interval: float) -> None:
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval)
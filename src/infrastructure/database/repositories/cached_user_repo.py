@@ -0,0 +1,128 @@
+import uuid
+from typing import AsyncIterator, Iterable, List, Optional, Set
+
+from application.uow.interfaces import IUnitOfWork
+from application.users.interfaces import IUserRepository
+
+from domain.user.model import User as DomainUser
+from infrastructure.cache.user_cache import UserCache
+
+
+class CachedUserRepository(IUserRepository):
+
+    def __init__(self, repository: IUserRepository, cache: UserCache, uow: IUnitOfWork, populate: bool = True):
+        self._repository = repository
+        self._cache = cache
+        self._uow = uow
+        self._populate = populate
+
+        # Users written in this unit of work are read from the session until the commit lands
+        self._dirty: Set[uuid.UUID] = set()
+
+
+    def _mark_dirty(self, user_id: uuid.UUID) -> None:
+        if not self._dirty:
+            self._uow.on_commit(self._invalidate_dirty)
+        self._dirty.add(user_id)
+
+    def _invalidate_dirty(self) -> None:
+        self._cache.invalidate(self._dirty)
+        self._dirty = set()
+
+
+    async def get_by_id(self, user_id: uuid.UUID) -> Optional[DomainUser]:
+        if user_id not in self._dirty:
+            user = self._cache.get(user_id)
+            if user is not None:
+                return user
+
+        load_sequence = self._cache.begin_load()
+        user = await self._repository.get_by_id(user_id)
+
+        if self._populate and user is not None and user_id not in self._dirty:
+            self._cache.put(user, load_sequence)
+
+        return user
+
+
+    async def get_user_by_email(self, email: str) -> Optional[DomainUser]:
+        user = self._cache.get_by_email(email)
+        if user is not None and user.id not in self._dirty:
+            return user
+
+        load_sequence = self._cache.begin_load()
+        user = await self._repository.get_user_by_email(email)
+
+        if self._populate and user is not None and user.id not in self._dirty:
+            self._cache.put(user, load_sequence)
+
+        return user
+
+
+    async def get_many(self, user_ids: Iterable[uuid.UUID]) -> List[DomainUser]:
+        users = []
+        missing_ids = set()
+
+        for user_id in set(user_ids):
+            user = self._cache.get(user_id) if user_id not in self._dirty else None
+            if user is None:
+                missing_ids.add(user_id)
+            else:
+                users.append(user)
+
+        if missing_ids:
+            load_sequence = self._cache.begin_load()
+            loaded_users = await self._repository.get_many(missing_ids)
+
+            for user in loaded_users:
+                if self._populate and user.id not in self._dirty:
+                    self._cache.put(user, load_sequence)
+
+            users.extend(loaded_users)
+
+        return users
+
+
+    async def get_version(self, user_id: uuid.UUID) -> Optional[int]:
+        # Read from the database, another worker may have committed a newer version than the cached one
+        version = await self._repository.get_version(user_id)
+
+        cached = self._cache.get(user_id)
+        if cached is not None and cached.version != version:
+            self._cache.invalidate([user_id])
+
+        return version
+
+
+    async def get(self) -> List[DomainUser]:
+        return await self._repository.get()
+
+
+    def stream(self, batch_size: int = 1000) -> AsyncIterator[DomainUser]:
+        return self._repository.stream(batch_size)
+
+
+    async def exists_by_email(self, email: str) -> bool:
+        return await self._repository.exists_by_email(email)
+
+
+    async def exists_by_username(self, username: str) -> bool:
+        return await self._repository.exists_by_username(username)
+
+
+    async def add(self, user_data: DomainUser) -> DomainUser:
+        return await self._repository.add(user_data)
+
+
+    async def try_add(self, user_data: DomainUser) -> bool:
+        return await self._repository.try_add(user_data)
+
+
+    async def update(self, user_data: DomainUser) -> DomainUser:
+        self._mark_dirty(user_data.id)
+        return await self._repository.update(user_data)
+
+
+    async def delete(self, user_id: uuid.UUID) -> None:
+        self._mark_dirty(user_id)
+        await self._repository.delete(user_id)
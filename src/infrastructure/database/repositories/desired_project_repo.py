@@ -1,87 +1,79 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import select, delete, func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.desired_project.model import DesiredProject as DomainDesiredProject
 from domain.shared.value_object import TechValueObject
 from application.desired_projects.interfaces import IDesiredProjectRepository
 
+from infrastructure.database.counters import DESIRED_PROJECTS_COUNT, adjust_counters, lock_counters
+from infrastructure.database.expressions import in_lookups, lookup_id
+from infrastructure.database.identity_map import IdentityMap
 from infrastructure.database.models.desired_projects import (
     DesiredProject as DBDesiredProject,
     TechnologyToDesiredProject as DBDesiredTech
 )
+from infrastructure.database.models.projects import Technology as DBTechnology
 
 
 class DesiredProjectRepository(IDesiredProjectRepository):
-    def __init__(self, session: AsyncSession):
-        self.session = session
-
-    async def _populate_db_model_from_domain(
-            self,
-            db_project: DBDesiredProject,
-            domain_project: DomainDesiredProject
-    ) -> None:
 
-        db_project.amount_of_people = domain_project.amount_of_people
-        db_project.description = domain_project.description
-        db_project.user_id = domain_project.user_id
+    # Domain fields recorded in the change log that map one to one onto desired_projects columns
+    DESIRED_PROJECT_COLUMNS = {"description", "amount_of_people"}
 
-        current_techs_map = {link.technology_id: link for link in db_project.technologies}
-
-        target_tech_ids = {tech.value for tech in domain_project.stack_technologies}
+    def __init__(self, session: AsyncSession, identity_map: Optional[IdentityMap] = None):
+        self.session = session
+        self.identity_map = identity_map if identity_map is not None else IdentityMap()
 
-        for tech_id, db_link in current_techs_map.items():
-            if tech_id not in target_tech_ids:
-                await self.session.delete(db_link)
+    async def _insert_technologies(self, desired_project_id: uuid.UUID, technologies) -> None:
+        if not technologies:
+            return
 
-        for tech_id in target_tech_ids:
-            if tech_id not in current_techs_map:
-                new_link = DBDesiredTech(
-                    desired_project_id=db_project.id,
-                    technology_id=tech_id
-                )
-                self.session.add(new_link)
+        await self.session.execute(insert(DBDesiredTech).values([
+            {"desired_project_id": desired_project_id, "technology_id": lookup_id(DBTechnology, tech)}
+            for tech in technologies
+        ]))
 
     def _to_domain(self, db_project: DBDesiredProject) -> DomainDesiredProject:
         tech_vo = TechValueObject(
             description=db_project.description or "",
-            technologies={t.technology.name for t in db_project.technologies}
+            technology_mask=db_project.tech_mask
         )
 
         return DomainDesiredProject._reconstitute(
             id=db_project.id,
-            user_id=db_project.user_id,
+            owner_id=db_project.user_id,
             amount_of_people=db_project.amount_of_people,
             tech_profile=tech_vo
         )
 
+    def _hydrate(self, db_project: DBDesiredProject) -> DomainDesiredProject:
+        # A desired project already loaded in this unit of work keeps its in-memory changes
+        project = self.identity_map.peek(DomainDesiredProject, db_project.id)
+        if project is None:
+            project = self.identity_map.add(DomainDesiredProject, db_project.id, self._to_domain(db_project))
+        return project
+
 
     async def get(self) -> List[DomainDesiredProject]:
-        stmt = (
-            select(DBDesiredProject)
-            .options(
-                selectinload(DBDesiredProject.technologies)
-                .selectinload(DBDesiredTech.technology)
-            )
-        )
+        stmt = select(DBDesiredProject)
 
         result = await self.session.execute(stmt)
         db_desired_projects = result.scalars().all()
 
-        return [self._to_domain(db_desired_project) for db_desired_project in db_desired_projects]
+        return [self._hydrate(db_desired_project) for db_desired_project in db_desired_projects]
 
 
     async def get_by_id(self, project_id: uuid.UUID) -> Optional[DomainDesiredProject]:
+        project = self.identity_map.get(DomainDesiredProject, project_id)
+        if project is not None:
+            return project
+
         stmt = (
             select(DBDesiredProject)
             .where(DBDesiredProject.id == project_id)
-            .options(
-                selectinload(DBDesiredProject.technologies)
-                .selectinload(DBDesiredTech.technology)
-            )
         )
         result = await self.session.execute(stmt)
         db_project = result.scalar_one_or_none()
@@ -89,57 +81,79 @@ class DesiredProjectRepository(IDesiredProjectRepository):
         if not db_project:
             return None
 
-        return self._to_domain(db_project)
+        return self._hydrate(db_project)
 
 
     async def get_by_user(self, user_id: uuid.UUID) -> List[DomainDesiredProject]:
         stmt = (
             select(DBDesiredProject)
             .where(DBDesiredProject.user_id == user_id)
-            .options(
-                selectinload(DBDesiredProject.technologies)
-                .selectinload(DBDesiredTech.technology)
-            )
         )
 
         result = await self.session.execute(stmt)
-        return [self._to_domain(p) for p in result.scalars().all()]
+        return [self._hydrate(p) for p in result.scalars().all()]
 
 
     async def add(self, domain_project: DomainDesiredProject) -> None:
-        db_project = DBDesiredProject(id=domain_project.id)
-        db_project.technologies = []
+        await self.session.execute(
+            insert(DBDesiredProject).values(
+                id=domain_project.id,
+                user_id=domain_project.owner_id,
+                amount_of_people=domain_project.amount_of_people,
+                description=domain_project.description,
+                tech_mask=domain_project.technology_mask
+            )
+        )
+        await self._insert_technologies(domain_project.id, domain_project.stack_technologies)
+        await adjust_counters(self.session, DESIRED_PROJECTS_COUNT, {domain_project.owner_id: 1})
+
+        domain_project.changes.clear()
+        self.identity_map.add(DomainDesiredProject, domain_project.id, domain_project)
 
-        await self._populate_db_model_from_domain(db_project, domain_project)
-        self.session.add(db_project)
 
     async def update(self, domain_project: DomainDesiredProject) -> None:
-        stmt = (
-            select(DBDesiredProject)
-            .where(DBDesiredProject.id == domain_project.id)
-            .options(selectinload(DBDesiredProject.technologies))
-        )
+        changes = domain_project.changes
+
+        if not changes.has_changes:
+            return
+
+        values = {name: getattr(domain_project, name) for name in changes.fields
+                  if name in self.DESIRED_PROJECT_COLUMNS}
+        if changes.added_technologies or changes.removed_technologies:
+            values["tech_mask"] = domain_project.technology_mask
+        if values:
+            result = await self.session.execute(
+                update(DBDesiredProject).where(DBDesiredProject.id == domain_project.id).values(**values)
+            )
 
-        result = await self.session.execute(stmt)
-        db_project = result.scalar_one_or_none()
+            if result.rowcount == 0:
+                raise ValueError(f"Desired Project with ID {domain_project.id} not found")
 
-        if not db_project:
-            raise ValueError(f"Desired Project with ID {domain_project.id} not found")
+        if changes.removed_technologies:
+            await self.session.execute(
+                delete(DBDesiredTech)
+                .where(
+                    DBDesiredTech.desired_project_id == domain_project.id,
+                    in_lookups(DBDesiredTech.technology_id, DBTechnology, changes.removed_technologies)
+                )
+            )
+
+        await self._insert_technologies(domain_project.id, changes.added_technologies)
 
-        await self._populate_db_model_from_domain(db_project, domain_project)
+        changes.clear()
 
 
     async def delete(self, project_id: uuid.UUID) -> None:
-        stmt = delete(DBDesiredProject).where(DBDesiredProject.id == project_id)
-        await self.session.execute(stmt)
+        stmt = delete(DBDesiredProject).where(DBDesiredProject.id == project_id).returning(DBDesiredProject.user_id)
+        result = await self.session.execute(stmt)
 
+        user_id = result.scalar_one_or_none()
+        if user_id is not None:
+            await adjust_counters(self.session, DESIRED_PROJECTS_COUNT, {user_id: -1})
+        self.identity_map.remove(DomainDesiredProject, project_id)
 
-    async def count_desired_project_for_user(self, user_id: uuid.UUID):
-        stmt = (
-            select(func.count())
-            .select_from(DBDesiredProject)
-            .where(DBDesiredProject.user_id == user_id)
-        )
 
-        result = await self.session.execute(stmt)
-        return result.scalar()
\ No newline at end of file
+    # Primary key read of users.desired_projects_count, locked until the unit of work ends
+    async def count_desired_project_for_user(self, user_id: uuid.UUID) -> int:
+        counts = await lock_counters(self.session, DESIRED_PROJECTS_COUNT, [user_id])
+        return counts[user_id]
\ No newline at end of file
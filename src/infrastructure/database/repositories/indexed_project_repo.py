@@ -0,0 +1,55 @@
+import uuid
+from typing import List, Optional
+
+from application.matching.interfaces import IMatchingIndex
+from application.projects.interfaces import IProjectRepository
+from application.uow.interfaces import IUnitOfWork
+
+from domain.project.model import Project as DomainProject
+
+
+class IndexedProjectRepository(IProjectRepository):
+
+    def __init__(self, repository: IProjectRepository, index: IMatchingIndex, uow: IUnitOfWork):
+        self._repository = repository
+        self._index = index
+        self._uow = uow
+
+    # The index is shared by every request, so it only sees a project once the write is committed
+    def _reindex(self, project: DomainProject) -> None:
+        self._uow.on_commit(lambda: self._index.upsert_project(project))
+
+
+    async def get_project_by_name(self, name: str) -> Optional[DomainProject]:
+        return await self._repository.get_project_by_name(name)
+
+    async def exists_project_by_name(self, name: str) -> bool:
+        return await self._repository.exists_project_by_name(name)
+
+    async def count_project_for_member(self, user_id: uuid.UUID) -> int:
+        return await self._repository.count_project_for_member(user_id)
+
+    async def get(self) -> List[DomainProject]:
+        return await self._repository.get()
+
+    async def get_by_id(self, id: uuid.UUID) -> Optional[DomainProject]:
+        return await self._repository.get_by_id(id)
+
+
+    async def add(self, project: DomainProject) -> None:
+        await self._repository.add(project)
+        self._reindex(project)
+
+    async def try_add(self, project: DomainProject) -> bool:
+        added = await self._repository.try_add(project)
+        if added:
+            self._reindex(project)
+        return added
+
+    async def update(self, project: DomainProject) -> None:
+        await self._repository.update(project)
+        self._reindex(project)
+
+    async def delete(self, id: uuid.UUID) -> None:
+        await self._repository.delete(id)
+        self._uow.on_commit(lambda: self._index.remove(id))
@@ -1,109 +1,178 @@
+import dataclasses
 import uuid
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, delete, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from application.projects.interfaces import IProjectRepository
 from infrastructure.database.models.projects import (Project as DBProject, ProjectParticipant as DBProjectParticipant,
+                                                     ProjectParticipantRole as DBProjectParticipantRole,
+                                                     StatusProject as DBStatusProject, Technology as DBTechnology,
                                                      TechnologyToProject as DBTechnologyToProject)
 from domain.project.model import Project as DomainProject, ProjectParticipant as DomainProjectParticipant
 from domain.project.enum import ProjectRoleEnum, StatusProjectEnum
 from domain.shared.enum import TechnologyEnum
 from domain.shared.value_object import TechValueObject
+from infrastructure.database.counters import PROJECTS_COUNT, adjust_counters, count_deltas, lock_counters
+from infrastructure.database.expressions import in_lookups, in_uuids, lookup_id
+from infrastructure.database.identity_map import IdentityMap
+
+
+# Domain field recorded in the change log -> projects column
+PROJECT_COLUMNS = {
+    "name": "name",
+    "description": "description",
+    "logo": "logo",
+    "url_project": "url_project",
+    "team_id": "team_id",
+    "status": "status_id",
+}
+
+
+@dataclasses.dataclass(frozen=True)
+class ProjectChangeSet:
+    # Rows to write with set-based statements instead of per-row session work,
+    # lookup ids are subselects on the lookup tables by name
+    values: Dict[str, Any]
+    participants: List[dict]
+    removed_participants: List[uuid.UUID]
+    technologies: List[dict]
+    removed_technologies: List[TechnologyEnum]
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.values or self.participants or self.removed_participants
+                    or self.technologies or self.removed_technologies)
+
+    @staticmethod
+    def _values(project: DomainProject) -> Dict[str, Any]:
+        return {
+            "name": project.name,
+            "description": project.description,
+            "logo": project.logo,
+            "url_project": project.url_project,
+            "team_id": project.team_id,
+            "status_id": lookup_id(DBStatusProject, project.status) if project.status else None,
+            "tech_mask": project.technology_mask,
+        }
+
+    @staticmethod
+    def _participant_row(project: DomainProject, user_id: uuid.UUID) -> dict:
+        participant = project._participants[user_id]
+        role = list(participant.roles)[0]
+        return {"project_id": project.id, "user_id": user_id, "role_id": lookup_id(DBProjectParticipantRole, role)}
+
+    @staticmethod
+    def _technology_row(project: DomainProject, technology: TechnologyEnum) -> dict:
+        return {"project_id": project.id, "technology_id": lookup_id(DBTechnology, technology)}
+
+    @classmethod
+    def from_domain(cls, project: DomainProject) -> 'ProjectChangeSet':
+        return cls(
+            values=cls._values(project),
+            participants=[cls._participant_row(project, user_id) for user_id in project._participants],
+            removed_participants=[],
+            technologies=[cls._technology_row(project, tech) for tech in project.stack_technologies],
+            removed_technologies=[]
+        )
+
+    @classmethod
+    def from_changes(cls, project: DomainProject) -> 'ProjectChangeSet':
+        changes = project.changes
+        values = cls._values(project)
+
+        changed_values = {PROJECT_COLUMNS[name]: values[PROJECT_COLUMNS[name]]
+                          for name in changes.fields if name in PROJECT_COLUMNS}
+        if changes.added_technologies or changes.removed_technologies:
+            changed_values["tech_mask"] = values["tech_mask"]
+
+        return cls(
+            values=changed_values,
+            participants=[cls._participant_row(project, user_id)
+                          for user_id in changes.added_members | changes.re_roled_members],
+            removed_participants=list(changes.removed_members),
+            technologies=[cls._technology_row(project, tech) for tech in changes.added_technologies],
+            removed_technologies=list(changes.removed_technologies)
+        )
 
 
 class ProjectRepository(IProjectRepository):
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, identity_map: Optional[IdentityMap] = None):
         self.session = session
-
-    async def _mapper_db_project_from_domain(self, db_project: DBProject, domain_project: DomainProject) -> None:
-
-        db_project.name = domain_project.name
-        db_project.description = domain_project.description
-        db_project.logo = domain_project.logo
-        db_project.team_id = domain_project.team_id
-
-        if domain_project.status:
-            db_project.status_id = domain_project.status.value
-
-        current_participants_map = {p.user_id: p for p in db_project.project_participant}
-
-        target_participants_map = domain_project._participants
-
-        for user_id, db_participant in current_participants_map.items():
-            if user_id not in target_participants_map:
-                await self.session.delete(db_participant)
-
-        for user_id, domain_participant in target_participants_map.items():
-            db_participant = current_participants_map.get(user_id)
-
-            role_id = list(domain_participant.roles)[0].value
-
-            if db_participant is None:
-                new_db_participant = DBProjectParticipant(
-                    project_id=db_project.id,
-                    user_id=user_id,
-                    role_id=role_id
+        self.identity_map = identity_map if identity_map is not None else IdentityMap()
+
+    def _hydrate(self, db_project: DBProject) -> DomainProject:
+        # A project already loaded in this unit of work keeps its in-memory changes
+        project = self.identity_map.peek(DomainProject, db_project.id)
+        if project is None:
+            project = self.identity_map.add(DomainProject, db_project.id, self._to_domain(db_project))
+        return project
+
+    async def _write_links(self, project_id: uuid.UUID, change_set: ProjectChangeSet) -> None:
+        if change_set.removed_participants:
+            await self.session.execute(
+                delete(DBProjectParticipant)
+                .where(
+                    DBProjectParticipant.project_id == project_id,
+                    in_uuids(DBProjectParticipant.user_id, change_set.removed_participants)
                 )
-                self.session.add(new_db_participant)
-            else:
-                if db_participant.role_id != role_id:
-                    db_participant.role_id = role_id
-
-        current_techs_map = {}
-        for tech_link in db_project.technologies:
-            current_techs_map[tech_link.technology_id] = tech_link
-
-
-        target_tech_ids = {tech.value for tech in domain_project.stack_technologies}
-
-        for tech_id, db_tech_link in current_techs_map.items():
-            if tech_id not in target_tech_ids:
-                await self.session.delete(db_tech_link)
+            )
 
-        for tech_id in target_tech_ids:
-            if tech_id not in current_techs_map:
-                new_tech_link = DBTechnologyToProject(
-                    project_id=db_project.id,
-                    technology_id=tech_id
+        if change_set.participants:
+            stmt = pg_insert(DBProjectParticipant).values(change_set.participants)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DBProjectParticipant.project_id, DBProjectParticipant.user_id],
+                set_={"role_id": stmt.excluded.role_id},
+                where=DBProjectParticipant.role_id.is_distinct_from(stmt.excluded.role_id)
+            )
+            await self.session.execute(stmt)
+
+        if change_set.removed_technologies:
+            await self.session.execute(
+                delete(DBTechnologyToProject)
+                .where(
+                    DBTechnologyToProject.project_id == project_id,
+                    in_lookups(DBTechnologyToProject.technology_id, DBTechnology, change_set.removed_technologies)
                 )
-                self.session.add(new_tech_link)
+            )
+
+        if change_set.technologies:
+            stmt = (
+                pg_insert(DBTechnologyToProject)
+                .values(change_set.technologies)
+                .on_conflict_do_nothing(index_elements=[DBTechnologyToProject.project_id,
+                                                        DBTechnologyToProject.technology_id])
+            )
+            await self.session.execute(stmt)
 
 
     def _to_domain(self, db_project: DBProject) -> DomainProject:
 
         participants = {}
-        for db_part in db_project.project_participant:
+        for db_part in db_project.participants:
 
-            role_enum = ProjectRoleEnum(db_part.role_id)
+            role_enum = ProjectRoleEnum(db_part.role.name)
 
             participants[db_part.user_id] = DomainProjectParticipant(
                 user_id=db_part.user_id,
                 roles={role_enum}
             )
 
-        stack_technologies = set()
-        for tech_link in db_project.technologies:
+        status_enum = StatusProjectEnum(db_project.status.name) if db_project.status else None
 
-            try:
-                tech_enum = TechnologyEnum(tech_link.technology.name)
-                stack_technologies.add(tech_enum)
-            except ValueError:
-                pass
-
-        status_enum = StatusProjectEnum(db_project.status_id)
-
-        tech_profile = TechValueObject(description=db_project.description, technologies=stack_technologies)
+        # The stack comes from the denormalized mask, project_technology is not read on hydration
+        tech_profile = TechValueObject(description=db_project.description, technology_mask=db_project.tech_mask)
 
         return DomainProject._reconstitute(
             id=db_project.id,
             name=db_project.name,
             status=status_enum,
             team_id=db_project.team_id,
-            url_project=getattr(db_project, 'url_project', None),
+            url_project=db_project.url_project,
             logo=db_project.logo,
             tech_profile=tech_profile,
             participants=participants,
@@ -117,11 +186,7 @@ class ProjectRepository(IProjectRepository):
             .options(
                 selectinload(DBProject.status),
                 selectinload(DBProject.participants)
-                    .selectinload(DBProjectParticipant.user),
-                selectinload(DBProject.participants)
-                    .selectinload(DBProjectParticipant.role),
-                selectinload(DBProject.technologies)
-                    .selectinload(DBTechnologyToProject.technology)
+                    .selectinload(DBProjectParticipant.role)
             )
         )
         result = await self.session.execute(stmt)
@@ -130,15 +195,15 @@ class ProjectRepository(IProjectRepository):
         if not db_project:
             return None
 
-        return self._to_domain(db_project)
+        return self._hydrate(db_project)
 
 
     async def get(self) -> List[DomainProject]:
         stmt = (
             select(DBProject)
             .options(
-                selectinload(DBProject.project_participant),
-                selectinload(DBProject.technologies).selectinload(DBTechnologyToProject.technology),
+                selectinload(DBProject.participants)
+                    .selectinload(DBProjectParticipant.role),
                 selectinload(DBProject.status)
             )
         )
@@ -146,21 +211,21 @@ class ProjectRepository(IProjectRepository):
         db_projects = result.scalars().all()
 
 
-        return [self._to_domain(db_project) for db_project in db_projects]
+        return [self._hydrate(db_project) for db_project in db_projects]
 
 
     async def get_by_id(self, id: uuid.UUID) -> Optional[DomainProject]:
+        project = self.identity_map.get(DomainProject, id)
+        if project is not None:
+            return project
+
         stmt = (
             select(DBProject)
             .where(DBProject.id == id)
             .options(
                 selectinload(DBProject.status),
                 selectinload(DBProject.participants)
-                    .selectinload(DBProjectParticipant.user),
-                selectinload(DBProject.participants)
-                    .selectinload(DBProjectParticipant.role),
-                selectinload(DBProject.technologies)
-                    .selectinload(DBTechnologyToProject.technology)
+                    .selectinload(DBProjectParticipant.role)
             )
         )
         result = await self.session.execute(stmt)
@@ -169,39 +234,77 @@ class ProjectRepository(IProjectRepository):
         if not db_project:
             return None
 
-        return self._to_domain(db_project)
+        return self._hydrate(db_project)
 
 
     async def add(self, project: DomainProject) -> None:
-        db_project = DBProject(id=project.id)
-        db_project.project_participant = []
-        db_project.technologies = []
+        change_set = ProjectChangeSet.from_domain(project)
 
-        await self._mapper_db_project_from_domain(db_project, project)
-        self.session.add(db_project)
+        await self.session.execute(pg_insert(DBProject).values(id=project.id, **change_set.values))
+        await self._write_links(project.id, change_set)
+        await adjust_counters(self.session, PROJECTS_COUNT, count_deltas(added=project._participants))
 
+        project.changes.clear()
+        self.identity_map.add(DomainProject, project.id, project)
 
-    async def update(self, project: DomainProject) -> None:
+
+    async def try_add(self, project: DomainProject) -> bool:
+        change_set = ProjectChangeSet.from_domain(project)
+
+        # Untargeted, so a clash on either the name or the logo is reported as a conflict
         stmt = (
-            select(DBProject)
-            .where(DBProject.id == project.id)
-            .options(
-                selectinload(DBProject.project_participant),
-                selectinload(DBProject.technologies)
-            )
+            pg_insert(DBProject)
+            .values(id=project.id, **change_set.values)
+            .on_conflict_do_nothing()
+            .returning(DBProject.id)
         )
         result = await self.session.execute(stmt)
-        db_project = result.scalar_one_or_none()
 
-        if not db_project:
+        if result.scalar_one_or_none() is None:
+            return False
+
+        await self._write_links(project.id, change_set)
+        await adjust_counters(self.session, PROJECTS_COUNT, count_deltas(added=project._participants))
+        project.changes.clear()
+        self.identity_map.add(DomainProject, project.id, project)
+
+        return True
+
+
+    async def update(self, project: DomainProject) -> None:
+        change_set = ProjectChangeSet.from_changes(project)
+
+        if change_set.is_empty:
+            return
+
+        # Link-only changes still bump the version, participants and stack are part of the representation
+        result = await self.session.execute(
+            update(DBProject)
+            .where(DBProject.id == project.id)
+            .values(**change_set.values, version=DBProject.version + 1)
+        )
+
+        if result.rowcount == 0:
             raise ValueError(f"Project {project.id} not found")
 
-        await self._mapper_db_project_from_domain(db_project, project)
+        await self._write_links(project.id, change_set)
+        await adjust_counters(self.session, PROJECTS_COUNT, count_deltas(added=project.changes.added_members,
+                                                                         removed=project.changes.removed_members))
+        project.changes.clear()
 
 
     async def delete(self, id: uuid.UUID) -> None:
+        # The participants go with the project, their users get the slots back
+        result = await self.session.execute(
+            delete(DBProjectParticipant).where(DBProjectParticipant.project_id == id)
+            .returning(DBProjectParticipant.user_id)
+        )
+        await adjust_counters(self.session, PROJECTS_COUNT, count_deltas(removed=result.scalars().all()))
+        await self.session.execute(delete(DBTechnologyToProject).where(DBTechnologyToProject.project_id == id))
+
         stmt = delete(DBProject).where(DBProject.id == id)
         await self.session.execute(stmt)
+        self.identity_map.remove(DomainProject, id)
 
 
     async def exists_project_by_name(self, name: str) -> bool:
@@ -210,11 +313,7 @@ class ProjectRepository(IProjectRepository):
         return result.scalar()
 
 
+    # Primary key read of users.projects_count, locked until the unit of work ends
     async def count_project_for_member(self, user_id: uuid.UUID) -> int:
-        stmt = (
-            select(func.count())
-            .select_from(DBProjectParticipant)
-            .where(DBProjectParticipant.user_id == user_id)
-        )
-        result = await self.session.execute(stmt)
-        return result.scalar()
+        counts = await lock_counters(self.session, PROJECTS_COUNT, [user_id])
+        return counts[user_id]
@@ -0,0 +1,47 @@
+import datetime
+import uuid
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infrastructure.database.models.revoked_tokens import RevokedToken as DBRevokedToken
+
+
+class RevokedTokenRepository:
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(self, jti: str, user_id: Optional[uuid.UUID], expires_at: datetime.datetime) -> None:
+        stmt = (
+            pg_insert(DBRevokedToken)
+            .values(jti=jti, user_id=user_id, expires_at=expires_at, revoked_at=datetime.datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=[DBRevokedToken.jti])
+        )
+        await self.session.execute(stmt)
+
+    async def exists(self, jti: str) -> bool:
+        stmt = select(select(DBRevokedToken.jti).where(DBRevokedToken.jti == jti).exists())
+        result = await self.session.execute(stmt)
+        return result.scalar()
+
+    async def revoked_since(self, since: datetime.datetime) -> List[str]:
+        stmt = select(DBRevokedToken.jti).where(DBRevokedToken.revoked_at >= since)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def stream_active(self, now: datetime.datetime, batch_size: int = 10_000) -> AsyncIterator[str]:
+        stmt = (
+            select(DBRevokedToken.jti)
+            .where(DBRevokedToken.expires_at > now)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for jti in result:
+            yield jti
+
+    async def delete_expired(self, now: datetime.datetime) -> int:
+        result = await self.session.execute(delete(DBRevokedToken).where(DBRevokedToken.expires_at <= now))
+        return result.rowcount
@@ -1,7 +1,8 @@
 import uuid
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
-from sqlalchemy import select, delete, func
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -11,19 +12,38 @@ from domain.team.model import Team as DomainTeam, TeamMember as DomainTeamMember
 
 from infrastructure.database.models import TeamMember as DBTeamMember, Team as DBTeam, TeamRole as DBTeamRole
 from domain.team.enum import TeamRoleEnum
+from infrastructure.database.counters import TEAMS_COUNT, adjust_counters, count_deltas, lock_counters
+from infrastructure.database.expressions import in_uuids, lookup_id
+from infrastructure.database.identity_map import IdentityMap
 
 
 class TeamRepository(ITeamRepository):
-    def __init__(self, session: AsyncSession):
+
+    # Domain fields recorded in the change log that map one to one onto teams columns
+    TEAM_COLUMNS = {"name", "description", "logo"}
+
+    def __init__(self, session: AsyncSession, identity_map: Optional[IdentityMap] = None):
         self.session = session
+        self.identity_map = identity_map if identity_map is not None else IdentityMap()
+
+    def _hydrate(self, db_team: DBTeam) -> DomainTeam:
+        # A team already loaded in this unit of work keeps its in-memory changes
+        team = self.identity_map.peek(DomainTeam, db_team.id)
+        if team is None:
+            team = self.identity_map.add(DomainTeam, db_team.id, self._to_domain(db_team))
+        return team
+
+    @staticmethod
+    def _role(team: DomainTeam, user_id: uuid.UUID) -> TeamRoleEnum:
+        return list(team.get_member(user_id).roles)[0]
 
     def _to_domain(self, db_team: DBTeam) -> DomainTeam:
         domain_members = {
             db_member.user_id: DomainTeamMember(
                 db_member.user_id,
-                db_member.roles,
+                {TeamRoleEnum(db_member.role.name)},
             )
-            for db_member in db_team.team_member
+            for db_member in db_team.members
         }
 
         domain_team = DomainTeam._reconstitute(
@@ -39,23 +59,27 @@ class TeamRepository(ITeamRepository):
 
     async def get(self) -> List[DomainTeam]:
         stmt_teams = (select(DBTeam)
-                 .options(selectinload(DBTeam.team_member)))
+                 .options(selectinload(DBTeam.members).selectinload(DBTeamMember.role)))
 
         result = await self.session.execute(stmt_teams)
 
         db_teams = result.scalars().all()
 
-        return [self._to_domain(db_team) for db_team in db_teams]
+        return [self._hydrate(db_team) for db_team in db_teams]
 
 
     async def get_by_id(self, team_id: str) -> Optional[DomainTeam]:
+        team = self.identity_map.get(DomainTeam, team_id)
+        if team is not None:
+            return team
+
         stmt_teams = (select(DBTeam)
                  .where(DBTeam.id == team_id)
                  .options(
-                    selectinload(DBTeam.team_member)
-                        .selectinload(DBTeamRole.role),
-                    selectinload(DBTeam.team_member)
-                        .selectinload(DBTeamRole.user),
+                    selectinload(DBTeam.members)
+                        .selectinload(DBTeamMember.role),
+                    selectinload(DBTeam.members)
+                        .selectinload(DBTeamMember.user),
             )
         )
 
@@ -63,17 +87,17 @@ class TeamRepository(ITeamRepository):
 
         db_team = result.scalar_one_or_none()
 
-        return self._to_domain(db_team) if db_team else None
+        return self._hydrate(db_team) if db_team else None
 
 
     async def get_team_by_name(self, team_name: str) -> Optional[DomainTeam]:
         stmt_teams = (select(DBTeam)
                 .where(DBTeam.name == team_name)
                 .options(
-                    selectinload(DBTeam.team_member)
-                        .selectinload(DBTeamRole.role),
-                    selectinload(DBTeam.team_member)
-                        .selectinload(DBTeamRole.user),
+                    selectinload(DBTeam.members)
+                        .selectinload(DBTeamMember.role),
+                    selectinload(DBTeam.members)
+                        .selectinload(DBTeamMember.user),
             )
         )
 
@@ -81,7 +105,7 @@ class TeamRepository(ITeamRepository):
 
         db_team = result.scalar_one_or_none()
 
-        return self._to_domain(db_team) if db_team else None
+        return self._hydrate(db_team) if db_team else None
 
 
     async def add(self, team: DomainTeam) -> DomainTeam:
@@ -96,55 +120,98 @@ class TeamRepository(ITeamRepository):
                 DBTeamMember(
                 team_id=db_team.id,
                 user_id=team.owner_id,
-                role_id=TeamRoleEnum.OWNER.value,
+                role_id=lookup_id(DBTeamRole, TeamRoleEnum.OWNER),
             )
         ]
 
-        db_team.team_member = db_team_members
+        db_team.members = db_team_members
 
         self.session.add(db_team)
+        await adjust_counters(self.session, TEAMS_COUNT, {team.owner_id: 1})
+        team.changes.clear()
+        self.identity_map.add(DomainTeam, team.id, team)
 
         return db_team
 
 
+    async def try_add(self, team: DomainTeam) -> bool:
+        # Untargeted, so a clash on either the name or the logo is reported as a conflict
+        stmt = (
+            pg_insert(DBTeam)
+            .values(id=team.id, name=team.name, description=team.description, logo=team.logo)
+            .on_conflict_do_nothing()
+            .returning(DBTeam.id)
+        )
+        result = await self.session.execute(stmt)
+
+        if result.scalar_one_or_none() is None:
+            return False
+
+        self.session.add(DBTeamMember(team_id=team.id, user_id=team.owner_id,
+                                      role_id=lookup_id(DBTeamRole, TeamRoleEnum.OWNER)))
+        await adjust_counters(self.session, TEAMS_COUNT, {team.owner_id: 1})
+        team.changes.clear()
+        self.identity_map.add(DomainTeam, team.id, team)
+
+        return True
+
+
     async def delete(self, team_id: uuid.UUID) -> None:
+        # The memberships go with the team, their users get the slots back
+        result = await self.session.execute(
+            delete(DBTeamMember).where(DBTeamMember.team_id == team_id).returning(DBTeamMember.user_id)
+        )
+        await adjust_counters(self.session, TEAMS_COUNT, count_deltas(removed=result.scalars().all()))
+
         stmt_teams = delete(DBTeam).where(DBTeam.id == team_id)
 
         await self.session.execute(stmt_teams)
+        self.identity_map.remove(DomainTeam, team_id)
 
 
     async def update(self, team_data: DomainTeam) -> None:
-        db_team = await self.session.get(DBTeam, team_data.id)
+        changes = team_data.changes
 
-        if not db_team:
-            raise ValueError(f"Team with id {team_data.id} does not exist")
+        if not changes.has_changes:
+            return
+
+        values = {name: getattr(team_data, name) for name in changes.fields if name in self.TEAM_COLUMNS}
+        # Member changes still bump the version, the members are part of the representation
+        result = await self.session.execute(
+            update(DBTeam).where(DBTeam.id == team_data.id).values(**values, version=DBTeam.version + 1)
+        )
 
-        db_team.name = team_data.name
-        db_team.description = team_data.description
-        db_team.logo = team_data.logo
+        if result.rowcount == 0:
+            raise ValueError(f"Team with id {team_data.id} does not exist")
 
-        db_members_map = {member.user_id: member for member in db_team.team_member}
+        if changes.removed_members:
+            await self.session.execute(
+                delete(DBTeamMember)
+                .where(DBTeamMember.team_id == team_data.id, in_uuids(DBTeamMember.user_id, changes.removed_members))
+            )
 
-        domain_members_map = {member.user_id: member for member in team_data.members}
+        if changes.re_roled_members:
+            members = DBTeamMember.__table__
+            stmt = (
+                update(members)
+                .where(members.c.team_id == bindparam("b_team_id"), members.c.user_id == bindparam("b_user_id"))
+                .values(role_id=select(DBTeamRole.id).where(DBTeamRole.name == bindparam("b_role")).scalar_subquery())
+            )
+            await self.session.execute(stmt, [
+                {"b_team_id": team_data.id, "b_user_id": user_id, "b_role": self._role(team_data, user_id).value}
+                for user_id in changes.re_roled_members
+            ])
 
-        new_db_members = []
-        for user_id, domain_member in domain_members_map.items():
-            db_member = db_members_map.get(user_id)
-            if db_member is None:
-                new_db_members.append(
-                    DBTeamMember(
-                        team_id=db_team.id,
-                        user_id=domain_member.user_id,
-                        role_id=list(domain_member.roles)[0].value
-                    )
-                )
-            else:
-                current_role_id = list(domain_member.roles)[0].value
-                if db_member.role_id != current_role_id:
-                    db_member.role_id = current_role_id
-                new_db_members.append(db_member)
+        if changes.added_members:
+            await self.session.execute(insert(DBTeamMember).values([
+                {"team_id": team_data.id, "user_id": user_id,
+                 "role_id": lookup_id(DBTeamRole, self._role(team_data, user_id))}
+                for user_id in changes.added_members
+            ]))
 
-        db_team.team_member = new_db_members
+        await adjust_counters(self.session, TEAMS_COUNT,
+                              count_deltas(added=changes.added_members, removed=changes.removed_members))
+        changes.clear()
 
 
     async def is_user_owner_any_team(self, user_id: uuid.UUID) -> bool:
@@ -152,7 +219,7 @@ class TeamRepository(ITeamRepository):
             select(DBTeamMember)
             .where(
                 DBTeamMember.user_id == user_id,
-                DBTeamMember.role_id == TeamRoleEnum.OWNER.value
+                DBTeamMember.role_id == lookup_id(DBTeamRole, TeamRoleEnum.OWNER)
             ).exists()
         )
         result = await self.session.execute(stmt_teams)
@@ -162,7 +229,7 @@ class TeamRepository(ITeamRepository):
 
     async def exists_team_by_name(self, team_name: str) -> bool:
         stmt_teams = select(select(DBTeam.id)
-                      .where(DBTeam.name == team_name).exist())
+                      .where(DBTeam.name == team_name).exists())
 
         result = await self.session.execute(stmt_teams)
 
@@ -171,9 +238,11 @@ class TeamRepository(ITeamRepository):
         return db_team
 
 
+    # Primary key reads of users.teams_count, locked until the unit of work ends
     async def count_teams_for_member(self, user_id: uuid.UUID) -> int:
-        stmt_teams = (select(func.count(DBTeamMember.team_id))
-                .where(DBTeamMember.user_id == user_id))
-        result = await self.session.execute(stmt_teams)
+        counts = await lock_counters(self.session, TEAMS_COUNT, [user_id])
+        return counts[user_id]
+
 
-        return result.scalar_one()
\ No newline at end of file
+    async def count_teams_for_members(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, int]:
+        return await lock_counters(self.session, TEAMS_COUNT, user_ids)
@@ -1,15 +1,19 @@
 import uuid
-from typing import List
+from typing import AsyncIterator, Iterable, List, Optional
 
 from sqlalchemy import select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from application.users.interfaces import IUserRepository
 
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
 from domain.user.model import User as DomainUser
-from infrastructure.database.models.users import User as DBUser, UserPlatformRole, SocialMediaData
+from infrastructure.database.models.users import (User as DBUser, UserPlatformRole, SocialMediaData,
+                                                  PlatformRole as DBPlatformRole, StatusUser as DBStatusUser)
 from infrastructure.database.models.teams import TeamMember as DBTeamMember
+from infrastructure.database.expressions import in_uuids, lookup_id
 
 
 class UserRepository(IUserRepository):
@@ -23,16 +27,17 @@ class UserRepository(IUserRepository):
         db_user.email = domain_user.email
         db_user.hashed_password = domain_user.hashed_password
         db_user.avatar_url = domain_user.avatar_url
+        db_user.token_version = domain_user.token_version
 
         if domain_user.status_user:
-            db_user.status_id = domain_user.status_user.value
+            db_user.status_id = lookup_id(DBStatusUser, domain_user.status_user)
 
         if domain_user.platform_role:
             new_roles = [
-                UserPlatformRole(platform_role_id=role.value)
+                UserPlatformRole(platform_role_id=lookup_id(DBPlatformRole, role))
                 for role in domain_user.platform_role
             ]
-            db_user.user_platform_role = new_roles
+            db_user.platform_roles = new_roles
 
 
         if not db_user.social_media:
@@ -43,23 +48,31 @@ class UserRepository(IUserRepository):
 
 
     def _to_domain(self, db_user: DBUser) -> DomainUser:
+        social_media = db_user.social_media or SocialMediaData()
         user = DomainUser(
             id=db_user.id,
             username=db_user.username,
             email=db_user.email,
             hashed_password=db_user.hashed_password,
             avatar_url=db_user.avatar_url,
-            linkedin_url=db_user.social_media.linkedin_url,
-            github_url=db_user.social_media.github_url,
-            status_user=db_user.status.name,
-            platform_role=db_user.user_platform_role.platform_role.name,
+            linkedin_url=social_media.linkedin_url,
+            github_url=social_media.github_url,
+            status_user=StatusUserEnum(db_user.status.name) if db_user.status else None,
+            platform_role=[PlatformRoleEnum(role.platform_role.name) for role in db_user.platform_roles],
             created_at=db_user.created_at,
+            token_version=db_user.token_version,
+            version=db_user.version,
         )
         return user
 
 
     async def get(self) -> List[DomainUser]:
-        stmt_users = select(DBUser)
+        stmt_users = (select(DBUser)
+                      .options(
+                        selectinload(DBUser.status),
+                        selectinload(DBUser.social_media),
+                        selectinload(DBUser.platform_roles).selectinload(UserPlatformRole.platform_role),
+                      ))
 
         result = await self.session.execute(stmt_users)
 
@@ -68,15 +81,35 @@ class UserRepository(IUserRepository):
         return [self._to_domain(db_user) for db_user in db_users]
 
 
+    async def stream(self, batch_size: int = 1000) -> AsyncIterator[DomainUser]:
+        stmt_users = (select(DBUser)
+                      .options(
+                        selectinload(DBUser.status),
+                        selectinload(DBUser.social_media),
+                        selectinload(DBUser.platform_roles).selectinload(UserPlatformRole.platform_role),
+                      )
+                      .order_by(DBUser.created_at, DBUser.id)
+                      .execution_options(yield_per=batch_size))
+
+        result = await self.session.stream_scalars(stmt_users)
+
+        async for db_users in result.partitions():
+            for db_user in db_users:
+                yield self._to_domain(db_user)
+
+            # Drop the exported batch from the identity map to keep memory flat
+            self.session.expunge_all()
+
+
     async def get_by_id(self, user_id: str) -> DomainUser | None:
         stmt_users = (select(DBUser)
                       .where(DBUser.id == user_id)
                       .options(
                         selectinload(DBUser.status),
-                        selectinload(DBUser.team_member)
+                        selectinload(DBUser.team_memberships)
                             .selectinload(DBTeamMember.participant),
                         selectinload(DBUser.social_media),
-                        selectinload(DBUser.user_platform_role),
+                        selectinload(DBUser.platform_roles).selectinload(UserPlatformRole.platform_role),
             )
         )
 
@@ -87,15 +120,39 @@ class UserRepository(IUserRepository):
         return self._to_domain(db_user) if db_user else None
 
 
+    async def get_version(self, user_id: uuid.UUID) -> Optional[int]:
+        result = await self.session.execute(select(DBUser.version).where(DBUser.id == user_id))
+        return result.scalar_one_or_none()
+
+
+    async def get_many(self, user_ids: Iterable[uuid.UUID]) -> List[DomainUser]:
+        user_ids = set(user_ids)
+        if not user_ids:
+            return []
+
+        stmt_users = (select(DBUser)
+                      .where(in_uuids(DBUser.id, user_ids))
+                      .options(
+                        selectinload(DBUser.status),
+                        selectinload(DBUser.social_media),
+                        selectinload(DBUser.platform_roles).selectinload(UserPlatformRole.platform_role),
+            )
+        )
+
+        result = await self.session.execute(stmt_users)
+
+        return [self._to_domain(db_user) for db_user in result.scalars().all()]
+
+
     async def get_user_by_email(self, email: str) -> DomainUser | None:
         stmt_users = (select(DBUser)
                       .where(DBUser.email == email)
                         .options(
                             selectinload(DBUser.status),
-                            selectinload(DBUser.team_member)
+                            selectinload(DBUser.team_memberships)
                             .selectinload(DBTeamMember.participant),
                             selectinload(DBUser.social_media),
-                            selectinload(DBUser.user_platform_role),
+                            selectinload(DBUser.platform_roles).selectinload(UserPlatformRole.platform_role),
             )
         )
 
@@ -107,7 +164,7 @@ class UserRepository(IUserRepository):
 
 
     async def exists_by_email(self, email: str) -> bool:
-        stmt_users = select(select(DBUser.id).where(DBUser.email == email).exist())
+        stmt_users = select(select(DBUser.id).where(DBUser.email == email).exists())
 
         result = await self.session.execute(stmt_users)
 
@@ -117,7 +174,7 @@ class UserRepository(IUserRepository):
 
 
     async def exists_by_username(self, username: str) -> bool:
-        stmt_users = select(select(DBUser.id).where(DBUser.username == username).exist())
+        stmt_users = select(select(DBUser.id).where(DBUser.username == username).exists())
 
         result = await self.session.execute(stmt_users)
 
@@ -133,12 +190,21 @@ class UserRepository(IUserRepository):
 
 
     async def update(self, user_data: DomainUser) -> DomainUser:
-        db_user = await self.session.get(DBUser, user_data.id)
+        stmt_users = (select(DBUser)
+                      .where(DBUser.id == user_data.id)
+                      .options(selectinload(DBUser.social_media), selectinload(DBUser.platform_roles)))
+        db_user = (await self.session.execute(stmt_users)).scalar_one_or_none()
 
         if not db_user:
             raise ValueError(f"User with id {user_data.id} not found for update.")
 
-        self.__mapper_db_user_to_domain(db_user, db_user)
+        self.__mapper_db_user_to_domain(db_user, user_data)
+        db_user.version = DBUser.version + 1
+
+        # The bump runs in SQL, the new version is read back so the response and its ETag carry it
+        await self.session.flush()
+        await self.session.refresh(db_user, ["version"])
+        user_data.version = db_user.version
 
         return user_data
 
@@ -154,3 +220,36 @@ class UserRepository(IUserRepository):
 
         return user_data
 
+
+    async def try_add(self, user_data: DomainUser) -> bool:
+        # Untargeted, so a clash on either the username or the email is reported as a conflict
+        stmt = (
+            pg_insert(DBUser)
+            .values(
+                id=user_data.id,
+                username=user_data.username,
+                email=user_data.email,
+                hashed_password=user_data.hashed_password,
+                avatar_url=user_data.avatar_url,
+                token_version=user_data.token_version,
+                status_id=lookup_id(DBStatusUser, user_data.status_user) if user_data.status_user else None
+            )
+            .on_conflict_do_nothing()
+            .returning(DBUser.id)
+        )
+        result = await self.session.execute(stmt)
+
+        if result.scalar_one_or_none() is None:
+            return False
+
+        self.session.add(SocialMediaData(
+            user_id=user_data.id,
+            github_url=user_data.github_url,
+            linkedin_url=user_data.linkedin_url
+        ))
+        self.session.add_all([
+            UserPlatformRole(user_id=user_data.id, platform_role_id=lookup_id(DBPlatformRole, role))
+            for role in user_data.platform_role or []
+        ])
+
+        return True
@@ -0,0 +1,36 @@
+import re
+from typing import Optional, Tuple
+
+from sqlalchemy import Float, and_, cast, func, literal, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from application.shared.pagination import RankCursor
+
+# Must match the configuration of the generated search_vector columns
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+MAX_SEARCH_TERMS = 8
+
+
+def prefix_query(text: str) -> Optional[str]:
+    # Every term is matched as a prefix, "tea up" finds "TeamUp backend"
+    terms = re.findall(r"\w+", text.lower())[:MAX_SEARCH_TERMS]
+    if not terms:
+        return None
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def search_predicate(search_vector: ColumnElement, name: ColumnElement,
+                     text: str) -> Tuple[ColumnElement, ColumnElement]:
+    ts_query = func.to_tsquery(SEARCH_CONFIG, prefix_query(text) or "")
+    raw = literal(text)
+
+    # Lexeme matches through the tsvector GIN index, typos in the name through the trigram GIN index
+    predicate = or_(search_vector.op("@@")(ts_query), raw.op("<%")(name))
+    rank = cast(func.ts_rank_cd(search_vector, ts_query) + func.word_similarity(raw, name), Float)
+
+    return predicate, rank
+
+
+def after_rank(rank: ColumnElement, id_column: ColumnElement, cursor: RankCursor) -> ColumnElement:
+    return or_(rank < cursor.rank, and_(rank == cursor.rank, id_column > cursor.id))
@@ -1,12 +1,111 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 from dotenv import load_dotenv
 
+from .instrumentation import instrument_engine
+from .pool import PoolMetrics, instrumented_pool_class
+from .replicas import ReplicaPool
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
+REPLICA_DATABASE_URLS = [url for url in os.getenv("REPLICA_DATABASE_URLS", "").split(",") if url]
+REPLICA_RETRY_AFTER_SECONDS = float(os.getenv("REPLICA_RETRY_AFTER_SECONDS", "30"))
+REPLICA_HEALTH_CHECK_INTERVAL_SECONDS = float(os.getenv("REPLICA_HEALTH_CHECK_INTERVAL_SECONDS", "10"))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+def _env_optional_float(name: str, default: Optional[float]) -> Optional[float]:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return float(value) if value else None
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # asyncpg server-side statement cache and SQLAlchemy's prepared statement cache,
+    # both have to be 0 behind pgbouncer in transaction mode
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    command_timeout: Optional[float] = 60
+    # Leave pooling to pgbouncer
+    use_null_pool: bool = False
+
+    @classmethod
+    def from_env(cls) -> 'EngineSettings':
+        defaults = cls()
+        return cls(
+            pool_size=int(os.getenv("DB_POOL_SIZE", defaults.pool_size)),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", defaults.max_overflow)),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", defaults.pool_timeout)),
+            pool_recycle=int(os.getenv("DB_POOL_RECYCLE", defaults.pool_recycle)),
+            pool_pre_ping=_env_bool("DB_POOL_PRE_PING", defaults.pool_pre_ping),
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", defaults.statement_cache_size)),
+            prepared_statement_cache_size=int(
+                os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", defaults.prepared_statement_cache_size)
+            ),
+            command_timeout=_env_optional_float("DB_COMMAND_TIMEOUT", defaults.command_timeout),
+            use_null_pool=_env_bool("DB_USE_NULL_POOL", defaults.use_null_pool),
+        )
+
 
-engine = create_async_engine(DATABASE_URL)
+# Pool metrics of every engine created by this module, by engine name
+pool_metrics: Dict[str, PoolMetrics] = {}
+
+
+def create_engine(url: str, settings: EngineSettings, name: str = "primary") -> AsyncEngine:
+    connect_args = {
+        "statement_cache_size": settings.statement_cache_size,
+        "prepared_statement_cache_size": settings.prepared_statement_cache_size,
+    }
+    if settings.command_timeout is not None:
+        connect_args["command_timeout"] = settings.command_timeout
+
+    if settings.use_null_pool:
+        return instrument_engine(create_async_engine(url, poolclass=NullPool, connect_args=connect_args))
+
+    metrics = pool_metrics.setdefault(name, PoolMetrics())
+
+    return instrument_engine(create_async_engine(
+        url,
+        poolclass=instrumented_pool_class(metrics),
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow,
+        pool_timeout=settings.pool_timeout,
+        pool_recycle=settings.pool_recycle,
+        pool_pre_ping=settings.pool_pre_ping,
+        connect_args=connect_args,
+    ))
+
+
+engine_settings = EngineSettings.from_env()
+
+engine = create_engine(DATABASE_URL, engine_settings)
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
-Base = declarative_base()
\ No newline at end of file
+
+replica_engines = [
+    create_engine(url, engine_settings, name=f"replica-{index}")
+    for index, url in enumerate(REPLICA_DATABASE_URLS)
+]
+replica_pool = ReplicaPool(
+    [async_sessionmaker(replica_engine, expire_on_commit=False) for replica_engine in replica_engines],
+    retry_after=REPLICA_RETRY_AFTER_SECONDS
+)
+Base = declarative_base()
@@ -1,11 +1,23 @@
-from typing import Type
+from typing import Callable, List, Optional, Type
 
+from sqlalchemy import event
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 from application.uow.interfaces import IUnitOfWork
-from application.projects.interfaces import IProjectRepository
-from application.teams.interfaces import ITeamRepository
+from application.desired_projects.interfaces import IDesiredProjectRepository
+from application.matching.interfaces import IMatchingIndex
+from application.shared.interfaces import IEventPublisher
+from application.projects.interfaces import IProjectQueries, IProjectRepository
+from application.teams.interfaces import ITeamQueries, ITeamRepository
 from application.users.interfaces import IUserRepository
+from domain.shared.events import DomainEvent
+
+from infrastructure.cache.user_cache import UserCache
+from infrastructure.database.identity_map import IdentityMap
+from infrastructure.database.replicas import ReplicaPool
+from infrastructure.database.repositories.cached_user_repo import CachedUserRepository
+from infrastructure.database.repositories.indexed_project_repo import IndexedProjectRepository
 
 
 class UnitOfWork(IUnitOfWork):
@@ -14,33 +26,123 @@ class UnitOfWork(IUnitOfWork):
             session_factory: async_sessionmaker,
             project_repo_class: Type[IProjectRepository],
             team_repo_class: Type[ITeamRepository],
-            user_repo_class: Type[IUserRepository]
+            user_repo_class: Type[IUserRepository],
+            desired_project_repo_class: Type[IDesiredProjectRepository],
+            project_queries_class: Type[IProjectQueries],
+            team_queries_class: Type[ITeamQueries],
+            user_cache: Optional[UserCache] = None,
+            replica_pool: Optional[ReplicaPool] = None,
+            matching_index: Optional[IMatchingIndex] = None,
+            event_publisher: Optional[IEventPublisher] = None
     ):
 
         self._session_factory = session_factory
         self._project_repo_class = project_repo_class
         self._team_repo_class = team_repo_class
         self._user_repo_class = user_repo_class
+        self._desired_project_repo_class = desired_project_repo_class
+        self._project_queries_class = project_queries_class
+        self._team_queries_class = team_queries_class
+        self._user_cache = user_cache
+        self._replica_pool = replica_pool
+        self._matching_index = matching_index
+        self._event_publisher = event_publisher
+        self._commit_callbacks: List[Callable[[], None]] = []
+        self._events: List[DomainEvent] = []
+
+        self._read_only = False
+        self._replica_index: Optional[int] = None
+        self._writes_pending = False
+        # Set once this unit of work committed a write, later reads stay on the primary
+        self._has_written = False
+
+    def read_only(self) -> 'UnitOfWork':
+        self._read_only = True
+        return self
+
+    def _open_session(self):
+        self._replica_index = None
+
+        if self._read_only and not self._has_written and self._replica_pool:
+            replica = self._replica_pool.choose()
+            if replica is not None:
+                self._replica_index, session_factory = replica
+                return session_factory()
+
+        session = self._session_factory()
+        event.listen(session.sync_session, "after_flush", self._track_flush)
+        event.listen(session.sync_session, "do_orm_execute", self._track_execute)
+        return session
+
+    def _track_flush(self, session, flush_context) -> None:
+        self._writes_pending = True
+
+    def _track_execute(self, orm_execute_state) -> None:
+        if not orm_execute_state.is_select:
+            self._writes_pending = True
 
     async def __aenter__(self):
-        self._session = self._session_factory()
+        self._session = self._open_session()
+        self._commit_callbacks = []
+        self._events = []
+        self._writes_pending = False
 
-        self.projects = self._project_repo_class(self._session)
-        self.teams = self._team_repo_class(self._session)
+        # Aggregates are shared across repositories for the lifetime of this session
+        self.identity_map = IdentityMap()
+
+        self.projects = self._project_repo_class(self._session, self.identity_map)
+        self.teams = self._team_repo_class(self._session, self.identity_map)
         self.users = self._user_repo_class(self._session)
+        self.desired_projects = self._desired_project_repo_class(self._session, self.identity_map)
+
+        self.project_queries = self._project_queries_class(self._session)
+        self.team_queries = self._team_queries_class(self._session)
+
+        if self._matching_index is not None:
+            self.projects = IndexedProjectRepository(self.projects, self._matching_index, self)
+
+        if self._user_cache is not None and self._user_cache.enabled:
+            # A lagging replica must not put stale users into the shared cache
+            self.users = CachedUserRepository(self.users, self._user_cache, self,
+                                              populate=self._replica_index is None)
 
         return await super().__aenter__()
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if exc_type:
-            await self.rollback()
-        else:
-            await self.commit()
+        if self._replica_index is not None and exc_type and issubclass(exc_type, (OperationalError, InterfaceError)):
+            self._replica_pool.mark_unhealthy(self._replica_index)
 
-        await self._session.close()
+        try:
+            if exc_type or self._read_only:
+                await self.rollback()
+            else:
+                await self.commit()
+        finally:
+            self._read_only = False
+            await self._session.close()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        self._commit_callbacks.append(callback)
+
+    def emit(self, event: DomainEvent) -> None:
+        self._events.append(event)
 
     async def commit(self):
         await self._session.commit()
+        self._has_written = self._has_written or self._writes_pending
+
+        callbacks, self._commit_callbacks = self._commit_callbacks, []
+        for callback in callbacks:
+            callback()
+
+        # Published only once the data is durable, so subscribers never see a change that was rolled back
+        events, self._events = self._events, []
+        if events and self._event_publisher is not None:
+            await self._event_publisher.publish(events)
 
     async def rollback(self):
-        await self._session.rollback()
\ No newline at end of file
+        await self._session.rollback()
+        self._commit_callbacks = []
+        self._events = []
+        # Rolled back aggregates may hold changes that never reached the database
+        self.identity_map.clear()
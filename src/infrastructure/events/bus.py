@@ -0,0 +1,28 @@
+import logging
+from collections import defaultdict
+from typing import Awaitable, Callable, Dict, List, Sequence, Type
+
+from application.shared.interfaces import IEventPublisher
+from domain.shared.events import DomainEvent
+
+logger = logging.getLogger(__name__)
+
+EventHandler = Callable[[DomainEvent], Awaitable[None]]
+
+
+class EventBus(IEventPublisher):
+
+    def __init__(self):
+        self._handlers: Dict[Type[DomainEvent], List[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: EventHandler) -> None:
+        self._handlers[event_type].append(handler)
+
+    async def publish(self, events: Sequence[DomainEvent]) -> None:
+        for event in events:
+            for handler in self._handlers.get(type(event), ()):
+                # The transaction is already committed, a failing subscriber must not fail the request
+                try:
+                    await handler(event)
+                except Exception:
+                    logger.exception("Handler %r failed for %r", handler, event)
@@ -0,0 +1,132 @@
+import os
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from application.matching.interfaces import IMatchingIndex, ProjectMatch
+from domain.project.enum import StatusProjectEnum
+from domain.project.model import Project as DomainProject
+from domain.shared.tech_mask import count_technologies
+from infrastructure.database.models.projects import (Project as DBProject, ProjectParticipant as DBProjectParticipant,
+                                                     StatusProject as DBStatusProject)
+
+# Share of the score given to technology overlap, the rest goes to how well free seats fit the wanted team size
+MATCHING_TECHNOLOGY_WEIGHT = float(os.getenv("MATCHING_TECHNOLOGY_WEIGHT", "0.7"))
+MATCHING_WARM_UP = os.getenv("MATCHING_WARM_UP", "true").lower() in ("1", "true", "yes")
+
+BucketKey = Tuple[int, int]
+
+
+# Open projects bucketed by (technology mask, free seats). Every project in a bucket scores the same
+# for a given desired project, so ranking only scores buckets, however many projects they hold
+class MatchingIndex(IMatchingIndex):
+    def __init__(self, technology_weight: float = MATCHING_TECHNOLOGY_WEIGHT):
+        if not 0 <= technology_weight <= 1:
+            raise ValueError("Technology weight must be between 0 and 1")
+
+        self._technology_weight = technology_weight
+        self._entries: Dict[uuid.UUID, BucketKey] = {}
+        # Dicts used as insertion ordered sets, older projects rank first within a bucket
+        self._buckets: Dict[BucketKey, Dict[uuid.UUID, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+    def upsert(self, project_id: uuid.UUID, technology_mask: int, free_seats: int, is_open: bool) -> None:
+        self.remove(project_id)
+
+        if not is_open or free_seats <= 0 or not technology_mask:
+            return
+
+        key = (technology_mask, free_seats)
+        self._entries[project_id] = key
+        self._buckets.setdefault(key, {})[project_id] = None
+
+    def remove(self, project_id: uuid.UUID) -> None:
+        key = self._entries.pop(project_id, None)
+        if key is None:
+            return
+
+        bucket = self._buckets[key]
+        del bucket[project_id]
+        if not bucket:
+            del self._buckets[key]
+
+
+    def _score(self, technology_mask: int, amount_of_people: Optional[int],
+               key: BucketKey) -> Optional[Tuple[float, float]]:
+        project_mask, free_seats = key
+
+        shared = technology_mask & project_mask
+        if not shared:
+            return None
+
+        overlap = count_technologies(shared) / count_technologies(technology_mask | project_mask)
+        seat_fit = min(free_seats, amount_of_people) / amount_of_people if amount_of_people else 1.0
+
+        score = self._technology_weight * overlap + (1 - self._technology_weight) * seat_fit
+        return score, overlap
+
+    def rank(self, technology_mask: int, amount_of_people: Optional[int], limit: int,
+             exclude: Iterable[uuid.UUID] = ()) -> List[ProjectMatch]:
+        excluded = set(exclude)
+
+        scored = []
+        for key in self._buckets:
+            result = self._score(technology_mask, amount_of_people, key)
+            if result is not None:
+                scored.append((result[0], result[1], key))
+
+        scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+
+        matches: List[ProjectMatch] = []
+        for score, overlap, key in scored:
+            for project_id in self._buckets[key]:
+                if project_id in excluded:
+                    continue
+
+                matches.append(ProjectMatch(
+                    project_id=project_id,
+                    score=score,
+                    technology_overlap=overlap,
+                    technology_mask=key[0],
+                    free_seats=key[1]
+                ))
+                if len(matches) >= limit:
+                    return matches
+
+        return matches
+
+
+async def load_matching_index(index: IMatchingIndex, session_factory: async_sessionmaker,
+                              batch_size: int = 5000) -> None:
+    participants = (
+        select(func.count())
+        .select_from(DBProjectParticipant)
+        .where(DBProjectParticipant.project_id == DBProject.id)
+        .scalar_subquery()
+    )
+    # status_id is a status_project key, only the status name maps onto StatusProjectEnum.
+    # A project without a status is not open.
+    is_open = func.coalesce(DBStatusProject.name == StatusProjectEnum.ACTIVE.value, False)
+    stmt = (
+        select(DBProject.id, DBProject.tech_mask, participants.label("participants"), is_open.label("is_open"))
+        .outerjoin(DBStatusProject, DBStatusProject.id == DBProject.status_id)
+        .order_by(DBProject.created_at, DBProject.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    async with session_factory() as session:
+        result = await session.stream(stmt)
+
+        async for rows in result.partitions():
+            for row in rows:
+                index.upsert(
+                    row.id,
+                    row.tech_mask,
+                    max(DomainProject.MAX_PARTICIPANTS - row.participants, 0),
+                    row.is_open
+                )
@@ -1,12 +1,13 @@
 import os
 from typing import Optional
 
-from fastapi import APIRouter, Response, Cookie, HTTPException, Depends
+from fastapi import APIRouter, Response, Cookie, Header, HTTPException, Depends
 from dishka.integrations.fastapi import FromDishka, DishkaRoute
 
 from application.auth.dto import TokenResponseDTO, LoginRequestDTO
 from application.users.dto import UserDTO
 from application.auth.service import AuthService
+from application.auth.exceptions import HashingUnavailableException
 
 router = APIRouter(prefix="/auth",
                    tags=["Authentication"],
@@ -34,6 +35,9 @@ async def login(
 
         return TokenResponseDTO(access_token=access_token)
 
+    except HashingUnavailableException as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": "1"})
+
     except ValueError as e:
         raise HTTPException(status_code=401, detail=str(e))
 
@@ -43,7 +47,11 @@ async def register(
         register_data: UserDTO,
         auth_service: FromDishka[AuthService],
 ):
-    access_token, refresh_token = await auth_service.register(register_data)
+    try:
+        access_token, refresh_token = await auth_service.register(register_data)
+
+    except HashingUnavailableException as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": "1"})
 
     response.set_cookie(
         key="refresh_token",
@@ -57,13 +65,23 @@ async def register(
     return TokenResponseDTO(access_token=access_token)
 
 @router.get("/logout")
-def logout(response: Response):
+async def logout(
+        response: Response,
+        auth_service: FromDishka[AuthService],
+        refresh_token: Optional[str] = Cookie(None),
+        authorization: Optional[str] = Header(None),
+):
+    access_token = None
+    if authorization and authorization.lower().startswith("bearer "):
+        access_token = authorization[len("bearer "):]
+
+    await auth_service.logout(refresh_token, access_token)
     response.delete_cookie(key="refresh_token")
 
     return {"message": "Successfully logged out"}
 
 @router.get("/reissue_token", response_model=TokenResponseDTO)
-def reissue_token(
+async def reissue_token(
         auth_service: FromDishka[AuthService],
         refresh_token: Optional[str] = Cookie(None),
 ):
@@ -71,7 +89,7 @@ def reissue_token(
         raise HTTPException(status_code=401, detail="Refresh token not found in cookies!")
 
     try:
-        new_access_token = auth_service.refresh_access_token(refresh_token)
+        new_access_token = await auth_service.refresh_access_token(refresh_token)
         return TokenResponseDTO(access_token=new_access_token)
 
     except ValueError as e:
@@ -1,29 +1,46 @@
-from typing import Type
+from typing import AsyncIterable, Iterable, Type
 
 from fastapi import Depends
 from dishka import Provider, Scope, provide, make_async_container
 from dishka.integrations.fastapi import setup_dishka, FastapiProvider
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
-from application.auth.interfaces import ITokenService, IPasswordHasher
+from application.auth.interfaces import ITokenService, IPasswordHasher, IRevocationStore
 from application.auth.service import AuthService
 from application.teams.services import TeamService
+from application.teams.cache import CachedTeamService, TeamCacheInvalidator
+from application.projects.cache import CachedProjectService, ProjectCacheInvalidator
+from application.shared.interfaces import IEventPublisher, IResponseCache
+from application.matching.interfaces import IMatchingIndex
+from application.matching.services import MatchingService
 from application.uow.interfaces import IUnitOfWork
 from application.projects.services import ProjectService
 from application.users.services import UserService
 from application.users.interfaces import IUserService, IUserRepository
-from application.projects.interfaces import IProjectRepository
-from application.teams.interfaces import ITeamRepository
+from application.projects.interfaces import IProjectQueries, IProjectRepository
+from application.teams.interfaces import ITeamQueries, ITeamRepository
+from application.desired_projects.interfaces import IDesiredProjectRepository
 
 from infrastructure.auth.jwt import JWTService
+from infrastructure.auth.revocation import RevocationList
+from infrastructure.auth.token_cache import CachedTokenService
 from infrastructure.database.repositories.project_repo import ProjectRepository
 from infrastructure.database.repositories.team_repo import TeamRepository
 from infrastructure.database.repositories.user_repo import UserRepository
+from infrastructure.database.repositories.desired_project_repo import DesiredProjectRepository
+from infrastructure.database.queries.project_queries import ProjectQueries
+from infrastructure.database.queries.team_queries import TeamQueries
 from infrastructure.database.uow.uow import UnitOfWork
-from infrastructure.database.session import async_session_maker
+from infrastructure.database.session import async_session_maker, replica_pool
+from infrastructure.database.replicas import ReplicaPool
+from infrastructure.cache.user_cache import UserCache
+from infrastructure.cache.backends import ICacheBackend, create_cache_backend
+from infrastructure.cache.response_cache import ResponseCache
+from infrastructure.events.bus import EventBus
+from infrastructure.matching.index import MatchingIndex
 from infrastructure.auth.hashing import PasswordHasher
 
-from presentation.security import AuthUserProvider
+from presentation.security import AuthUserProvider, REQUIRE_TOKEN_VERSION
 
 
 class DatabaseProvider(Provider):
@@ -32,16 +49,26 @@ class DatabaseProvider(Provider):
     def get_engine_factory(self) -> async_sessionmaker:
         return async_session_maker
 
+    @provide(scope=Scope.APP)
+    def get_replica_pool(self) -> ReplicaPool:
+        return replica_pool
+
 
 class AuthProvider(Provider):
 
     @provide(scope=Scope.APP)
     def get_token_service(self) -> ITokenService:
-        return JWTService()
+        return CachedTokenService(JWTService())
+
+    @provide(scope=Scope.APP)
+    def get_password_hasher(self) -> Iterable[IPasswordHasher]:
+        password_hasher = PasswordHasher()
+        yield password_hasher
+        password_hasher.shutdown()
 
     @provide(scope=Scope.APP)
-    def get_password_hasher(self) -> IPasswordHasher:
-        return PasswordHasher()
+    def get_revocation_store(self, factory: async_sessionmaker) -> IRevocationStore:
+        return RevocationList(factory)
 
     @provide(scope=Scope.REQUEST)
     def get_auth_service(
@@ -50,13 +77,20 @@ class AuthProvider(Provider):
             user_service: IUserService,
             password_hasher: IPasswordHasher,
             uow: IUnitOfWork,
+            revocation_store: IRevocationStore,
             ) -> AuthService:
         return AuthService(token_service=token_service, uow=uow,
-                           user_service=user_service, password_hasher=password_hasher)
+                           user_service=user_service, password_hasher=password_hasher,
+                           revocation_store=revocation_store,
+                           require_token_version=REQUIRE_TOKEN_VERSION)
 
 
 class UserProvider(Provider):
 
+    @provide(scope=Scope.APP)
+    def get_user_cache(self) -> UserCache:
+        return UserCache()
+
     @provide(scope=Scope.REQUEST)
     def get_user_repository(self) -> Type[IUserRepository]:
         return UserRepository
@@ -73,8 +107,12 @@ class TeamProvider(Provider):
         return TeamRepository
 
     @provide(scope=Scope.REQUEST)
-    def get_team_service(self, uow: IUnitOfWork) -> TeamService:
-        return TeamService(uow)
+    def get_team_queries(self) -> Type[ITeamQueries]:
+        return TeamQueries
+
+    @provide(scope=Scope.REQUEST)
+    def get_team_service(self, uow: IUnitOfWork, cache: IResponseCache) -> TeamService:
+        return CachedTeamService(uow, cache)
 
 
 class ProjectProvider(Provider):
@@ -84,8 +122,56 @@ class ProjectProvider(Provider):
         return ProjectRepository
 
     @provide(scope=Scope.REQUEST)
-    def get_project_service(self, uow: IUnitOfWork) -> ProjectService:
-        return ProjectService(uow)
+    def get_project_queries(self) -> Type[IProjectQueries]:
+        return ProjectQueries
+
+    @provide(scope=Scope.REQUEST)
+    def get_project_service(self, uow: IUnitOfWork, cache: IResponseCache) -> ProjectService:
+        return CachedProjectService(uow, cache)
+
+
+class CacheProvider(Provider):
+
+    @provide(scope=Scope.APP)
+    async def get_cache_backend(self) -> AsyncIterable[ICacheBackend]:
+        backend = create_cache_backend()
+        yield backend
+
+        close = getattr(backend, "aclose", None)
+        if close is not None:
+            await close()
+
+    @provide(scope=Scope.APP)
+    def get_response_cache(self, backend: ICacheBackend) -> IResponseCache:
+        return ResponseCache(backend)
+
+    @provide(scope=Scope.APP)
+    def get_event_publisher(self, cache: IResponseCache) -> IEventPublisher:
+        bus = EventBus()
+
+        for invalidator in (ProjectCacheInvalidator(cache), TeamCacheInvalidator(cache)):
+            for event_type in invalidator.EVENTS:
+                bus.subscribe(event_type, invalidator)
+
+        return bus
+
+
+class DesiredProjectProvider(Provider):
+
+    @provide(scope=Scope.REQUEST)
+    def get_desired_project_repository(self) -> Type[IDesiredProjectRepository]:
+        return DesiredProjectRepository
+
+
+class MatchingProvider(Provider):
+
+    @provide(scope=Scope.APP)
+    def get_matching_index(self) -> IMatchingIndex:
+        return MatchingIndex()
+
+    @provide(scope=Scope.REQUEST)
+    def get_matching_service(self, uow: IUnitOfWork, index: IMatchingIndex) -> MatchingService:
+        return MatchingService(uow, index)
 
 
 class UOWProvider(Provider):
@@ -96,9 +182,18 @@ class UOWProvider(Provider):
             factory: async_sessionmaker,
             project_class: Type[IProjectRepository],
             team_class: Type[ITeamRepository],
-            user_class: Type[IUserRepository]
+            user_class: Type[IUserRepository],
+            desired_project_class: Type[IDesiredProjectRepository],
+            project_queries_class: Type[IProjectQueries],
+            team_queries_class: Type[ITeamQueries],
+            user_cache: UserCache,
+            replicas: ReplicaPool,
+            matching_index: IMatchingIndex,
+            event_publisher: IEventPublisher
     ) -> IUnitOfWork:
-        return UnitOfWork(factory, project_class, team_class, user_class)
+        return UnitOfWork(factory, project_class, team_class, user_class, desired_project_class,
+                          project_queries_class, team_queries_class, user_cache, replicas, matching_index,
+                          event_publisher)
 
 
 container = make_async_container(
@@ -109,6 +204,9 @@ container = make_async_container(
     UserProvider(),
     TeamProvider(),
     ProjectProvider(),
+    CacheProvider(),
+    DesiredProjectProvider(),
+    MatchingProvider(),
     AuthUserProvider()
 )
 
@@ -0,0 +1,34 @@
+from typing import Optional, Set
+
+from fastapi import Response, status
+
+
+def etag_for(version: int) -> str:
+    return f'"v{version}"'
+
+
+def parse_if_none_match(header: Optional[str]) -> Set[int]:
+    # Versions the client already holds, tags this API did not issue are ignored
+    versions = set()
+    if not header:
+        return versions
+
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+
+        tag = tag.strip('"')
+        if tag.startswith("v") and tag[1:].isdigit():
+            versions.add(int(tag[1:]))
+
+    return versions
+
+
+def not_modified(version: int) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag_for(version)})
+
+
+def set_etag(response: Response, version: Optional[int]) -> None:
+    if version is not None:
+        response.headers["ETag"] = etag_for(version)
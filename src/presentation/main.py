@@ -1,15 +1,50 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 
+from application.auth.interfaces import IRevocationStore, ITokenService
+from application.matching.interfaces import IMatchingIndex
+from application.shared.interfaces import IResponseCache
 from presentation.dependencies import init_dependencies
+from infrastructure.database.identity_map import identity_map_metrics
+from infrastructure.auth.revocation import REVOCATION_SYNC_INTERVAL_SECONDS, run_revocation_sync
+from infrastructure.metrics.prometheus import render_gauges
+from infrastructure.matching.index import MATCHING_WARM_UP, load_matching_index
+from infrastructure.database.session import async_session_maker, pool_metrics, replica_pool, REPLICA_HEALTH_CHECK_INTERVAL_SECONDS
+
+from presentation.middleware import QueryStatsMiddleware, REQUEST_HISTOGRAMS
 
 from presentation.auth.router import router as auth_router
+from presentation.matching.router import router as matching_router
 from presentation.projects.router import router as project_router
+from presentation.teams.router import router as team_router
+from presentation.users.routers import router as user_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    health_checks = None
+    if len(replica_pool):
+        health_checks = asyncio.create_task(replica_pool.run_health_checks(REPLICA_HEALTH_CHECK_INTERVAL_SECONDS))
+
+    if MATCHING_WARM_UP:
+        matching_index = await app.state.dishka_container.get(IMatchingIndex)
+        await load_matching_index(matching_index, async_session_maker)
+
+    # Loaded before serving, until then every revocation check goes to the database
+    revocation_store = await app.state.dishka_container.get(IRevocationStore)
+    await revocation_store.sync()
+    revocation_sync = asyncio.create_task(run_revocation_sync(revocation_store, REVOCATION_SYNC_INTERVAL_SECONDS))
+
     yield
+
+    for task in (health_checks, revocation_sync):
+        if task is None:
+            continue
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
     container = getattr(app.state, "dishka_container", None)
     if container is not None:
         await container.close()
@@ -18,9 +53,62 @@ app = FastAPI(title="TeamUp endpoint",
               lifespan=lifespan)
 
 init_dependencies(app)
+app.add_middleware(QueryStatsMiddleware)
 app.include_router(auth_router)
 app.include_router(project_router)
+app.include_router(matching_router)
+app.include_router(team_router)
+app.include_router(user_router)
 
 @app.get("/")
 def health_check():
-    return {"message": "I am alive. Welcome to the app!"}
\ No newline at end of file
+    return {"message": "I am alive. Welcome to the app!"}
+
+@app.get("/metrics/db-pool")
+def db_pool_metrics():
+    return {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+
+@app.get("/metrics/identity-map")
+def identity_map_metrics_view():
+    return identity_map_metrics.as_dict()
+
+@app.get("/metrics/response-cache")
+async def response_cache_metrics():
+    cache = await app.state.dishka_container.get(IResponseCache)
+    return cache.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def prometheus_metrics():
+    lines = []
+    for histogram in REQUEST_HISTOGRAMS:
+        lines += histogram.render()
+
+    pool_snapshots = {name: metrics.snapshot() for name, metrics in pool_metrics.items()}
+    for field in sorted({field for snapshot in pool_snapshots.values() for field in snapshot}):
+        lines += render_gauges(f"db_pool_{field}", f"Connection pool {field.replace('_', ' ')}.",
+                               [({"engine": name}, snapshot[field])
+                                for name, snapshot in pool_snapshots.items() if field in snapshot])
+
+    for field, value in identity_map_metrics.as_dict().items():
+        lines += render_gauges(f"identity_map_{field}_total", f"Identity map {field.replace('_', ' ')}.",
+                               [({}, value)], kind="counter")
+
+    cache = await app.state.dishka_container.get(IResponseCache)
+    lines += render_gauges("response_cache_stat", "Response cache statistics.",
+                           [({"stat": name}, value) for name, value in sorted(cache.stats().items())])
+
+    revocation_store = await app.state.dishka_container.get(IRevocationStore)
+    revocation_stats = getattr(revocation_store, "stats", None)
+    if revocation_stats is not None:
+        lines += render_gauges("token_revocation_total", "Token revocation list activity.",
+                               [({"event": name}, value) for name, value in revocation_stats.as_dict().items()],
+                               kind="counter")
+
+    token_service = await app.state.dishka_container.get(ITokenService)
+    token_cache_stats = getattr(token_service, "stats", None)
+    if token_cache_stats is not None:
+        lines += render_gauges("token_claims_cache_total", "Verified token claims cache activity.",
+                               [({"event": name}, value) for name, value in token_cache_stats.as_dict().items()],
+                               kind="counter")
+
+    return PlainTextResponse("\n".join(lines) + "\n", media_type="text/plain; version=0.0.4")
@@ -0,0 +1,22 @@
+from typing import List
+
+from fastapi import APIRouter, Query
+from dishka.integrations.fastapi import FromDishka, DishkaRoute
+
+from application.matching.dto import DesiredProjectMatchesDTO, MatchingFilterDTO
+from application.matching.services import MatchingService
+from application.auth.dto import AuthPrincipal
+
+
+router = APIRouter(prefix="/matching",
+                   tags=["Matching"],
+                   route_class=DishkaRoute)
+
+
+@router.get("/me", response_model=List[DesiredProjectMatchesDTO])
+async def get_my_matches(
+    current_user: FromDishka[AuthPrincipal],
+    matching_service: FromDishka[MatchingService],
+    limit: int = Query(20, ge=1, le=100)
+):
+    return await matching_service.match_for_user(current_user.id, MatchingFilterDTO(limit=limit))
@@ -0,0 +1,104 @@
+import json
+import logging
+import os
+import time
+
+from starlette.routing import Match
+
+from infrastructure.database.instrumentation import RequestStats, current_request_stats
+from infrastructure.metrics.prometheus import Histogram, STATEMENT_COUNT_BUCKETS
+
+logger = logging.getLogger("teamup.requests")
+
+QUERY_STATS_HEADERS = os.getenv("QUERY_STATS_HEADERS", "false").lower() in ("1", "true", "yes")
+QUERY_STATS_STATEMENT_WARNING = int(os.getenv("QUERY_STATS_STATEMENT_WARNING", "20"))
+
+# Labeled by route template, never by raw path, to keep the series count bounded
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "Request latency by route template.", ("method", "route", "status"),
+)
+REQUEST_DB_STATEMENTS = Histogram(
+    "http_request_db_statements", "SQL statements issued per request.", ("method", "route"),
+    buckets=STATEMENT_COUNT_BUCKETS,
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "Time spent executing SQL per request.", ("method", "route"),
+)
+REQUEST_POOL_WAIT_SECONDS = Histogram(
+    "http_request_db_pool_wait_seconds", "Time spent waiting for a pooled connection per request.", ("method", "route"),
+)
+REQUEST_HISTOGRAMS = (REQUEST_DURATION, REQUEST_DB_STATEMENTS, REQUEST_DB_SECONDS, REQUEST_POOL_WAIT_SECONDS)
+
+
+def route_template(scope) -> str:
+    app = scope.get("app")
+    for route in getattr(getattr(app, "router", None), "routes", ()):
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return "<unmatched>"
+
+
+class QueryStatsMiddleware:
+
+    def __init__(self, app, expose_headers: bool = QUERY_STATS_HEADERS):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_stats(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.expose_headers:
+                    # Covers the statements issued before the response started, which is all of them
+                    # except for streamed bodies
+                    headers = list(message.get("headers", []))
+                    headers += [
+                        (b"x-db-statements", str(stats.statements).encode()),
+                        (b"x-db-time-ms", f"{stats.db_seconds * 1000:.2f}".encode()),
+                        (b"x-db-pool-wait-ms", f"{stats.pool_wait_seconds * 1000:.2f}".encode()),
+                    ]
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            current_request_stats.reset(token)
+            self._record(scope, stats, status, time.perf_counter() - started)
+
+    def _record(self, scope, stats: RequestStats, status: int, seconds: float) -> None:
+        method = scope["method"]
+        route = route_template(scope)
+
+        REQUEST_DURATION.observe(seconds, method, route, str(status))
+        REQUEST_DB_STATEMENTS.observe(stats.statements, method, route)
+        REQUEST_DB_SECONDS.observe(stats.db_seconds, method, route)
+        REQUEST_POOL_WAIT_SECONDS.observe(stats.pool_wait_seconds, method, route)
+
+        level = logging.WARNING if stats.statements >= QUERY_STATS_STATEMENT_WARNING else logging.INFO
+        if not logger.isEnabledFor(level):
+            return
+
+        logger.log(level, json.dumps({
+            "event": "request",
+            "method": method,
+            "route": route,
+            "status": status,
+            "duration_ms": round(seconds * 1000, 2),
+            "db_statements": stats.statements,
+            "db_time_ms": round(stats.db_seconds * 1000, 2),
+            "db_pool_wait_ms": round(stats.pool_wait_seconds * 1000, 2),
+            "slowest": [{"ms": round(took * 1000, 2), "statement": statement}
+                        for took, statement in stats.slowest_statements()],
+        }))
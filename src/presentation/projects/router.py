@@ -1,11 +1,14 @@
 from typing import List, Set, Optional
 import uuid
 
-from fastapi import APIRouter, Depends, status, HTTPException
+from fastapi import APIRouter, Depends, Header, Query, Response, status, HTTPException
 from dishka.integrations.fastapi import FromDishka, DishkaRoute
 
 from application.projects.dto import (
     ProjectDTO,
+    ProjectFilterDTO,
+    ProjectPageDTO,
+    ProjectSearchDTO,
     ProjectCreateDTO,
     ProjectUpdateDTO,
 
@@ -24,10 +27,15 @@ from application.projects.dto import (
     BatchRemoveParticipantsDTO
 )
 
-from domain.user.model import User as DomainUser
+from application.auth.dto import AuthPrincipal
 from domain.shared.enum import TechnologyEnum
+from domain.project.enum import StatusProjectEnum
 
 from application.projects.services import ProjectService
+from application.shared.exceptions import AlreadyExistsException, NotModifiedException, ValidationException
+
+from presentation.etag import not_modified, parse_if_none_match, set_etag
+from presentation.streaming import ndjson_response
 
 router = APIRouter(prefix="/projects",
                    tags=["Projects"],
@@ -37,33 +45,87 @@ router = APIRouter(prefix="/projects",
 # CRUD OPERATIONS
 # =========================================================================
 
-@router.get("/", response_model=List[ProjectDTO])
+@router.get("/", response_model=ProjectPageDTO)
 async def get_all_projects(
+    project_service: FromDishka[ProjectService],
+    status_project: Optional[StatusProjectEnum] = Query(None, alias="status"),
+    team_id: Optional[uuid.UUID] = None,
+    technology: Optional[TechnologyEnum] = None,
+    any_technology: Optional[List[TechnologyEnum]] = Query(None),
+    all_technology: Optional[List[TechnologyEnum]] = Query(None),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    filters = ProjectFilterDTO(
+        status=status_project,
+        team_id=team_id,
+        technology=technology,
+        any_technologies=set(any_technology or ()),
+        all_technologies=set(all_technology or ()),
+        cursor=cursor,
+        limit=limit
+    )
+
+    try:
+        return await project_service.get_all_projects(filters)
+
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+@router.get("/export", response_model=None)
+async def export_projects(
     project_service: FromDishka[ProjectService]
 ):
-    return await project_service.get_all_projects()
+    return ndjson_response(project_service.export_projects())
 
-@router.get("/{project_id}", response_model=Optional[ProjectDTO])
-async def get_project_by_id(
-    project_id: uuid.UUID,
-    project_service: FromDishka[ProjectService]
+# Static paths are declared before /{project_id}, which would otherwise capture them
+@router.get("/search", response_model=ProjectPageDTO)
+async def search_projects(
+    project_service: FromDishka[ProjectService],
+    q: str = Query(..., min_length=1, max_length=100),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
 ):
-    return await project_service.get_project_by_id(project_id)
+    try:
+        return await project_service.search_projects(ProjectSearchDTO(query=q, cursor=cursor, limit=limit))
 
-@router.get("/{project_name}", response_model=Optional[ProjectDTO])
-async def get_project_by_id(
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+@router.get("/by-name/{project_name}", response_model=Optional[ProjectDTO])
+async def get_project_by_name(
     project_name: str,
     project_service: FromDishka[ProjectService]
 ):
     return await project_service.get_project_by_name(project_name)
 
+@router.get("/{project_id}", response_model=Optional[ProjectDTO])
+async def get_project_by_id(
+    project_id: uuid.UUID,
+    response: Response,
+    project_service: FromDishka[ProjectService],
+    if_none_match: Optional[str] = Header(None)
+):
+    try:
+        project = await project_service.get_project_by_id(project_id, parse_if_none_match(if_none_match))
+
+    except NotModifiedException as e:
+        return not_modified(e.version)
+
+    set_etag(response, project.version)
+    return project
+
 @router.post("/", response_model=ProjectDTO, status_code=status.HTTP_201_CREATED)
 async def create_project(
     project_data: ProjectCreateDTO,
-    current_user: FromDishka[DomainUser],
+    current_user: FromDishka[AuthPrincipal],
     project_service: FromDishka[ProjectService],
 ):
-    new_project = await project_service.create_project(current_user, project_data)
+    try:
+        new_project = await project_service.create_project(current_user, project_data)
+
+    except AlreadyExistsException as e:
+        raise HTTPException(status_code=409, detail=e.message)
 
     return new_project
 
@@ -71,7 +133,7 @@ async def create_project(
 async def update_project(
     project_id: uuid.UUID,
     update_data: ProjectUpdateDTO,
-    current_user: FromDishka[DomainUser],
+    current_user: FromDishka[AuthPrincipal],
     project_service: FromDishka[ProjectService]
 ):
     return await project_service.update_project(current_user, project_id, update_data)
@@ -79,7 +141,7 @@ async def update_project(
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_project(
     project_id: uuid.UUID,
-    current_user: FromDishka[DomainUser],
+    current_user: FromDishka[AuthPrincipal],
     project_service: FromDishka[ProjectService]
 ):
     await project_service.delete_project(project_id, current_user)
@@ -93,7 +155,7 @@ async def delete_project(
 async def add_technologies(
     project_id: uuid.UUID,
     technologies: TechnologyEnum,
-    current_user: FromDishka[DomainUser],
+    current_user: FromDishka[AuthPrincipal],
     project_service: FromDishka[ProjectService]
 ):
     dto = AddTechnologyDTO(project_id=project_id, technology=technologies)
@@ -105,7 +167,7 @@ async def add_technologies(
 async def remove_technology(
         project_id: uuid.UUID,
         technology: TechnologyEnum,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
     dto = RemoveTechnologyDTO(project_id=project_id, technology=technology)
@@ -117,7 +179,7 @@ async def remove_technology(
 async def set_technologies(
         project_id: uuid.UUID,
         technologies: Set[TechnologyEnum],
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
 
@@ -134,7 +196,7 @@ async def set_technologies(
 async def add_participants_batch(
         project_id: uuid.UUID,
         dto: BatchAddParticipantsDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
     if dto.project_id != project_id:
@@ -149,7 +211,7 @@ async def add_participants_batch(
 async def remove_participants_batch(
         project_id: uuid.UUID,
         dto: BatchRemoveParticipantsDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
     if dto.project_id != project_id:
@@ -169,7 +231,7 @@ async def assign_role(
         project_id: uuid.UUID,
         user_id: uuid.UUID,
         dto: AssignProjectRoleDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
     if dto.user_id != user_id:
@@ -185,7 +247,7 @@ async def revoke_role(
         project_id: uuid.UUID,
         user_id: uuid.UUID,
         dto: RevokeProjectRoleDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
     if dto.user_id != user_id:
@@ -201,7 +263,7 @@ async def set_participant_roles(
         project_id: uuid.UUID,
         user_id: uuid.UUID,
         dto: SetProjectRolesDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         project_service: FromDishka[ProjectService]
 ):
     if dto.user_id != user_id:
@@ -1,70 +1,142 @@
+import os
 import uuid
+from typing import Dict
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from dishka import Provider, Scope, provide
 
+from domain.user.enum import StatusUserEnum
 from domain.user.model import User as DomainUser
 
+from application.auth.dto import AuthPrincipal
 from application.uow.interfaces import IUnitOfWork
-from application.auth.interfaces import ITokenService
+from application.auth.interfaces import ITokenService, IRevocationStore
 
 from presentation.dependencies import get_uow, get_token_service
 
 
+# Trust the principal claims of access tokens instead of loading the user on every request.
+# The claims are not compared with the stored token_version, so a password change or a forced
+# logout only ends the access tokens issued before it when they expire, after at most
+# ACCESS_TOKEN_EXPIRE_MINUTES. Refreshing is refused right away, and logout revokes by jti
+STATELESS_AUTH = os.getenv("STATELESS_AUTH", "false").lower() == "true"
+
+# Tokens issued before the ver claim was added are accepted until this is switched on,
+# turn it on once ACCESS_TOKEN_EXPIRE_MINUTES and REFRESH_TOKEN_EXPIRE_DAYS have passed since the rollout
+REQUIRE_TOKEN_VERSION = os.getenv("REQUIRE_TOKEN_VERSION", "false").lower() == "true"
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
-class AuthUserProvider(Provider):
-    @provide(scope=Scope.REQUEST)
-    def get_oauth2_scheme(self):
-        return oauth2_scheme
+credentials_exception = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
 
-    @provide(scope=Scope.REQUEST)
-    async def get_current_user(
-        self,
-        token: str = Depends(oauth2_scheme),
-        uow: IUnitOfWork = Depends(get_uow),
-        token_service: ITokenService = Depends(get_token_service),
-    ) -> DomainUser:
 
-        # Preparing exception in case handling error
-        credentials_exception = HTTPException(
+async def _decode_access_token(request: Request, token_service: ITokenService,
+                               revocation_store: IRevocationStore) -> Dict:
+    token = await oauth2_scheme(request)
+
+    try:
+        payload = token_service.decode_token(token)
+
+    except (JWTError, ValueError):
+        raise credentials_exception
+
+    if payload.get("sub") is None:
+        raise credentials_exception
+
+    # Check type of token, if it's not a access, we will block access to endpoint
+    if payload.get("type") != "access":
+        raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
+            detail="Invalid token type. Access token required.",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-        try:
-            payload = token_service.decode_token(token)
+    # Tokens issued before jti was added cannot be revoked individually
+    jti = payload.get("jti")
+    if jti is not None and await revocation_store.is_revoked(jti):
+        raise credentials_exception
+
+    return payload
 
-            user_id_str: str = payload.get("sub")
-            token_type: str = payload.get("type")
 
-            if user_id_str is None:
-                raise credentials_exception
+def _check_not_banned(status_user: StatusUserEnum) -> None:
+    if status_user == StatusUserEnum.BANNED:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="User is banned")
+
 
-            # Check type of token, if it's not a access, we will block access to endpoint
-            if token_type != "access":
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid token type. Access token required.",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
+async def _load_user(payload: Dict, uow: IUnitOfWork) -> DomainUser:
+    try:
+        user_id = uuid.UUID(payload["sub"])
+    except (TypeError, ValueError):
+        raise credentials_exception
 
-            user_id = uuid.UUID(user_id_str)
+    async with uow:
+        # Retrieving user from database
+        user = await uow.users.get_by_id(user_id)
+
+    if user is None:
+        raise credentials_exception
 
-        except (JWTError, ValueError):
+    # Tokens issued before a password change or a forced logout carry an outdated version
+    if "ver" not in payload:
+        if REQUIRE_TOKEN_VERSION:
             raise credentials_exception
+    elif payload["ver"] != user.token_version:
+        raise credentials_exception
+
+    _check_not_banned(StatusUserEnum(user.status_user))
+
+    return user
 
-        async with uow:
-            # Retrieving user from database
-            user = await uow.users.get_by_id(user_id)
 
-            if user is None:
+class AuthUserProvider(Provider):
+    @provide(scope=Scope.REQUEST)
+    def get_oauth2_scheme(self):
+        return oauth2_scheme
+
+    @provide(scope=Scope.REQUEST)
+    async def get_current_principal(
+        self,
+        request: Request,
+        uow: IUnitOfWork,
+        token_service: ITokenService,
+        revocation_store: IRevocationStore,
+    ) -> AuthPrincipal:
+
+        payload = await _decode_access_token(request, token_service, revocation_store)
+
+        if STATELESS_AUTH:
+            try:
+                principal = AuthPrincipal.from_claims(payload)
+            except (TypeError, ValueError):
                 raise credentials_exception
 
-        return user
+            if principal is not None:
+                _check_not_banned(principal.status_user)
+                return principal
+
+        user = await _load_user(payload, uow)
+
+        return AuthPrincipal.from_user(user)
+
+    @provide(scope=Scope.REQUEST)
+    async def get_current_user(
+        self,
+        request: Request,
+        uow: IUnitOfWork,
+        token_service: ITokenService,
+        revocation_store: IRevocationStore,
+    ) -> DomainUser:
+
+        payload = await _decode_access_token(request, token_service, revocation_store)
+
+        return await _load_user(payload, uow)
 
 
 async def get_current_user(
@@ -0,0 +1,13 @@
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+def ndjson_response(items: AsyncIterator[BaseModel]) -> StreamingResponse:
+
+    async def serialize() -> AsyncIterator[str]:
+        async for item in items:
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(serialize(), media_type="application/x-ndjson")
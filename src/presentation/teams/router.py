@@ -1,12 +1,14 @@
 import uuid
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, status, HTTPException
+from fastapi import APIRouter, Header, Query, Response, status, HTTPException
 from dishka.integrations.fastapi import FromDishka, DishkaRoute
 
 from application.teams.dto import (
     #### Base CRUD ####
     TeamDTO,
+    TeamPageDTO,
+    TeamSearchDTO,
     TeamCreateDTO,
     TeamUpdateDTO,
 
@@ -21,8 +23,11 @@ from application.teams.dto import (
 )
 
 from application.teams.services import TeamService
+from application.shared.exceptions import AlreadyExistsException, NotModifiedException, ValidationException
+from presentation.etag import not_modified, parse_if_none_match, set_etag
+from presentation.streaming import ndjson_response
 
-from domain.user.model import User as DomainUser
+from application.auth.dto import AuthPrincipal
 
 
 router = APIRouter(prefix="/teams",
@@ -40,27 +45,60 @@ async def get_all_teams(
 ):
     return await team_service.get_all_teams()
 
-@router.get("/{project_id}", response_model=TeamDTO)
-async def get_team_by_id(
-    team_id: uuid.UUID,
+@router.get("/export", response_model=None)
+async def export_teams(
     team_service: FromDishka[TeamService],
 ):
-    return await team_service.get_team_by_id(team_id)
+    return ndjson_response(team_service.export_teams())
 
-@router.get("/{project_name}", response_model=TeamDTO)
+# Static paths are declared before /{team_id}, which would otherwise capture them
+@router.get("/search", response_model=TeamPageDTO)
+async def search_teams(
+    team_service: FromDishka[TeamService],
+    q: str = Query(..., min_length=1, max_length=100),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    try:
+        return await team_service.search_teams(TeamSearchDTO(query=q, cursor=cursor, limit=limit))
+
+    except ValidationException as e:
+        raise HTTPException(status_code=400, detail=e.message)
+
+@router.get("/by-name/{team_name}", response_model=TeamDTO)
 async def get_team_by_name(
     team_name: str,
     team_service: FromDishka[TeamService],
 ):
     return await team_service.get_team_by_name(team_name)
 
+@router.get("/{team_id}", response_model=TeamDTO)
+async def get_team_by_id(
+    team_id: uuid.UUID,
+    response: Response,
+    team_service: FromDishka[TeamService],
+    if_none_match: Optional[str] = Header(None)
+):
+    try:
+        team = await team_service.get_team_by_id(team_id, parse_if_none_match(if_none_match))
+
+    except NotModifiedException as e:
+        return not_modified(e.version)
+
+    set_etag(response, team.version)
+    return team
+
 @router.post("/", response_model=TeamDTO, status_code=status.HTTP_201_CREATED)
 async def create_team(
     team_data: TeamCreateDTO,
-    current_user: FromDishka[DomainUser],
+    current_user: FromDishka[AuthPrincipal],
     team_service: FromDishka[TeamService],
 ):
-    new_team = await team_service.create_team(current_user, team_data)
+    try:
+        new_team = await team_service.create_team(current_user, team_data)
+
+    except AlreadyExistsException as e:
+        raise HTTPException(status_code=409, detail=e.message)
 
     return new_team
 
@@ -68,7 +106,7 @@ async def create_team(
 async def update_team(
     team_id: uuid.UUID,
     update_data: TeamUpdateDTO,
-    current_user: FromDishka[DomainUser],
+    current_user: FromDishka[AuthPrincipal],
     team_service: FromDishka[TeamService]
 ):
     return await team_service.update_team(current_user, team_id, update_data)
@@ -76,7 +114,7 @@ async def update_team(
 @router.delete("/{team_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_team(
         team_id: uuid.UUID,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         team_service: FromDishka[TeamService]
 ):
     await team_service.delete_team(team_id, current_user)
@@ -90,7 +128,7 @@ async def delete_team(
 async def create_team_members(
         team_id: uuid.UUID,
         dto: BatchAddPMemberTeamDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         team_service: FromDishka[TeamService]
 ):
     if dto.team_id != team_id:
@@ -104,7 +142,7 @@ async def create_team_members(
 async def delete_team_members(
         team_id: uuid.UUID,
         dto: BatchRemoveMemberTeamDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         team_service: FromDishka[TeamService]
 ):
     if dto.team_id != team_id:
@@ -123,7 +161,7 @@ async def assign_role_to_team_member(
         team_id: uuid.UUID,
         user_id: uuid.UUID,
         dto: AssignRoleDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         team_service: FromDishka[TeamService]
 ):
     if dto.user_id != user_id:
@@ -139,7 +177,7 @@ async def revoke_role_to_team_member(
         team_id: uuid.UUID,
         user_id: uuid.UUID,
         dto: RevokeRoleDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         team_service: FromDishka[TeamService]
 ):
     if dto.user_id != user_id:
@@ -155,7 +193,7 @@ async def set_roles_to_team_member(
         team_id: uuid.UUID,
         user_id: uuid.UUID,
         dto: SetRolesDTO,
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         team_service: FromDishka[TeamService]
 ):
     if dto.user_id != user_id:
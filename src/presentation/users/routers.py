@@ -2,17 +2,20 @@ import os
 from typing import List, Optional
 import uuid
 
-from fastapi import APIRouter, status, HTTPException
+from fastapi import APIRouter, Header, Response, status, HTTPException
 from dishka.integrations.fastapi import FromDishka, DishkaRoute
 
 from application.users.dto import (
-    UserDTO,
+    UserResponseDTO,
     UserUpdateDTO
 )
 
 from application.users.services import UserService
+from application.shared.exceptions import NotModifiedException
+from presentation.etag import not_modified, parse_if_none_match, set_etag
+from presentation.streaming import ndjson_response
 
-from domain.user.model import User as DomainUser
+from application.auth.dto import AuthPrincipal
 
 
 router = APIRouter(prefix="/users",
@@ -24,24 +27,39 @@ router = APIRouter(prefix="/users",
 # CRUD OPERATIONS
 # =========================================================================
 
-@router.get("/", response_model=List[UserDTO])
+@router.get("/", response_model=List[UserResponseDTO])
 async def get_all_users(
         user_service: FromDishka[UserService]
 ):
     return await user_service.get_all_users()
 
-@router.get("/{user_id}", response_model=Optional[UserDTO])
+@router.get("/export", response_model=None)
+async def export_users(
+        user_service: FromDishka[UserService]
+):
+    return ndjson_response(user_service.export_users())
+
+@router.get("/{user_id}", response_model=Optional[UserResponseDTO])
 async def get_all_users(
         user_id: uuid.UUID,
-        user_service: FromDishka[UserService]
+        response: Response,
+        user_service: FromDishka[UserService],
+        if_none_match: Optional[str] = Header(None)
 ):
-    return await user_service.get_user_by_id(user_id)
+    try:
+        user = await user_service.get_user_by_id(user_id, parse_if_none_match(if_none_match))
+
+    except NotModifiedException as e:
+        return not_modified(e.version)
+
+    set_etag(response, user.version)
+    return user
 
-@router.update("/{user_id}", response_model=UserDTO)
+@router.patch("/{user_id}", response_model=UserResponseDTO)
 async def update_user(
         user_id: uuid.UUID,
         user_service: FromDishka[UserService],
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
         dto: UserUpdateDTO
 ):
     if current_user.id != user_id:
@@ -53,7 +71,7 @@ async def update_user(
 async def delete_user(
         user_id: uuid.UUID,
         user_service: FromDishka[UserService],
-        current_user: FromDishka[DomainUser],
+        current_user: FromDishka[AuthPrincipal],
 ):
     await user_service.delete_user(user_id, current_user)
     return {"message": "User was deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,112 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+ROOT_DIR = os.path.realpath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'src'))
+
+# Tests that need Postgres run against TEST_DATABASE_URL, a throwaway database, and are skipped without it
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+# The application engine is created on import, it never connects during the tests
+os.environ.setdefault("DATABASE_URL", TEST_DATABASE_URL or "postgresql+asyncpg://localhost/teamup_test")
+
+
+class StatementRecorder:
+
+    def __init__(self, engine):
+        self._engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        self.statements.append(statement)
+
+    def __enter__(self) -> 'StatementRecorder':
+        from sqlalchemy import event
+
+        self.statements = []
+        event.listen(self._engine.sync_engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        from sqlalchemy import event
+
+        event.remove(self._engine.sync_engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+async def _create_schema(engine) -> None:
+    from sqlalchemy import text
+
+    from benchmarks.seed import resolve_lookups
+    from infrastructure.database.models import Base
+
+    async with engine.begin() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+        await resolve_lookups(connection)
+
+
+async def _drop_schema(engine) -> None:
+    from infrastructure.database.models import Base
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def engine():
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import NullPool
+
+    # Every test runs its own event loop, pooled connections would outlive it
+    engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
+    asyncio.run(_create_schema(engine))
+    yield engine
+    asyncio.run(_drop_schema(engine))
+
+
+@pytest.fixture
+def session_factory(engine):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from benchmarks.seed import truncate
+
+    async def clean() -> None:
+        async with engine.begin() as connection:
+            await truncate(connection)
+
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(clean())
+
+
+@pytest.fixture
+def make_uow(session_factory):
+    from infrastructure.database.queries.project_queries import ProjectQueries
+    from infrastructure.database.queries.team_queries import TeamQueries
+    from infrastructure.database.repositories.desired_project_repo import DesiredProjectRepository
+    from infrastructure.database.repositories.project_repo import ProjectRepository
+    from infrastructure.database.repositories.team_repo import TeamRepository
+    from infrastructure.database.repositories.user_repo import UserRepository
+    from infrastructure.database.uow.uow import UnitOfWork
+
+    def make(**kwargs) -> UnitOfWork:
+        return UnitOfWork(session_factory, ProjectRepository, TeamRepository, UserRepository,
+                          DesiredProjectRepository, ProjectQueries, TeamQueries, **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def statements(engine) -> StatementRecorder:
+    return StatementRecorder(engine)
@@ -0,0 +1,69 @@
+import uuid
+from typing import Iterable, List
+
+from domain.project.enum import StatusProjectEnum
+from domain.project.model import Project as DomainProject
+from domain.shared.enum import TechnologyEnum
+from domain.team.enum import TeamRoleEnum
+from domain.team.model import Team as DomainTeam
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+from domain.user.model import User as DomainUser
+
+# A project needs at least one technology, tests that change the stack start from this one
+PROJECT_STACK = frozenset({TechnologyEnum.REACT})
+
+
+def _suffix() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+async def create_users(uow, count: int) -> List[DomainUser]:
+    users = []
+    async with uow:
+        for _ in range(count):
+            suffix = _suffix()
+            user = DomainUser(
+                id=uuid.uuid4(),
+                username=f"user_{suffix}",
+                email=f"user_{suffix}@example.com",
+                hashed_password="not-a-real-hash",
+                status_user=StatusUserEnum.ACTIVE,
+                platform_role=[PlatformRoleEnum.DEVELOPER_USER]
+            )
+            assert await uow.users.try_add(user)
+            users.append(user)
+    return users
+
+
+async def create_team(uow, owner: DomainUser, members: Iterable[DomainUser] = ()) -> DomainTeam:
+    async with uow:
+        team = DomainTeam(id=uuid.uuid4(), name=f"team {_suffix()}", owner_id=owner.id)
+        assert await uow.teams.try_add(team)
+
+    members = list(members)
+    if members:
+        async with uow:
+            team = await uow.teams.get_by_id(team.id)
+            for member in members:
+                team.add_member(member.id, {TeamRoleEnum.BACKEND_DEVELOPER})
+            await uow.teams.update(team)
+
+    return team
+
+
+async def create_project(uow, team: DomainTeam, manager: DomainUser,
+                         technologies: Iterable[TechnologyEnum] = PROJECT_STACK) -> DomainProject:
+    async with uow:
+        project = DomainProject(
+            id=uuid.uuid4(),
+            name=f"project {_suffix()}",
+            status=StatusProjectEnum.ACTIVE,
+            team_id=team.id,
+            manager_id=manager.id,
+            url_project=None,
+            logo=None,
+            description="Created by the test suite",
+            initial_stack_technologies=set(technologies)
+        )
+        assert await uow.projects.try_add(project)
+    return project
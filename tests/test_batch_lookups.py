@@ -0,0 +1,62 @@
+import asyncio
+
+from application.auth.dto import AuthPrincipal
+from application.projects.dto import AddProjectParticipantDTO, BatchAddParticipantsDTO
+from application.projects.services import ProjectService
+from domain.project.enum import ProjectRoleEnum
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+
+from tests.factories import create_project, create_team, create_users
+
+SIZES = (1, 4, 10)
+
+
+def test_batch_lookups_issue_one_query_whatever_the_number_of_ids(make_uow, statements):
+    async def scenario():
+        users = await create_users(make_uow(), max(SIZES))
+
+        get_many, team_counts = {}, {}
+        for size in SIZES:
+            user_ids = [user.id for user in users[:size]]
+
+            uow = make_uow()
+            async with uow:
+                with statements:
+                    found = await uow.users.get_many(user_ids)
+                get_many[size] = statements.count
+                assert {user.id for user in found} == set(user_ids)
+
+                with statements:
+                    counts = await uow.teams.count_teams_for_members(user_ids)
+                team_counts[size] = statements.count
+                assert set(counts) == set(user_ids)
+
+        assert len(set(get_many.values())) == 1, f"get_many statements per batch size: {get_many}"
+        assert team_counts == {size: 1 for size in SIZES}, f"count statements per batch size: {team_counts}"
+
+    asyncio.run(scenario())
+
+
+def test_add_participants_batch_statement_count_does_not_grow_with_the_batch(make_uow, statements):
+    async def scenario():
+        manager, *members = await create_users(make_uow(), max(SIZES) + 1)
+        team = await create_team(make_uow(), manager, members=members)
+        current_user = AuthPrincipal(id=manager.id, status_user=StatusUserEnum.ACTIVE,
+                                     platform_role=[PlatformRoleEnum.DEVELOPER_USER])
+
+        per_size = {}
+        for size in SIZES:
+            project = await create_project(make_uow(), team, manager)
+            dto = BatchAddParticipantsDTO(
+                project_id=project.id,
+                participants=[AddProjectParticipantDTO(user_id=member.id, roles={ProjectRoleEnum.DEVELOPER})
+                              for member in members[:size]]
+            )
+
+            with statements:
+                await ProjectService(make_uow()).add_participants_batch(dto, current_user)
+            per_size[size] = statements.count
+
+        assert len(set(per_size.values())) == 1, f"statements per batch size: {per_size}"
+
+    asyncio.run(scenario())
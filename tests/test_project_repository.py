@@ -0,0 +1,54 @@
+import asyncio
+
+from domain.project.enum import ProjectRoleEnum
+from domain.shared.enum import TechnologyEnum
+
+from tests.factories import PROJECT_STACK, create_project, create_team, create_users
+
+SIZES = (1, 4, 10)
+
+
+def test_update_statement_count_does_not_grow_with_participants_and_technologies(make_uow, statements):
+    # The factory stack stays, so removing the added technologies never empties the project
+    technologies = [technology for technology in TechnologyEnum if technology not in PROJECT_STACK]
+
+    async def scenario():
+        manager, *members = await create_users(make_uow(), max(SIZES) + 1)
+        team = await create_team(make_uow(), manager, members=members)
+
+        added, removed = {}, {}
+        for size in SIZES:
+            project = await create_project(make_uow(), team, manager)
+            participants = members[:size]
+            stack = technologies[:min(size, len(technologies))]
+
+            uow = make_uow()
+            async with uow:
+                project = await uow.projects.get_by_id(project.id)
+                for member in participants:
+                    project.add_participant(member.id, {ProjectRoleEnum.DEVELOPER})
+                for technology in stack:
+                    project.add_technology(technology)
+                project.update(url_project=f"https://example.com/projects/{size}")
+
+                with statements:
+                    await uow.projects.update(project)
+                added[size] = statements.count
+
+            uow = make_uow()
+            async with uow:
+                project = await uow.projects.get_by_id(project.id)
+                assert project.url_project == f"https://example.com/projects/{size}"
+                for member in participants:
+                    project.remove_participant(member.id)
+                for technology in stack:
+                    project.remove_technology(technology)
+
+                with statements:
+                    await uow.projects.update(project)
+                removed[size] = statements.count
+
+        assert len(set(added.values())) == 1, f"statements per added batch size: {added}"
+        assert len(set(removed.values())) == 1, f"statements per removed batch size: {removed}"
+
+    asyncio.run(scenario())
@@ -0,0 +1,194 @@
+import asyncio
+
+import pytest
+
+from application.auth.dto import AuthPrincipal
+from application.projects.cache import CachedProjectService, ProjectCacheInvalidator
+from application.projects.dto import (AddProjectParticipantDTO, AddTechnologyDTO, AssignProjectRoleDTO,
+                                      BatchAddParticipantsDTO, BatchRemoveParticipantsDTO, RemoveTechnologyDTO,
+                                      SetProjectRolesDTO, SetTechnologiesDTO)
+from application.projects.services import ProjectService
+from application.shared.exceptions import NotModifiedException
+from application.users.services import UserService
+from domain.project.enum import ProjectRoleEnum
+from domain.shared.enum import TechnologyEnum
+from domain.team.enum import TeamRoleEnum
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+from infrastructure.cache.backends import MemoryCacheBackend
+from infrastructure.cache.response_cache import ResponseCache
+from infrastructure.cache.user_cache import UserCache
+from infrastructure.events.bus import EventBus
+
+from tests.factories import create_project, create_team, create_users
+
+
+def principal(user) -> AuthPrincipal:
+    return AuthPrincipal(id=user.id, status_user=StatusUserEnum.ACTIVE, platform_role=[PlatformRoleEnum.DEVELOPER_USER])
+
+
+async def project_version(uow, project_id) -> int:
+    async with uow.read_only():
+        return await uow.project_queries.get_version(project_id)
+
+
+async def team_version(uow, team_id) -> int:
+    async with uow.read_only():
+        return await uow.team_queries.get_version(team_id)
+
+
+def cached_project_service(make_uow) -> CachedProjectService:
+    cache = ResponseCache(MemoryCacheBackend())
+    bus = EventBus()
+    invalidator = ProjectCacheInvalidator(cache)
+    for event_type in invalidator.EVENTS:
+        bus.subscribe(event_type, invalidator)
+    return CachedProjectService(make_uow(event_publisher=bus), cache)
+
+
+@pytest.fixture
+def project_setup(make_uow):
+    async def setup():
+        manager, developer, designer = await create_users(make_uow(), 3)
+        team = await create_team(make_uow(), manager, members=[developer, designer])
+        project = await create_project(make_uow(), team, manager)
+        return manager, developer, designer, project
+
+    return asyncio.run(setup())
+
+
+def test_every_project_mutation_bumps_the_version(make_uow, project_setup):
+    manager, developer, designer, project = project_setup
+    service = ProjectService(make_uow())
+    current_user = principal(manager)
+
+    # project_participant holds a single role per participant, a revoke after a reload would always leave none
+    mutations = [
+        ("add participants", lambda: service.add_participants_batch(BatchAddParticipantsDTO(
+            project_id=project.id,
+            participants=[AddProjectParticipantDTO(user_id=developer.id, roles={ProjectRoleEnum.DEVELOPER}),
+                          AddProjectParticipantDTO(user_id=designer.id, roles={ProjectRoleEnum.DESIGNER})]
+        ), current_user)),
+        ("assign role", lambda: service.assign_role_to_participant(project.id, AssignProjectRoleDTO(
+            user_id=developer.id, role_to_assign=ProjectRoleEnum.QA
+        ), current_user)),
+        ("set roles", lambda: service.set_participant_roles(project.id, SetProjectRolesDTO(
+            user_id=designer.id, roles={ProjectRoleEnum.QA}
+        ), current_user)),
+        ("add technology", lambda: service.add_technology(AddTechnologyDTO(
+            project_id=project.id, technology=TechnologyEnum.PYTHON
+        ), current_user)),
+        ("set technologies", lambda: service.set_technologies(SetTechnologiesDTO(
+            project_id=project.id, technologies={TechnologyEnum.PYTHON, TechnologyEnum.DOCKER}
+        ), current_user)),
+        ("remove technology", lambda: service.remove_technology(RemoveTechnologyDTO(
+            project_id=project.id, technology=TechnologyEnum.DOCKER
+        ), current_user)),
+        ("remove participants", lambda: service.remove_participants_batch(BatchRemoveParticipantsDTO(
+            project_id=project.id, user_ids=[developer.id, designer.id]
+        ), current_user)),
+    ]
+
+    async def scenario():
+        version = await project_version(make_uow(), project.id)
+        for name, mutate in mutations:
+            await mutate()
+            new_version = await project_version(make_uow(), project.id)
+            assert new_version == version + 1, f"{name} moved the version from {version} to {new_version}"
+            version = new_version
+
+    asyncio.run(scenario())
+
+
+def test_every_team_member_change_bumps_the_version(make_uow):
+    async def scenario():
+        owner, member = await create_users(make_uow(), 2)
+        team = await create_team(make_uow(), owner)
+
+        changes = [
+            ("add member", lambda team: team.add_member(member.id, {TeamRoleEnum.BACKEND_DEVELOPER})),
+            ("set roles", lambda team: team.set_member_roles(member.id, {TeamRoleEnum.DESIGNER})),
+            ("remove member", lambda team: team.remove_member(member.id)),
+        ]
+
+        version = await team_version(make_uow(), team.id)
+        for name, change in changes:
+            uow = make_uow()
+            async with uow:
+                team = await uow.teams.get_by_id(team.id)
+                change(team)
+                await uow.teams.update(team)
+
+            new_version = await team_version(make_uow(), team.id)
+            assert new_version == version + 1, f"{name} moved the version from {version} to {new_version}"
+            version = new_version
+
+    asyncio.run(scenario())
+
+
+def test_conditional_get_answers_304_until_the_project_changes(make_uow, project_setup):
+    manager, developer, _, project = project_setup
+    service = cached_project_service(make_uow)
+
+    async def scenario():
+        current = await service.get_project_by_id(project.id)
+
+        with pytest.raises(NotModifiedException) as not_modified:
+            await service.get_project_by_id(project.id, {current.version})
+        assert not_modified.value.version == current.version
+
+        await service.add_participants_batch(BatchAddParticipantsDTO(
+            project_id=project.id,
+            participants=[AddProjectParticipantDTO(user_id=developer.id, roles={ProjectRoleEnum.DEVELOPER})]
+        ), principal(manager))
+
+        # The cached representation was invalidated by the commit, the old ETag no longer matches
+        changed = await service.get_project_by_id(project.id, {current.version})
+        assert changed.version == current.version + 1
+
+        await service.remove_participants_batch(BatchRemoveParticipantsDTO(
+            project_id=project.id, user_ids=[developer.id]
+        ), principal(manager))
+
+        removed = await service.get_project_by_id(project.id, {changed.version})
+        assert removed.version == changed.version + 1
+
+    asyncio.run(scenario())
+
+
+def test_conditional_get_on_a_cache_miss_only_reads_the_version(make_uow, project_setup, statements):
+    _, _, _, project = project_setup
+    service = cached_project_service(make_uow)
+
+    async def scenario():
+        version = await project_version(make_uow(), project.id)
+
+        with statements:
+            with pytest.raises(NotModifiedException):
+                await service.get_project_by_id(project.id, {version})
+
+        assert statements.count == 1, statements.statements
+
+    asyncio.run(scenario())
+
+
+def test_user_version_is_not_answered_from_a_stale_cache(make_uow):
+    async def scenario():
+        user, = await create_users(make_uow(), 1)
+        # Two workers, each with its own process wide user cache
+        worker_cache, other_worker_cache = UserCache(), UserCache()
+        service = UserService(make_uow(user_cache=worker_cache))
+
+        cached = await service.get_user_by_id(user.id)
+
+        uow = make_uow(user_cache=other_worker_cache)
+        async with uow:
+            stored = await uow.users.get_by_id(user.id)
+            stored.username = f"{stored.username}_renamed"
+            updated = await uow.users.update(stored)
+            assert updated.version == cached.version + 1
+
+        # The other worker's commit never reached this worker's cache, the version is read from the database
+        user_dto = await service.get_user_by_id(user.id, {cached.version})
+        assert user_dto.version == cached.version + 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+import asyncio
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from application.shared.exceptions import NotModifiedException
+from infrastructure.cache.backends import MemoryCacheBackend
+from infrastructure.cache.response_cache import ResponseCache
+
+
+class Resource(BaseModel):
+    version: int
+
+
+class RecordingBackend(MemoryCacheBackend):
+
+    def __init__(self):
+        super().__init__()
+        self.expiries: List[Optional[int]] = []
+
+    async def set(self, key: str, value: bytes, ex: Optional[int] = None) -> None:
+        self.expiries.append(ex)
+        await super().set(key, value, ex)
+
+
+def test_conditional_and_plain_loads_do_not_share_an_outcome():
+    cache = ResponseCache(MemoryCacheBackend())
+    release = asyncio.Event()
+
+    async def conditional_load() -> Resource:
+        await release.wait()
+        raise NotModifiedException(1)
+
+    async def plain_load() -> Resource:
+        await release.wait()
+        return Resource(version=1)
+
+    async def scenario():
+        conditional = asyncio.create_task(cache.get_or_load("resource", ["resources"], Resource,
+                                                            conditional_load, variant="1"))
+        plain = asyncio.create_task(cache.get_or_load("resource", ["resources"], Resource, plain_load))
+        await asyncio.sleep(0)
+        release.set()
+
+        conditional_result, plain_result = await asyncio.gather(conditional, plain, return_exceptions=True)
+        assert isinstance(conditional_result, NotModifiedException)
+        assert plain_result == Resource(version=1)
+
+        # The stored entry is shared, a later conditional load is answered from it
+        assert await cache.get_or_load("resource", ["resources"], Resource, conditional_load,
+                                       variant="1") == Resource(version=1)
+
+    asyncio.run(scenario())
+
+
+def test_sub_second_ttl_is_stored_with_a_valid_expiry():
+    backend = RecordingBackend()
+    cache = ResponseCache(backend, ttl=0.5)
+
+    async def load() -> Resource:
+        return Resource(version=1)
+
+    asyncio.run(cache.get_or_load("resource", ["resources"], Resource, load))
+    assert backend.expiries == [1]
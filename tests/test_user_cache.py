@@ -0,0 +1,187 @@
+import asyncio
+import copy
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from domain.user.enum import PlatformRoleEnum, StatusUserEnum
+from domain.user.model import User as DomainUser
+from infrastructure.cache.user_cache import UserCache
+from infrastructure.database.repositories.cached_user_repo import CachedUserRepository
+
+TTL = 30
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Database:
+
+    def __init__(self):
+        self.users: Dict[uuid.UUID, DomainUser] = {}
+
+
+class InMemoryUserRepository:
+    # The subset of UserRepository the cached repository delegates to
+
+    def __init__(self, database: Database):
+        self._database = database
+        self.reads = 0
+        # Runs in the middle of a read, after the row was fetched
+        self.during_read: Optional[Callable[[], None]] = None
+
+    async def get_by_id(self, user_id: uuid.UUID) -> Optional[DomainUser]:
+        self.reads += 1
+        user = copy.deepcopy(self._database.users.get(user_id))
+        if self.during_read is not None:
+            self.during_read()
+        return user
+
+    async def get_version(self, user_id: uuid.UUID) -> Optional[int]:
+        user = self._database.users.get(user_id)
+        return user.version if user is not None else None
+
+    async def update(self, user: DomainUser) -> DomainUser:
+        user = copy.deepcopy(user)
+        user.version = self._database.users[user.id].version + 1
+        self._database.users[user.id] = user
+        return user
+
+
+class FakeUnitOfWork:
+
+    def __init__(self):
+        self._callbacks: List[Callable[[], None]] = []
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+
+    def commit(self) -> None:
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+class Worker:
+
+    def __init__(self, database: Database, clock: Clock):
+        self.cache = UserCache(max_size=100, ttl=TTL, clock=clock)
+        self.database = database
+
+    def repository(self) -> CachedUserRepository:
+        # A new unit of work per request, the cache is shared by the whole worker
+        self.uow = FakeUnitOfWork()
+        self.source = InMemoryUserRepository(self.database)
+        return CachedUserRepository(self.source, self.cache, self.uow)
+
+
+def make_user(database: Database) -> DomainUser:
+    user = DomainUser(id=uuid.uuid4(), username="cached_user", email="cached@example.com",
+                      hashed_password="not-a-real-hash", status_user=StatusUserEnum.ACTIVE,
+                      platform_role=[PlatformRoleEnum.DEVELOPER_USER])
+    database.users[user.id] = user
+    return user
+
+
+async def rename(worker: Worker, user_id: uuid.UUID, username: str) -> None:
+    users = worker.repository()
+    user = await users.get_by_id(user_id)
+    user.username = username
+    await users.update(user)
+    worker.uow.commit()
+
+
+def test_committed_update_is_never_served_stale():
+    database, clock = Database(), Clock()
+    worker = Worker(database, clock)
+    user = make_user(database)
+
+    async def scenario():
+        assert (await worker.repository().get_by_id(user.id)).username == "cached_user"
+
+        await rename(worker, user.id, "renamed_user")
+
+        users = worker.repository()
+        assert (await users.get_by_id(user.id)).username == "renamed_user"
+        assert worker.source.reads == 1
+
+    asyncio.run(scenario())
+
+
+def test_unit_of_work_reads_its_own_uncommitted_update():
+    database, clock = Database(), Clock()
+    worker = Worker(database, clock)
+    user = make_user(database)
+
+    async def scenario():
+        users = worker.repository()
+        cached = await users.get_by_id(user.id)
+        cached.username = "renamed_user"
+        await users.update(cached)
+
+        assert (await users.get_by_id(user.id)).username == "renamed_user"
+
+    asyncio.run(scenario())
+
+
+def test_read_racing_a_commit_does_not_cache_the_old_row():
+    database, clock = Database(), Clock()
+    worker = Worker(database, clock)
+    user = make_user(database)
+
+    def commit_elsewhere_in_this_worker() -> None:
+        renamed = copy.deepcopy(database.users[user.id])
+        renamed.username = "renamed_user"
+        renamed.version += 1
+        database.users[user.id] = renamed
+        worker.cache.invalidate([user.id])
+
+    async def scenario():
+        users = worker.repository()
+        worker.source.during_read = commit_elsewhere_in_this_worker
+
+        # The read fetched the row before the commit, it is returned but must not be cached
+        assert (await users.get_by_id(user.id)).username == "cached_user"
+        assert (await worker.repository().get_by_id(user.id)).username == "renamed_user"
+
+    asyncio.run(scenario())
+
+
+def test_other_workers_are_stale_for_at_most_the_ttl():
+    database, clock = Database(), Clock()
+    worker, other_worker = Worker(database, clock), Worker(database, clock)
+    user = make_user(database)
+
+    async def scenario():
+        await other_worker.repository().get_by_id(user.id)
+        await rename(worker, user.id, "renamed_user")
+
+        # The documented bound, the commit evicted the user from its own worker only
+        clock.now += TTL - 1
+        assert (await other_worker.repository().get_by_id(user.id)).username == "cached_user"
+
+        clock.now += 1
+        assert (await other_worker.repository().get_by_id(user.id)).username == "renamed_user"
+
+    asyncio.run(scenario())
+
+
+def test_version_check_evicts_a_copy_older_than_the_database():
+    database, clock = Database(), Clock()
+    worker, other_worker = Worker(database, clock), Worker(database, clock)
+    user = make_user(database)
+
+    async def scenario():
+        cached = await other_worker.repository().get_by_id(user.id)
+        await rename(worker, user.id, "renamed_user")
+
+        users = other_worker.repository()
+        assert await users.get_version(user.id) == cached.version + 1
+        assert (await users.get_by_id(user.id)).username == "renamed_user"
+
+    asyncio.run(scenario())